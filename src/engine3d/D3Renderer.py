@@ -0,0 +1,194 @@
+import pygame
+import math
+from typing import List, Tuple, Optional
+from . import config
+from .transformations import *
+from .primitives import *
+from .UI import *
+from .camera import *
+from .rasterizer import downsample, rasterize_lines
+
+
+WIDTH = 0
+HEIGHT = 0
+
+
+class PolygonProjection:
+    def __init__(self, points: List[Tuple[float, float]] = []):
+        self.vertices = points.copy()
+        self.color = config.BLUE
+
+    def add_vertex(self, point: Tuple[float, float]):
+        self.vertices.append(point)
+
+    def draw(self, screen, scale: int = 1, offset: Tuple[int, int] = (0, 0)):
+        """Рисует полигон; scale и offset - для отрисовки в увеличенный фрагмент экрана."""
+        if len(self.vertices) < 3:
+            return
+
+        fill_color = (max(0, self.color[0]-100), max(0, self.color[1]-100), max(0, self.color[2]-100))
+        int_vertices = [(int((v[0] + camera.x - offset[0]) * scale), int((v[1] + camera.y - offset[1]) * scale))
+                        for v in self.vertices]
+
+        pygame.draw.polygon(screen, fill_color, int_vertices)
+        pygame.draw.polygon(screen, self.color, int_vertices, config.LINE_WIDTH * scale)
+
+
+def projection_matrix(method: str) -> np.ndarray:
+    if method == "Аксонометрическая":
+        a = np.radians(config.ANGLE)
+        return np.array([
+            [1, 0, 0.5 * np.cos(a), 0],
+            [0, 1, 0.5 * np.cos(a), 0],
+            [0, 0, 0, 0],
+            [0, 0, 0, 1]
+        ])
+    else:  # Перспективная
+        c = config.V_POINT
+        return np.array([
+            [1, 0, 0, 0],
+            [0, 1, 0, 0],
+            [0, 0, 0, 0],
+            [0, 0, -1 / c,  1]
+        ])
+
+
+def render_point(vertex: Point, method: str, window: WindowInfo):
+    vertex_h = np.array([vertex.x, vertex.y, vertex.z + camera.z, 1])
+    matrix = projection_matrix(method)
+
+    projected_vertex = np.dot(matrix, vertex_h)
+
+    if projected_vertex[3] > 1e-6:
+        x_normalized = projected_vertex[0] / projected_vertex[3]
+        y_normalized = projected_vertex[1] / projected_vertex[3]
+        return (x_normalized, y_normalized)
+
+    return None
+
+
+def render_points(coords: np.ndarray, method: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    render_point для массива точек (N, 3) сразу.
+    Возвращает экранные координаты (N, 2) с учётом смещения камеры и маску точек перед камерой.
+    """
+    h = np.hstack([coords, np.ones((len(coords), 1))])
+    h[:, 2] += camera.z
+    projected = h @ projection_matrix(method).T
+    w = projected[:, 3]
+    valid = w > 1e-6
+    xy = projected[:, :2] / np.where(valid, w, 1.0)[:, None] + [camera.x, camera.y]
+    return xy, valid
+
+
+def render_polygon(poly: Polygon, method: str, window: WindowInfo):
+    pp = PolygonProjection()
+    for v in poly.vertices:
+        p = render_point(v, method, window)
+        if p is None:
+             return None
+        pp.add_vertex(p)
+    return pp
+
+
+def render_object(obj: Object, method:str, window: WindowInfo):
+    projected_obj = []
+
+    if not obj.polygons:
+        return projected_obj
+
+    obj_center = obj.get_center()
+
+    def get_avg_z(p):
+        return sum(v.z for v in p.vertices) / len(p.vertices)
+
+    sorted_polygons = sorted(obj.polygons, key=get_avg_z, reverse=False)
+
+    for p in sorted_polygons:
+        p.calculate_normal(obj_center)
+        if p.normal is None:
+            continue
+
+        view_vector: Point
+        poly_center = p.get_center()
+
+        if method == "Перспективная":
+            cam_poly_center_z = poly_center.z + camera.z
+            view_vector = Point(-poly_center.x, -poly_center.y, config.V_POINT - cam_poly_center_z)
+        else:
+            view_vector = Point(0, 0, 1)
+
+        # print(p.normal)
+
+        dot_product = (p.normal.x * view_vector.x +
+                       p.normal.y * view_vector.y +
+                       p.normal.z * view_vector.z)
+
+        if dot_product > 0:
+            rendered_poly = render_polygon(p, method, window)
+            if rendered_poly:
+                projected_obj.append(rendered_poly)
+
+    return projected_obj
+
+def draw_projected(screen, projected: List[PolygonProjection], samples: int = 1):
+    """
+    Рисует спроецированные полигоны. При samples > 1 - со сглаживанием (SSAA):
+    область, занятая полигонами, рисуется в samples раз крупнее поверх увеличенного
+    фона и сводится обратно усреднением блоков samples x samples.
+    """
+    if samples <= 1 or not projected:
+        for rp in projected:
+            rp.draw(screen)
+        return
+
+    points = np.array([v for rp in projected for v in rp.vertices], dtype=float) + [camera.x, camera.y]
+    margin = config.LINE_WIDTH + 1
+    x0, y0 = np.floor(points.min(axis=0)).astype(int) - margin
+    x1, y1 = np.ceil(points.max(axis=0)).astype(int) + margin
+    region = pygame.Rect(x0, y0, x1 - x0, y1 - y0).clip(screen.get_rect())
+    if region.width == 0 or region.height == 0:
+        return
+
+    big = pygame.transform.scale(screen.subsurface(region), (region.width * samples, region.height * samples))
+    for rp in projected:
+        rp.draw(big, samples, (region.x, region.y))
+    pygame.surfarray.blit_array(screen.subsurface(region), downsample(pygame.surfarray.array3d(big), samples))
+
+
+def draw_wireframe(screen, obj: Object, method: str, color=config.BLUE):
+    """
+    Каркас объекта: каждое ребро рисуется один раз (список рёбер строится один раз
+    на объект), концы проецируются одним массивом, линии растеризуются DDA прямо
+    в пиксели поверхности.
+    """
+    edges = obj.edges()
+    if len(edges) == 0:
+        return
+    xy, valid = render_points(obj.vertex_array(), method)
+    edges = edges[valid[edges[:, 0]] & valid[edges[:, 1]]]
+    width, height = screen.get_size()
+    x, y = rasterize_lines(width, height, xy[edges[:, 0]], xy[edges[:, 1]])
+    pixels = pygame.surfarray.pixels3d(screen)
+    pixels[x, y] = color
+    del pixels
+
+
+def perspective_camera_matrices(width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Матрицы вида и проекции для z_buffer_renderer, дающие ту же картинку, что и
+    "Перспективная" проекция render_point: центр проекции в точке z = V_POINT - camera.z,
+    начало координат сцены на экране в (camera.x, camera.y), ось Y направлена вниз.
+    """
+    c = config.V_POINT
+    eye_z = c - camera.z
+    # Ось Z камеры смотрит на наблюдателя, Y - вверх по экрану
+    view = np.diag([1.0, -1.0, 1.0, 1.0])
+    view[2, 3] = -eye_z
+    near = 1.0
+    far = max(10 * abs(eye_z), 10 * near)
+    projection = perspective_matrix(2 * np.arctan(height / (2 * c)), width / height, near, far)
+    # Смещение главной точки из центра экрана в (camera.x, camera.y)
+    projection[0, 2] = -(2 * camera.x / width - 1)
+    projection[1, 2] = 2 * camera.y / height - 1
+    return view, projection
@@ -1,5 +1,5 @@
 import pygame
-from primitives import *
+from .primitives import *
 
 
 class WindowInfo:
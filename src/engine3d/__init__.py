@@ -0,0 +1,58 @@
+"""
+Общий пакет 3D-рендера для лабораторных (lab6, lab7, lab8).
+
+Лабораторные - тонкие оболочки над пакетом: UI и сценарии в своих main.py,
+вся геометрия, преобразования, ввод-вывод и рендереры - здесь.
+
+Модули:
+    primitives, mesh, tessellation - объекты из полигонов, индексированные сетки, тесселяция
+    transformations               - матрицы преобразований и камеры
+    object_IO                     - загрузка и сохранение .obj и бинарных сеток
+    D3Renderer                    - проекции (аксонометрия, перспектива), полигоны и каркас
+    z_buffer_renderer, rasterizer - Z-буфер, тени, сглаживание, прогрессивный рендер
+    raytracer, bvh                - трассировка лучей
+    render_thread                 - рендер в фоновом потоке для UI
+    animation                     - анимация и экспорт кадров
+    camera, UI, config            - камера окна, виджеты pygame, настройки
+
+Демо-скрипты модулей запускаются из папки src: python -m engine3d.raytracer
+Имена ниже импортируются лениво (при первом обращении), поэтому import engine3d
+и запуск отдельного модуля не тянут pygame и все рендеры.
+"""
+import importlib
+
+_EXPORTS = {
+    'primitives': ('Point', 'Polygon', 'Object'),
+    'mesh': ('Mesh', 'clean_mesh'),
+    'transformations': (
+        'compose', 'transform_points', 'translation_matrix', 'scale_matrix',
+        'rotation_x_matrix', 'rotation_y_matrix', 'rotation_z_matrix',
+        'look_at_matrix', 'perspective_matrix', 'orthographic_matrix',
+        'scale_relative_to_center', 'rotate_around_center', 'rotate_around_line',
+    ),
+    'object_IO': ('load_mesh', 'load_obj', 'save_obj', 'save_mesh_binary', 'open_mesh_binary'),
+    'D3Renderer': ('render_object', 'draw_projected', 'draw_wireframe', 'perspective_camera_matrices'),
+    'z_buffer_renderer': ('render_mesh', 'render_mesh_progressive', 'ShadowMap'),
+    'raytracer': ('RayCamera', 'RayTracer', 'render'),
+    'render_thread': ('RenderThread', 'SceneSnapshot'),
+}
+_ALIASES = {'raytrace': ('raytracer', 'render')}
+_LOCATION = {name: (module, name) for module, names in _EXPORTS.items() for name in names if name != 'render'}
+_LOCATION.update(_ALIASES)
+
+__all__ = sorted(_LOCATION)
+
+
+def __getattr__(name):
+    if name not in _LOCATION:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attr = _LOCATION[name]
+    value = getattr(importlib.import_module(f'.{module}', __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
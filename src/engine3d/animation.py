@@ -0,0 +1,445 @@
+import numpy as np
+import os
+import shutil
+import struct
+import subprocess
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+from .mesh import Mesh
+from .transformations import look_at_matrix, perspective_matrix, transform_points
+from .z_buffer_renderer import render_mesh
+from .primitives import Point
+from . import config
+
+
+# ===== Кватернионы (w, x, y, z) =====
+
+def quaternion_from_axis_angle(axis, angle: float) -> np.ndarray:
+    axis = np.asarray(axis, dtype=float)
+    axis = axis / np.linalg.norm(axis)
+    return np.concatenate([[np.cos(angle / 2)], axis * np.sin(angle / 2)])
+
+
+def quaternion_from_matrix(m) -> np.ndarray:
+    """Кватернион поворота по матрице 3x3 (или левому верхнему блоку 4x4)."""
+    m = np.asarray(m, dtype=float)[:3, :3]
+    trace = np.trace(m)
+    if trace > 0:
+        s = 2 * np.sqrt(trace + 1)
+        q = [s / 4, (m[2, 1] - m[1, 2]) / s, (m[0, 2] - m[2, 0]) / s, (m[1, 0] - m[0, 1]) / s]
+    else:
+        i = int(np.argmax(np.diag(m)))
+        j, k = (i + 1) % 3, (i + 2) % 3
+        s = 2 * np.sqrt(1 + m[i, i] - m[j, j] - m[k, k])
+        q = np.zeros(4)
+        q[0] = (m[k, j] - m[j, k]) / s
+        q[1 + i] = s / 4
+        q[1 + j] = (m[j, i] + m[i, j]) / s
+        q[1 + k] = (m[k, i] + m[i, k]) / s
+    q = np.asarray(q, dtype=float)
+    return q / np.linalg.norm(q)
+
+
+def quaternion_to_matrix(q) -> np.ndarray:
+    """Матрица поворота 3x3 по единичному кватерниону."""
+    w, x, y, z = q
+    return np.array([
+        [1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)],
+        [2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)],
+        [2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)]
+    ])
+
+
+def slerp(q0, q1, t: float) -> np.ndarray:
+    """Сферическая линейная интерполяция кватернионов по кратчайшей дуге."""
+    q0 = np.asarray(q0, dtype=float)
+    q1 = np.asarray(q1, dtype=float)
+    dot = np.dot(q0, q1)
+    if dot < 0:
+        q1, dot = -q1, -dot
+    if dot > 0.9995:
+        # Почти совпадающие повороты - обычная интерполяция с нормировкой
+        q = q0 + t * (q1 - q0)
+        return q / np.linalg.norm(q)
+    theta = np.arccos(dot)
+    return (np.sin((1 - t) * theta) * q0 + np.sin(t * theta) * q1) / np.sin(theta)
+
+
+# ===== Ключевые кадры =====
+
+class Keyframe:
+    """
+    Состояние объекта в момент time: перенос, поворот (кватернион w, x, y, z) и масштаб.
+    Преобразование: сначала масштаб, затем поворот, затем перенос.
+    """
+
+    def __init__(self, time: float, position=(0.0, 0.0, 0.0), rotation=(1.0, 0.0, 0.0, 0.0),
+                 scale=(1.0, 1.0, 1.0)):
+        self.time = float(time)
+        self.position = np.asarray(position, dtype=float)
+        self.rotation = np.asarray(rotation, dtype=float)
+        self.scale = np.broadcast_to(np.asarray(scale, dtype=float), (3,))
+
+
+def camera_keyframe(time: float, eye, target, up=(0.0, 1.0, 0.0)) -> Keyframe:
+    """Ключевой кадр камеры, расположенной в eye и смотрящей на target."""
+    view = look_at_matrix(Point(*eye), Point(*target), Point(*up))
+    # Положение камеры в мире - обратное к матрице вида
+    world = np.linalg.inv(view)
+    return Keyframe(time, world[:3, 3], quaternion_from_matrix(world))
+
+
+class Track:
+    """
+    Дорожка ключевых кадров. Перенос и масштаб интерполируются линейно,
+    поворот - через slerp. Вне диапазона времени держится крайний кадр.
+    """
+
+    def __init__(self, keyframes: Sequence[Keyframe]):
+        self.keyframes = sorted(keyframes, key=lambda k: k.time)
+        self.times = np.array([k.time for k in self.keyframes])
+
+    def sample(self, t: float) -> np.ndarray:
+        """Матрица преобразования 4x4 в момент t."""
+        keys = self.keyframes
+        if len(keys) == 0:
+            return np.identity(4)
+        i = int(np.clip(np.searchsorted(self.times, t, side='right') - 1, 0, max(len(keys) - 2, 0)))
+        k0 = keys[i]
+        k1 = keys[min(i + 1, len(keys) - 1)]
+        span = k1.time - k0.time
+        u = float(np.clip((t - k0.time) / span, 0.0, 1.0)) if span > 0 else 0.0
+
+        position = k0.position + u * (k1.position - k0.position)
+        scale = k0.scale + u * (k1.scale - k0.scale)
+        rotation = quaternion_to_matrix(slerp(k0.rotation, k1.rotation, u))
+
+        m = np.identity(4)
+        m[:3, :3] = rotation * scale[None, :]
+        m[:3, 3] = position
+        return m
+
+
+class Animation:
+    """
+    Анимация сетки: дорожка объекта и дорожка камеры.
+    Кадры рендерятся без окна, поэтому их можно считать в разных процессах.
+    """
+
+    def __init__(self, mesh: Mesh, camera_track: Track, object_track: Optional[Track] = None,
+                 frames: int = 100, fps: float = 24.0, width: int = 320, height: int = 240,
+                 fov: float = np.radians(45), near: float = 1.0, far: float = 10000.0,
+                 color=config.GRAY, background=config.BLACK, samples: int = 1):
+        self.mesh = mesh
+        self.camera_track = camera_track
+        self.object_track = object_track
+        self.frames = frames
+        self.fps = fps
+        self.width = width
+        self.height = height
+        self.near = near
+        self.color = color
+        self.background = background
+        # Сглаживание MSAA: выборок на пиксель по каждой оси
+        self.samples = samples
+        self.projection = perspective_matrix(fov, width / height, near, far)
+
+    def frame_time(self, index: int) -> float:
+        return index / self.fps
+
+    def render_frame(self, index: int) -> np.ndarray:
+        """Изображение кадра index, массив (H, W, 3) uint8."""
+        t = self.frame_time(index)
+        mesh = self.mesh
+        if self.object_track is not None:
+            mesh = Mesh(transform_points(self.object_track.sample(t), mesh.vertices), mesh.faces)
+        view = np.linalg.inv(self.camera_track.sample(t))
+        return render_mesh(mesh, view, self.projection, self.width, self.height,
+                           self.color, self.background, near=self.near, samples=self.samples, msaa=True)
+
+
+def turntable(mesh: Mesh, frames: int = 600, fps: float = 24.0, width: int = 320, height: int = 240,
+              elevation: float = np.radians(20), up=(0.0, -1.0, 0.0)) -> Animation:
+    """
+    Полный оборот сетки вокруг вертикальной оси за frames кадров (последний кадр
+    не повторяет первый, поэтому анимация зацикливается без рывка).
+    up по умолчанию (0, -1, 0): object_IO переворачивает Y при загрузке.
+    """
+    vertices = np.asarray(mesh.vertices, dtype=float)
+    center = (vertices.min(axis=0) + vertices.max(axis=0)) / 2 if len(vertices) else np.zeros(3)
+    radius = max(np.linalg.norm(vertices - center, axis=1).max() if len(vertices) else 1.0, 1e-6)
+    fov = np.radians(45)
+    distance = 1.2 * radius / np.sin(fov / 2)
+
+    # Центрируем сетку, чтобы она вращалась вокруг своей середины
+    centered = Mesh(vertices - center, mesh.faces)
+    duration = frames / fps
+    up_axis = np.asarray(up, dtype=float)
+    spin = Track([Keyframe(duration * k / 3, rotation=quaternion_from_axis_angle(up_axis, 2 * np.pi * k / 3))
+                  for k in range(4)])
+
+    side = np.cross(up_axis, [0.0, 0.0, 1.0])
+    if np.linalg.norm(side) < 1e-9:
+        side = np.array([1.0, 0.0, 0.0])
+    forward = np.cross(side, up_axis)
+    forward /= np.linalg.norm(forward)
+    eye = distance * (np.cos(elevation) * forward + np.sin(elevation) * up_axis)
+    camera = Track([camera_keyframe(0.0, eye, (0.0, 0.0, 0.0), up_axis)])
+
+    return Animation(centered, camera, spin, frames, fps, width, height, fov,
+                     near=0.05 * radius, far=distance + 2 * radius)
+
+
+# ===== Параллельный рендер =====
+
+# Анимация, переданная процессу-исполнителю один раз при запуске
+_worker_animation: Optional[Animation] = None
+
+
+def _init_worker(animation: Animation):
+    global _worker_animation
+    _worker_animation = animation
+
+
+def _render_job(encode: Optional[Callable], index: int):
+    image = _worker_animation.render_frame(index)
+    return image if encode is None else encode(index, image)
+
+
+def stream_frames(animation: Animation, encode: Optional[Callable] = None, workers: Optional[int] = None,
+                  window: Optional[int] = None) -> Iterator[Tuple[int, object]]:
+    """
+    Рендерит кадры в пуле процессов и выдаёт (номер, результат) строго по порядку.
+
+    В работе одновременно не больше window кадров, поэтому память не зависит от
+    длины анимации. encode(index, image) выполняется в процессе-исполнителе
+    (сжатие кадра, запись файла) и должна быть функцией уровня модуля.
+    """
+    workers = workers or os.cpu_count() or 1
+    window = window or 2 * workers
+    job = partial(_render_job, encode)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(animation,)) as executor:
+        pending = deque()
+        next_index = 0
+        while next_index < animation.frames or pending:
+            while next_index < animation.frames and len(pending) < window:
+                pending.append((next_index, executor.submit(job, next_index)))
+                next_index += 1
+            index, future = pending.popleft()
+            yield index, future.result()
+
+
+# ===== PNG =====
+
+def save_png(pattern: str, index: int, image: np.ndarray) -> str:
+    """Сохраняет кадр в PNG (вызывается в процессе-исполнителе)."""
+    import pygame
+    path = pattern.format(index)
+    pygame.image.save(pygame.surfarray.make_surface(image.swapaxes(0, 1)), path)
+    return path
+
+
+def export_png_sequence(animation: Animation, directory: str, pattern: str = 'frame_{:04d}.png',
+                        workers: Optional[int] = None, progress: Optional[Callable] = None) -> List[str]:
+    """Сохраняет анимацию последовательностью PNG-файлов."""
+    os.makedirs(directory, exist_ok=True)
+    encode = partial(save_png, os.path.join(directory, pattern))
+    paths = []
+    for index, path in stream_frames(animation, encode, workers):
+        paths.append(path)
+        if progress is not None:
+            progress(index + 1, animation.frames)
+    return paths
+
+
+# ===== GIF =====
+
+# Фиксированная палитра 6x7x6 (зелёному больше уровней - глаз к нему чувствительнее)
+GIF_LEVELS = (6, 7, 6)
+
+# Матрица Байера 4x4 для упорядоченного дизеринга, значения в (-0.5, 0.5)
+_BAYER = (np.array([[0, 8, 2, 10], [12, 4, 14, 6], [3, 11, 1, 9], [15, 7, 13, 5]]) + 0.5) / 16 - 0.5
+
+
+def gif_palette() -> bytes:
+    """Глобальная палитра GIF из 256 цветов (лишние - чёрные)."""
+    r, g, b = np.meshgrid(*[np.round(np.arange(n) * 255 / (n - 1)) for n in GIF_LEVELS], indexing='ij')
+    colors = np.stack([r, g, b], axis=-1).reshape(-1, 3).astype(np.uint8)
+    palette = np.zeros((256, 3), dtype=np.uint8)
+    palette[:len(colors)] = colors
+    return palette.tobytes()
+
+
+def quantize(image: np.ndarray) -> np.ndarray:
+    """Индексы палитры gif_palette() для изображения (H, W, 3) с упорядоченным дизерингом."""
+    h, w = image.shape[:2]
+    threshold = np.tile(_BAYER, (h // 4 + 1, w // 4 + 1))[:h, :w, None]
+    steps = np.array(GIF_LEVELS) - 1
+    levels = np.clip(np.floor(image / 255.0 * steps + 0.5 + threshold), 0, steps).astype(np.int64)
+    return (levels[..., 0] * GIF_LEVELS[1] * GIF_LEVELS[2] + levels[..., 1] * GIF_LEVELS[2]
+            + levels[..., 2]).astype(np.uint8)
+
+
+def lzw_encode(data: bytes, min_code_size: int = 8) -> bytes:
+    """Сжатие LZW в формате GIF (коды переменной длины до 12 бит, младшие биты первыми)."""
+    clear = 1 << min_code_size
+    end = clear + 1
+    out = bytearray()
+    buffer = 0
+    count = 0
+    code_size = min_code_size + 1
+    next_code = end + 1
+    table = {}
+
+    def emit(code):
+        nonlocal buffer, count
+        buffer |= code << count
+        count += code_size
+        while count >= 8:
+            out.append(buffer & 0xFF)
+            buffer >>= 8
+            count -= 8
+
+    emit(clear)
+    if len(data) == 0:
+        emit(end)
+    else:
+        prefix = data[0]
+        for byte in data[1:]:
+            key = (prefix << 8) | byte
+            code = table.get(key)
+            if code is not None:
+                prefix = code
+                continue
+            emit(prefix)
+            if next_code < 4096:
+                table[key] = next_code
+                next_code += 1
+                if next_code > (1 << code_size) and code_size < 12:
+                    code_size += 1
+            else:
+                # Таблица заполнена - начинаем словарь заново
+                emit(clear)
+                table.clear()
+                next_code = end + 1
+                code_size = min_code_size + 1
+            prefix = byte
+        emit(prefix)
+        emit(end)
+    if count > 0:
+        out.append(buffer & 0xFF)
+    return bytes(out)
+
+
+def _sub_blocks(data: bytes) -> bytes:
+    """Разбивает данные на блоки GIF по 255 байт с завершающим нулевым блоком."""
+    parts = []
+    for i in range(0, len(data), 255):
+        chunk = data[i:i + 255]
+        parts.append(bytes([len(chunk)]) + chunk)
+    parts.append(b'\x00')
+    return b''.join(parts)
+
+
+def encode_gif_frame(delay: int, index: int, image: np.ndarray) -> bytes:
+    """Кадр GIF (управляющее расширение + изображение), вызывается в процессе-исполнителе."""
+    h, w = image.shape[:2]
+    control = b'\x21\xF9\x04\x04' + struct.pack('<H', delay) + b'\x00\x00'
+    descriptor = b'\x2C' + struct.pack('<HHHHB', 0, 0, w, h, 0)
+    return control + descriptor + b'\x08' + _sub_blocks(lzw_encode(quantize(image).tobytes()))
+
+
+class GifWriter:
+    """Потоковая запись GIF: кадры дописываются в файл по мере готовности."""
+
+    def __init__(self, filename: str, width: int, height: int, loop: int = 0):
+        self.file = open(filename, 'wb')
+        self.file.write(b'GIF89a' + struct.pack('<HHBBB', width, height, 0xF7, 0, 0))
+        self.file.write(gif_palette())
+        # Расширение NETSCAPE2.0 - количество повторов (0 - бесконечно)
+        self.file.write(b'\x21\xFF\x0BNETSCAPE2.0\x03\x01' + struct.pack('<H', loop) + b'\x00')
+
+    def write_frame(self, frame: bytes):
+        self.file.write(frame)
+
+    def close(self):
+        if not self.file.closed:
+            self.file.write(b'\x3B')
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def export_gif(animation: Animation, filename: str, workers: Optional[int] = None,
+               progress: Optional[Callable] = None):
+    """Сохраняет анимацию в GIF; квантование и сжатие кадров идут в пуле процессов."""
+    delay = max(int(round(100 / animation.fps)), 1)
+    with GifWriter(filename, animation.width, animation.height) as writer:
+        for index, frame in stream_frames(animation, partial(encode_gif_frame, delay), workers):
+            writer.write_frame(frame)
+            if progress is not None:
+                progress(index + 1, animation.frames)
+
+
+# ===== Видео =====
+
+def export_video(animation: Animation, filename: str, workers: Optional[int] = None,
+                 progress: Optional[Callable] = None) -> bool:
+    """Сохраняет анимацию в видео через ffmpeg (кадры передаются в stdin по одному)."""
+    ffmpeg = shutil.which('ffmpeg')
+    if ffmpeg is None:
+        print("Ошибка: для экспорта видео нужен ffmpeg")
+        return False
+    command = [ffmpeg, '-y', '-loglevel', 'error', '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+               '-s', f'{animation.width}x{animation.height}', '-r', str(animation.fps), '-i', '-',
+               '-pix_fmt', 'yuv420p', filename]
+    process = subprocess.Popen(command, stdin=subprocess.PIPE)
+    try:
+        for index, image in stream_frames(animation, None, workers):
+            process.stdin.write(np.ascontiguousarray(image).tobytes())
+            if progress is not None:
+                progress(index + 1, animation.frames)
+    finally:
+        process.stdin.close()
+        process.wait()
+    return process.returncode == 0
+
+
+if __name__ == '__main__':
+    import argparse
+    from .object_IO import load_mesh
+
+    parser = argparse.ArgumentParser(description='Рендер анимации вращения модели')
+    parser.add_argument('model', nargs='?', default=os.path.join(config.MODELS_DIR, 'pot.obj'))
+    parser.add_argument('output', nargs='?', default='turntable.gif',
+                        help='.gif, .mp4 (нужен ffmpeg) или папка для PNG')
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--fps', type=float, default=24.0)
+    parser.add_argument('--size', default='320x240')
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    width, height = map(int, args.size.split('x'))
+    animation = turntable(load_mesh(args.model), args.frames, args.fps, width, height)
+
+    def report(done, total):
+        print(f"\rКадр {done}/{total}", end='', flush=True)
+
+    start = time.perf_counter()
+    extension = os.path.splitext(args.output)[1].lower()
+    if extension == '.gif':
+        export_gif(animation, args.output, args.workers, report)
+    elif extension in ('.mp4', '.avi', '.mkv', '.webm'):
+        export_video(animation, args.output, args.workers, report)
+    else:
+        export_png_sequence(animation, args.output, workers=args.workers, progress=report)
+    elapsed = time.perf_counter() - start
+    print(f"\nГотово: {args.frames} кадров за {elapsed:.1f} с ({args.frames / elapsed:.1f} кадр/с)")
@@ -0,0 +1,191 @@
+import numpy as np
+from typing import Optional, Tuple
+
+# Количество треугольников в листе
+LEAF_SIZE = 4
+
+# Допуск для лучей, почти параллельных треугольнику
+EPSILON = 1e-12
+
+
+def _spread_bits(x: np.ndarray) -> np.ndarray:
+    """Раздвигает 10 младших бит числа так, чтобы между ними было по два нуля."""
+    x = x.astype(np.uint64) & np.uint64(0x3FF)
+    x = (x | (x << np.uint64(16))) & np.uint64(0x030000FF)
+    x = (x | (x << np.uint64(8))) & np.uint64(0x0300F00F)
+    x = (x | (x << np.uint64(4))) & np.uint64(0x030C30C3)
+    x = (x | (x << np.uint64(2))) & np.uint64(0x09249249)
+    return x
+
+
+def morton_codes(points: np.ndarray) -> np.ndarray:
+    """30-битные коды Мортона точек (N, 3) внутри их ограничивающего прямоугольника."""
+    lo = points.min(axis=0)
+    extent = np.maximum(points.max(axis=0) - lo, 1e-12)
+    q = np.clip((points - lo) / extent * 1023, 0, 1023).astype(np.uint64)
+    return (_spread_bits(q[:, 0]) << np.uint64(2)) | (_spread_bits(q[:, 1]) << np.uint64(1)) | _spread_bits(q[:, 2])
+
+
+class BVH:
+    """
+    Иерархия ограничивающих объёмов над треугольниками в плоских массивах.
+
+    Треугольники упорядочены по коду Мортона центров и разбиты на листы по
+    LEAF_SIZE подряд идущих. Над листами строится полное двоичное дерево в
+    "кучевой" раскладке: у узла i дети 2i+1 и 2i+2, листья - последние узлы.
+    Границы узлов считаются снизу вверх по уровням, без рекурсии.
+    """
+
+    def __init__(self, vertices: np.ndarray, triangles: np.ndarray):
+        vertices = np.asarray(vertices, dtype=np.float64)
+        triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+        corners = vertices[triangles]                                # (T, 3, 3)
+        count = len(triangles)
+
+        self.order = np.argsort(morton_codes(corners.mean(axis=1)), kind='stable') if count else \
+            np.zeros(0, dtype=np.int64)
+        corners = corners[self.order]
+        self.count = count
+        self.v0 = corners[:, 0]
+        self.e1 = corners[:, 1] - corners[:, 0]
+        self.e2 = corners[:, 2] - corners[:, 0]
+
+        leaf_count = max(-(-count // LEAF_SIZE), 1)
+        self.depth = int(np.ceil(np.log2(leaf_count))) if leaf_count > 1 else 0
+        self.leaves = 1 << self.depth
+        self.first_leaf = self.leaves - 1
+
+        # Границы листьев; пустые листья получают "вывернутый" прямоугольник, в который лучи не попадают
+        slots = np.full((self.leaves * LEAF_SIZE, 3, 3), np.nan)
+        slots[:count] = corners
+        slots = slots.reshape(self.leaves, LEAF_SIZE * 3, 3)
+        with np.errstate(invalid='ignore'):
+            leaf_min = np.nanmin(np.where(np.isnan(slots), np.inf, slots), axis=1)
+            leaf_max = np.nanmax(np.where(np.isnan(slots), -np.inf, slots), axis=1)
+
+        node_count = 2 * self.leaves - 1
+        self.node_min = np.empty((node_count, 3))
+        self.node_max = np.empty((node_count, 3))
+        self.node_min[self.first_leaf:] = leaf_min
+        self.node_max[self.first_leaf:] = leaf_max
+        for level in range(self.depth - 1, -1, -1):
+            nodes = np.arange((1 << level) - 1, (1 << (level + 1)) - 1)
+            self.node_min[nodes] = np.minimum(self.node_min[2 * nodes + 1], self.node_min[2 * nodes + 2])
+            self.node_max[nodes] = np.maximum(self.node_max[2 * nodes + 1], self.node_max[2 * nodes + 2])
+
+    def _box_test(self, origins, inv_dirs, t_max, rays, nodes):
+        """Пересечение пар (луч, узел) с прямоугольниками узлов; возвращает маску и расстояние входа."""
+        o = origins[rays]
+        inv = inv_dirs[rays]
+        t1 = (self.node_min[nodes] - o) * inv
+        t2 = (self.node_max[nodes] - o) * inv
+        # fmin/fmax игнорируют NaN (луч лежит в плоскости грани прямоугольника);
+        # покомпонентно, а не через max(axis=1) - так заметно быстрее для осей длины 3
+        lo = np.fmin(t1, t2)
+        hi = np.fmax(t1, t2)
+        t_near = np.fmax(np.fmax(lo[:, 0], lo[:, 1]), np.fmax(lo[:, 2], 0.0))
+        t_far = np.fmin(np.fmin(hi[:, 0], hi[:, 1]), hi[:, 2])
+        return (t_near <= t_far) & (t_near < t_max[rays]), t_near
+
+    def _candidate_leaves(self, origins, inv_dirs, t_max):
+        """Обход дерева в ширину сразу для всех лучей: пары (луч, лист, расстояние входа)."""
+        rays = np.arange(len(origins))
+        nodes = np.zeros(len(origins), dtype=np.int64)
+        for _ in range(self.depth):
+            hit, _ = self._box_test(origins, inv_dirs, t_max, rays, nodes)
+            rays = np.repeat(rays[hit], 2)
+            nodes = np.repeat(2 * nodes[hit] + 1, 2)
+            nodes[1::2] += 1
+        hit, t_near = self._box_test(origins, inv_dirs, t_max, rays, nodes)
+        return rays[hit], nodes[hit] - self.first_leaf, t_near[hit]
+
+    def _intersect_pairs(self, origins, dirs, rays, slots):
+        """Möller–Trumbore для пар (луч, треугольник); возвращает t, u, v (t = inf при промахе)."""
+        d = dirs[rays]
+        e1, e2 = self.e1[slots], self.e2[slots]
+        p = np.cross(d, e2)
+        det = np.einsum('ij,ij->i', e1, p)
+        ok = np.abs(det) > EPSILON
+        inv_det = 1.0 / np.where(ok, det, 1.0)
+        s = origins[rays] - self.v0[slots]
+        u = np.einsum('ij,ij->i', s, p) * inv_det
+        q = np.cross(s, e1)
+        v = np.einsum('ij,ij->i', d, q) * inv_det
+        t = np.einsum('ij,ij->i', e2, q) * inv_det
+        ok &= (u >= 0) & (v >= 0) & (u + v <= 1) & (t > 0)
+        return np.where(ok, t, np.inf), u, v
+
+    def intersect(self, origins: np.ndarray, dirs: np.ndarray, t_max: Optional[np.ndarray] = None,
+                  any_hit: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Ближайшие пересечения пакета лучей origin + t * dir, 0 < t < t_max.
+
+        Листья каждого луча проверяются в порядке удаления: на шаге k проверяется
+        k-й по близости лист всех лучей, у которых он ближе уже найденного
+        пересечения. Обычно попадание находится в первых листьях, и остальные
+        пары отбрасываются без проверки треугольников.
+
+        Args:
+            any_hit: Достаточно любого пересечения (лучи теней).
+
+        Returns:
+            t - расстояние в единицах dir (inf при промахе),
+            triangle - номер треугольника в исходном массиве (-1 при промахе).
+        """
+        origins = np.asarray(origins, dtype=np.float64)
+        dirs = np.asarray(dirs, dtype=np.float64)
+        n = len(origins)
+        best_t = np.full(n, np.inf) if t_max is None else np.array(np.broadcast_to(t_max, (n,)), dtype=np.float64)
+        best_slot = np.full(n, -1, dtype=np.int64)
+        if self.count == 0 or n == 0:
+            return np.full(n, np.inf), best_slot
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            inv_dirs = 1.0 / dirs
+            rays, leaves, t_near = self._candidate_leaves(origins, inv_dirs, best_t)
+
+        # Ранг листа среди листьев своего луча по расстоянию входа
+        order = np.lexsort((t_near, rays))
+        rays, leaves, t_near = rays[order], leaves[order], t_near[order]
+        group_start = np.ones(len(rays), dtype=bool)
+        group_start[1:] = rays[1:] != rays[:-1]
+        starts = np.flatnonzero(group_start)
+        rank = np.arange(len(rays)) - np.repeat(starts, np.diff(np.append(starts, len(rays))))
+        by_rank = np.argsort(rank, kind='stable')
+        bounds = np.concatenate([[0], np.cumsum(np.bincount(rank))]) if len(rank) else [0]
+
+        lane = np.arange(LEAF_SIZE)
+        for k in range(len(bounds) - 1):
+            pick = by_rank[bounds[k]:bounds[k + 1]]
+            r, leaf, near = rays[pick], leaves[pick], t_near[pick]
+            active = near < best_t[r]
+            if any_hit:
+                active &= best_slot[r] < 0
+            if not active.any():
+                continue
+            r, leaf = r[active], leaf[active]
+            slots = (leaf[:, None] * LEAF_SIZE + lane).reshape(-1)
+            r = np.repeat(r, LEAF_SIZE)
+            valid = slots < self.count
+            r, slots = r[valid], slots[valid]
+
+            t, _, _ = self._intersect_pairs(origins, dirs, r, slots)
+            hit = t < best_t[r]
+            r, slots, t = r[hit], slots[hit], t[hit]
+            if len(r) == 0:
+                continue
+            # Ближайшее попадание каждого луча на этом шаге
+            closest = np.lexsort((t, r))
+            r, slots, t = r[closest], slots[closest], t[closest]
+            first = np.ones(len(r), dtype=bool)
+            first[1:] = r[1:] != r[:-1]
+            best_t[r[first]] = t[first]
+            best_slot[r[first]] = slots[first]
+
+        triangle = np.where(best_slot >= 0, self.order[np.maximum(best_slot, 0)], -1)
+        return np.where(best_slot >= 0, best_t, np.inf), triangle
+
+    def occluded(self, origins: np.ndarray, dirs: np.ndarray, t_max) -> np.ndarray:
+        """Маска лучей, пересекающих что-либо на отрезке 0 < t < t_max."""
+        _, triangle = self.intersect(origins, dirs, t_max, any_hit=True)
+        return triangle >= 0
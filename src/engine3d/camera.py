@@ -1,13 +1,15 @@
 import pygame
 
 class Camera:
-    def __init__(self, x, y, z, dx=5, dy=5, dz=5):
+    def __init__(self, x, y, z, dx=5, dy=5, dz=5, invert_pan=False):
         self.x = x
         self.y = y
         self.z = z
         self.dx = dx
         self.dy = dy
         self.dz = dz
+        # Стрелки без Shift двигают сцену, а не камеру (управление lab7)
+        self.invert_pan = invert_pan
 
     def update(self):
         keys = pygame.key.get_pressed()
@@ -23,14 +25,15 @@ class Camera:
                 self.z -= self.dz
         else:
             # Движение по X и Y (плоское смещение камеры)
+            sign = -1 if self.invert_pan else 1
             if keys[pygame.K_RIGHT]:
-                self.x += self.dx
+                self.x += sign * self.dx
             if keys[pygame.K_LEFT]:
-                self.x -= self.dx
+                self.x -= sign * self.dx
             if keys[pygame.K_UP]:
-                self.y -= self.dy # Инвертируем Y для привычного управления (вверх -> камера вверх)
+                self.y -= sign * self.dy # Инвертируем Y для привычного управления (вверх -> камера вверх)
             if keys[pygame.K_DOWN]:
-                self.y += self.dy
+                self.y += sign * self.dy
 
 
 # Начальные координаты камеры
@@ -1,3 +1,5 @@
+import os
+
 # Цвета
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -33,4 +35,8 @@ FAR = 250
 NEAR = 0.5
 
 # Параметры obj
-OBJ_SCALE = 300.0
\ No newline at end of file
+OBJ_SCALE = 300.0
+# Папка моделей в корне репозитория (модель по умолчанию для демо-скриптов пакета)
+MODELS_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'models'))
+# Допуск сварки вершин при очистке сетки (в единицах сцены)
+WELD_TOLERANCE = 1e-3
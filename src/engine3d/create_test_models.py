@@ -3,12 +3,12 @@
 Запустите этот скрипт, чтобы создать примеры моделей для тестирования
 """
 
-from D3Renderer import *
-from primitives import *
-from transformations import *
-from object_IO import *
-from rotation_figure import *
-from surface_2d import *
+from .D3Renderer import *
+from .primitives import *
+from .transformations import *
+from .object_IO import *
+from .rotation_figure import *
+from .surface_2d import *
 
 
 def create_test_models():
@@ -286,7 +286,7 @@ if __name__ == "__main__":
     print("\n" + "=" * 60)
     print("ГОТОВО! Все тестовые модели созданы.")
     print("Теперь вы можете:")
-    print("1. Запустить D3Renderer.py")
+    print("1. Запустить lab8/main.py")
     print("2. Использовать кнопку 'Загрузить OBJ' для загрузки моделей")
     print("3. Применять аффинные преобразования")
     print("4. Сохранять результаты с помощью 'Сохранить OBJ'")
@@ -0,0 +1,359 @@
+import itertools
+import numpy as np
+from .primitives import Point, Polygon, Object
+from typing import Sequence
+
+
+class Mesh:
+    """
+    Индексированная сетка: массив вершин (N, 3) и массив граней (F, K).
+
+    Грани хранятся как индексы вершин. Если в сетке есть грани с разным
+    числом вершин, короткие строки дополняются значением -1.
+    Массивы вещественного/целого типа не копируются, поэтому сетка может
+    лежать поверх np.memmap. normals - необязательные нормали вершин (N, 3).
+    """
+
+    def __init__(self, vertices=None, faces=None, normals=None):
+        if vertices is None:
+            vertices = np.zeros((0, 3))
+        if faces is None:
+            faces = np.zeros((0, 3), dtype=np.int64)
+        vertices = np.asarray(vertices)
+        if vertices.dtype.kind != 'f':
+            vertices = vertices.astype(float)
+        faces = np.asarray(faces)
+        if faces.dtype.kind != 'i':
+            faces = faces.astype(np.int64)
+        self.vertices = vertices.reshape(-1, 3)
+        self.faces = faces if faces.ndim == 2 else faces.reshape(len(faces), -1)
+        self.normals = normals
+
+    @staticmethod
+    def from_object(obj: Object) -> 'Mesh':
+        """Строит сетку по объекту; общие Point становятся одной вершиной."""
+        index_of = {}
+        points = []
+        faces = []
+        for poly in obj.polygons:
+            face = []
+            for vertex in poly.vertices:
+                key = id(vertex)
+                if key not in index_of:
+                    index_of[key] = len(points)
+                    points.append((vertex.x, vertex.y, vertex.z))
+                face.append(index_of[key])
+            faces.append(face)
+        return Mesh(np.array(points, dtype=float).reshape(-1, 3), pack_faces(faces))
+
+    def to_object(self) -> Object:
+        """Строит Object, в котором грани ссылаются на общие Point."""
+        points = [Point(x, y, z) for x, y, z in self.vertices.tolist()]
+        obj = Object()
+        for face, size in zip(self.faces.tolist(), self.face_sizes().tolist()):
+            obj.add_face(Polygon([points[i] for i in face[:size]]))
+        return obj
+
+    def copy(self) -> 'Mesh':
+        normals = None if self.normals is None else np.array(self.normals)
+        return Mesh(np.array(self.vertices), np.array(self.faces), normals)
+
+    def face_sizes(self) -> np.ndarray:
+        """Количество вершин в каждой грани."""
+        return np.count_nonzero(self.faces >= 0, axis=1)
+
+    def triangles(self, return_faces: bool = False):
+        """
+        Триангуляция граней веером из первой вершины, массив (T, 3).
+        При return_faces дополнительно возвращает номер исходной грани каждого треугольника.
+        """
+        if self.faces.shape[1] < 3:
+            empty = np.zeros((0, 3), dtype=np.int64)
+            return (empty, np.zeros(0, dtype=np.int64)) if return_faces else empty
+        parts, face_parts = [], []
+        for j in range(1, self.faces.shape[1] - 1):
+            tri = self.faces[:, [0, j, j + 1]]
+            keep = tri[:, 2] >= 0
+            parts.append(tri[keep])
+            face_parts.append(np.nonzero(keep)[0])
+        if return_faces:
+            return np.concatenate(parts), np.concatenate(face_parts)
+        return np.concatenate(parts)
+
+    def vertex_normals(self) -> np.ndarray:
+        """Нормали вершин: сумма нормалей смежных треугольников, взвешенная площадью."""
+        tris = self.triangles()
+        v = np.asarray(self.vertices, dtype=float)
+        face_normals = np.cross(v[tris[:, 1]] - v[tris[:, 0]], v[tris[:, 2]] - v[tris[:, 0]])
+        normals = np.zeros_like(v)
+        for k in range(3):
+            np.add.at(normals, tris[:, k], face_normals)
+        length = np.linalg.norm(normals, axis=1, keepdims=True)
+        return normals / np.where(length > 1e-12, length, 1.0)
+
+    def unique_edges(self) -> np.ndarray:
+        """Уникальные рёбра (E, 2), каждое общее ребро - один раз."""
+        return unique_edges(self.faces)
+
+    def __len__(self):
+        return len(self.faces)
+
+
+def pack_faces(faces: Sequence[Sequence[int]]) -> np.ndarray:
+    """Упаковывает список граней разной длины в массив (F, K) с дополнением -1."""
+    if len(faces) == 0:
+        return np.zeros((0, 3), dtype=np.int64)
+    width = max(len(f) for f in faces)
+    packed = np.full((len(faces), width), -1, dtype=np.int64)
+    for i, f in enumerate(faces):
+        packed[i, :len(f)] = f
+    return packed
+
+
+def _compact_faces(faces: np.ndarray, keep: np.ndarray) -> np.ndarray:
+    """Сдвигает оставленные индексы каждой грани влево, остальное заполняет -1."""
+    order = np.argsort(~keep, axis=1, kind='stable')
+    compact = np.take_along_axis(faces, order, axis=1)
+    kept = np.take_along_axis(keep, order, axis=1)
+    compact[~kept] = -1
+    return compact
+
+
+def _face_corner_edges(faces: np.ndarray):
+    """Ориентированные рёбра (a -> b) всех граней и номер грани для каждого ребра."""
+    sizes = np.count_nonzero(faces >= 0, axis=1)
+    cols = np.arange(faces.shape[1])
+    nxt = (cols[None, :] + 1) % np.maximum(sizes, 1)[:, None]
+    a = faces
+    b = np.take_along_axis(faces, nxt, axis=1)
+    valid = a >= 0
+    face_ids = np.broadcast_to(np.arange(len(faces))[:, None], faces.shape)
+    return a[valid], b[valid], face_ids[valid]
+
+
+def unique_edges(faces: np.ndarray) -> np.ndarray:
+    """Уникальные рёбра граней (E, 2): пары индексов упорядочиваются и дедуплицируются."""
+    a, b, _ = _face_corner_edges(faces)
+    keep = a != b
+    pairs = np.sort(np.stack([a[keep], b[keep]], axis=1), axis=1)
+    if len(pairs) == 0:
+        return np.zeros((0, 2), dtype=np.int64)
+    n = int(pairs.max()) + 1
+    keys = np.unique(pairs[:, 0] * n + pairs[:, 1])
+    return np.stack([keys // n, keys % n], axis=1)
+
+
+def _flip_faces(faces: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Меняет порядок обхода граней, отмеченных маской."""
+    sizes = np.count_nonzero(faces >= 0, axis=1)[:, None]
+    cols = np.arange(faces.shape[1])[None, :]
+    reversed_idx = np.where(cols < sizes, sizes - 1 - cols, cols)
+    idx = np.where(mask[:, None], reversed_idx, cols)
+    return np.take_along_axis(faces, idx, axis=1)
+
+
+def _cell_ids(keys: np.ndarray) -> np.ndarray:
+    """Номера различных строк целочисленных ключей (N, 3), как inverse из np.unique(axis=0)."""
+    keys = keys - keys.min(axis=0)
+    extent = keys.max(axis=0) + 1
+    if np.prod(extent.astype(np.float64)) < 2.0 ** 62:
+        # Ключ ячейки - одно число: np.unique по 1D-массиву намного быстрее, чем по строкам
+        linear = (keys[:, 0] * extent[1] + keys[:, 1]) * extent[2] + keys[:, 2]
+        _, cell = np.unique(linear, return_inverse=True)
+    else:
+        _, cell = np.unique(keys, axis=0, return_inverse=True)
+    return cell.reshape(-1)
+
+
+def _same_cell_pairs(cell: np.ndarray):
+    """Все пары (i, j), i != j, вершин с одинаковым номером ячейки."""
+    order = np.argsort(cell, kind='stable')
+    sorted_cell = cell[order]
+    first, second = [], []
+    for step in range(1, len(order)):
+        same = sorted_cell[step:] == sorted_cell[:-step]
+        if not same.any():
+            break  # в ячейках меньше step + 1 вершин
+        first.append(order[:-step][same])
+        second.append(order[step:][same])
+    if not first:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    return np.concatenate(first), np.concatenate(second)
+
+
+def weld_vertices(mesh: Mesh, tolerance: float = 1e-6) -> Mesh:
+    """
+    Сваривает вершины, лежащие не дальше tolerance друг от друга.
+
+    Кандидаты в пары ищутся на восьми сетках с ячейкой 2 * tolerance, сдвинутых
+    на полъячейки по каждой оси: пара ближе tolerance попадает в общую ячейку
+    хотя бы одной из них. Из кандидатов остаются пары с расстоянием <= tolerance.
+    Каждая вершина присоединяется к вершине с наименьшим индексом в пределах
+    tolerance от нее (без транзитивного замыкания, так что цепочка близких вершин
+    не стягивается в точку), новая вершина - среднее присоединенных.
+    """
+    n = len(mesh.vertices)
+    if n == 0:
+        return mesh.copy()
+    scaled = mesh.vertices / (2 * tolerance)
+    first, second = [], []
+    for offset in itertools.product((0.5, 0.0), repeat=3):
+        a, b = _same_cell_pairs(_cell_ids(np.floor(scaled + np.array(offset)).astype(np.int64)))
+        first.append(a)
+        second.append(b)
+    first, second = np.concatenate(first), np.concatenate(second)
+    close = np.linalg.norm(mesh.vertices[first] - mesh.vertices[second], axis=1) <= tolerance
+    first, second = first[close], second[close]
+
+    seed = np.arange(n)
+    np.minimum.at(seed, first, second)
+    np.minimum.at(seed, second, first)
+
+    _, inverse = np.unique(seed, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    count = np.bincount(inverse)
+    vertices = np.stack([np.bincount(inverse, weights=mesh.vertices[:, k]) / count
+                         for k in range(3)], axis=1)
+    faces = np.where(mesh.faces >= 0, inverse[np.maximum(mesh.faces, 0)], -1)
+    return Mesh(vertices, faces)
+
+
+def remove_degenerate_faces(mesh: Mesh, min_area: float = 1e-12) -> Mesh:
+    """
+    Убирает повторяющиеся подряд вершины в гранях и удаляет грани,
+    у которых осталось меньше трёх вершин или нулевая площадь.
+    """
+    faces = mesh.faces
+    if len(faces) == 0:
+        return mesh.copy()
+    sizes = np.count_nonzero(faces >= 0, axis=1)
+    cols = np.arange(faces.shape[1])
+    nxt = np.take_along_axis(faces, (cols[None, :] + 1) % np.maximum(sizes, 1)[:, None], axis=1)
+    keep = (faces >= 0) & (faces != nxt)
+    faces = _compact_faces(faces, keep)
+
+    sizes = np.count_nonzero(faces >= 0, axis=1)
+    area = np.zeros(len(faces))
+    v = mesh.vertices
+    for j in range(1, faces.shape[1] - 1):
+        valid = sizes > j + 1
+        a = v[faces[valid, 0]]
+        b = v[faces[valid, j]]
+        c = v[faces[valid, j + 1]]
+        area[valid] += 0.5 * np.linalg.norm(np.cross(b - a, c - a), axis=1)
+    good = (sizes >= 3) & (area > min_area)
+    return Mesh(mesh.vertices, faces[good])
+
+
+def remove_duplicate_faces(mesh: Mesh) -> Mesh:
+    """Удаляет грани с одинаковым набором вершин (независимо от порядка обхода)."""
+    if len(mesh.faces) == 0:
+        return mesh.copy()
+    keys = np.sort(mesh.faces, axis=1)
+    _, first = np.unique(keys, axis=0, return_index=True)
+    return Mesh(mesh.vertices, mesh.faces[np.sort(first)])
+
+
+def remove_unused_vertices(mesh: Mesh) -> Mesh:
+    """Удаляет вершины, на которые не ссылается ни одна грань."""
+    used = np.zeros(len(mesh.vertices), dtype=bool)
+    used[mesh.faces[mesh.faces >= 0]] = True
+    remap = np.cumsum(used) - 1
+    faces = np.where(mesh.faces >= 0, remap[np.maximum(mesh.faces, 0)], -1)
+    return Mesh(mesh.vertices[used], faces)
+
+
+def orient_faces(mesh: Mesh) -> Mesh:
+    """
+    Делает порядок обхода граней согласованным внутри каждой связной компоненты.
+
+    Соседние грани должны проходить общее ребро в противоположных направлениях.
+    Замкнутые компоненты дополнительно разворачиваются нормалями наружу
+    (по знаку ориентированного объёма).
+    """
+    faces = mesh.faces
+    n_faces = len(faces)
+    if n_faces == 0:
+        return mesh.copy()
+
+    a, b, face_ids = _face_corner_edges(faces)
+    pairs = np.stack([np.minimum(a, b), np.maximum(a, b)], axis=1)
+    _, edge_ids, edge_count = np.unique(pairs, axis=0, return_inverse=True, return_counts=True)
+    edge_ids = edge_ids.reshape(-1)
+    forward = a < b
+
+    # Смежность только по манифолдным рёбрам (ровно две грани на ребро)
+    manifold = edge_count[edge_ids] == 2
+    order = np.argsort(edge_ids[manifold], kind='stable')
+    f_m = face_ids[manifold][order].reshape(-1, 2)
+    d_m = forward[manifold][order].reshape(-1, 2)
+    # Одинаковое направление общего ребра - одну из граней нужно развернуть
+    same = d_m[:, 0] == d_m[:, 1]
+
+    src = np.concatenate([f_m[:, 0], f_m[:, 1]])
+    dst = np.concatenate([f_m[:, 1], f_m[:, 0]])
+    rel = np.concatenate([same, same])
+    order = np.argsort(src, kind='stable')
+    dst, rel = dst[order].tolist(), rel[order].tolist()
+    starts = np.searchsorted(src[order], np.arange(n_faces + 1)).tolist()
+
+    flip = [False] * n_faces
+    component = [-1] * n_faces
+    n_components = 0
+    for seed in range(n_faces):
+        if component[seed] >= 0:
+            continue
+        component[seed] = n_components
+        stack = [seed]
+        while stack:
+            f = stack.pop()
+            for k in range(starts[f], starts[f + 1]):
+                g = dst[k]
+                if component[g] < 0:
+                    component[g] = n_components
+                    flip[g] = flip[f] != rel[k]
+                    stack.append(g)
+        n_components += 1
+
+    flip = np.array(flip)
+    component = np.array(component)
+    faces = _flip_faces(faces, flip)
+
+    # Замкнутые компоненты разворачиваем так, чтобы объём был положительным
+    open_faces = face_ids[edge_count[edge_ids] == 1]
+    closed = np.ones(n_components, dtype=bool)
+    closed[component[open_faces]] = False
+    oriented = Mesh(mesh.vertices, faces)
+    tri_faces = []
+    tris = []
+    for j in range(1, faces.shape[1] - 1):
+        valid = faces[:, j + 1] >= 0
+        tris.append(faces[valid][:, [0, j, j + 1]])
+        tri_faces.append(np.nonzero(valid)[0])
+    tris = np.concatenate(tris)
+    tri_faces = np.concatenate(tri_faces)
+    v = oriented.vertices - oriented.vertices.mean(axis=0)
+    signed = np.einsum('ij,ij->i', v[tris[:, 0]], np.cross(v[tris[:, 1]], v[tris[:, 2]]))
+    volume = np.bincount(component[tri_faces], weights=signed, minlength=n_components)
+    inverted = closed & (volume < 0)
+    return Mesh(mesh.vertices, _flip_faces(faces, inverted[component]))
+
+
+def clean_mesh(mesh: Mesh, tolerance: float = 1e-6, orient: bool = True) -> Mesh:
+    """
+    Полная очистка сетки: сварка вершин, удаление вырожденных и повторяющихся
+    граней, согласование обхода и удаление неиспользуемых вершин.
+    """
+    mesh = weld_vertices(mesh, tolerance)
+    mesh = remove_degenerate_faces(mesh)
+    mesh = remove_duplicate_faces(mesh)
+    if orient:
+        mesh = orient_faces(mesh)
+    return remove_unused_vertices(mesh)
+
+
+def clean_object(obj: Object, tolerance: float = 1e-6, orient: bool = True) -> Object:
+    """Очищает Object через индексированную сетку и возвращает новый Object."""
+    if not obj.polygons:
+        return obj
+    return clean_mesh(Mesh.from_object(obj), tolerance, orient).to_object()
@@ -0,0 +1,298 @@
+from .primitives import Object
+from .mesh import Mesh, pack_faces, clean_mesh
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Union
+import numpy as np
+import argparse
+import struct
+import glob
+import os
+from . import config
+
+
+# ===== Бинарный формат сетки =====
+# Заголовок (64 байта) и выровненные по 64 байтам массивы:
+#   вершины float32 (N, 3), нормали float32 (N, 3) (если есть), грани int32 (F, K)
+# Координаты хранятся в единицах сцены (уже масштабированными, как после load_mesh).
+MESH_EXT = '.m3d'
+MESH_MAGIC = b'M3DMESH\0'
+MESH_VERSION = 1
+MESH_HEADER = struct.Struct('<8sIIQQI')
+MESH_HEADER_SIZE = 64
+MESH_ALIGN = 64
+MESH_FLAG_NORMALS = 1
+
+
+def load_mesh(filename: str, weld: bool = False) -> Mesh:
+    """
+    Загружает 3D-модель из файла формата .obj в индексированную сетку.
+    Файлы с расширением MESH_EXT открываются через open_mesh_binary.
+
+    Args:
+        filename: Путь к .obj файлу.
+        weld: Выполнить очистку сетки (сварка вершин, удаление вырожденных
+            и повторяющихся граней, согласование обхода).
+
+    Returns:
+        Сетка Mesh (пустая в случае ошибки).
+    """
+    if filename.lower().endswith(MESH_EXT):
+        mesh = open_mesh_binary(filename)
+        return clean_mesh(mesh, config.WELD_TOLERANCE) if weld else mesh
+
+    coords = []
+    faces = []
+
+    try:
+        with open(filename, 'r') as f:
+            for line in f:
+                if line.startswith('v '):
+                    # .obj файлы могут содержать 4-й компонент (w), мы его игнорируем
+                    coords.append(line.split()[1:4])
+                elif line.startswith('f '):
+                    # Индексы в .obj могут быть сложными (v/vt/vn), извлекаем только индекс вершины.
+                    # Индексы начинаются с 1; отрицательные считаются от последней вершины
+                    n = len(coords)
+                    face = []
+                    for part in line.split()[1:]:
+                        index = int(part.split('/')[0])
+                        face.append(index - 1 if index > 0 else n + index)
+                    faces.append(face)
+
+        vertices = np.array(coords, dtype=float).reshape(-1, 3)
+        faces = pack_faces(faces)
+        if faces.size and faces.max() >= len(vertices):
+            raise IndexError("индекс вершины грани вне диапазона")
+    except FileNotFoundError:
+        print(f"Ошибка: Файл не найден по пути {filename}")
+        return Mesh()  # Возвращаем пустую сетку в случае ошибки
+    except Exception as e:
+        print(f"Ошибка при чтении файла {filename}: {e}")
+        return Mesh()
+
+    # Масштабируем модель константой из конфигурации и переворачиваем ось Y
+    vertices *= config.OBJ_SCALE
+    vertices[:, 1] *= -1
+    mesh = Mesh(vertices, faces)
+    if weld:
+        mesh = clean_mesh(mesh, config.WELD_TOLERANCE)
+
+    print(f"Модель {filename} успешно загружена.")
+    return mesh
+
+
+def load_obj(filename: str, weld: bool = False) -> Object:
+    """
+    Загружает 3D-модель из файла формата .obj.
+
+    Args:
+        filename: Путь к .obj файлу.
+        weld: Выполнить очистку сетки (см. load_mesh).
+
+    Returns:
+        Объект типа Object, представляющий модель.
+    """
+    return load_mesh(filename, weld).to_object()
+
+
+def load_meshes(files: Union[str, List[str]], weld: bool = False,
+                workers: Optional[int] = None,
+                progress: Optional[Callable[[int, int, str], None]] = None) -> Dict[str, Mesh]:
+    """
+    Параллельно загружает несколько .obj файлов в пуле процессов.
+
+    Сетки возвращаются из процессов как массивы NumPy (сериализуются pickle),
+    без создания Point в дочерних процессах.
+
+    Args:
+        files: Список путей или glob-шаблон (например, "models/*.obj").
+        weld: Выполнить очистку каждой сетки.
+        workers: Количество процессов (по умолчанию - число ядер).
+        progress: Функция progress(загружено, всего, путь), вызывается по мере готовности.
+
+    Returns:
+        Словарь {путь: Mesh} в порядке исходного списка.
+    """
+    paths = sorted(glob.glob(files)) if isinstance(files, str) else list(files)
+    meshes = {}
+    if not paths:
+        return meshes
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(load_mesh, path, weld): path for path in paths}
+        for done, future in enumerate(as_completed(futures), 1):
+            path = futures[future]
+            meshes[path] = future.result()
+            if progress is not None:
+                progress(done, len(paths), path)
+
+    return {path: meshes[path] for path in paths}
+
+
+def save_obj(obj: Object, filename: str):
+    """
+    Сохраняет 3D-модель в файл формата .obj.
+
+    Args:
+        obj: Объект типа Object для сохранения.
+        filename: Имя файла для сохранения.
+    """
+    # Получаем коэффициент масштабирования из конфига для выполнения обратного преобразования
+    scale = config.OBJ_SCALE
+    # Предотвращение деления на ноль, если масштаб вдруг окажется нулевым
+    if scale == 0:
+        scale = 1.0
+
+    all_vertices = []
+    # Собираем все вершины из всех полигонов объекта
+    for poly in obj.polygons:
+        all_vertices.extend(poly.vertices)
+
+    # Создаем словарь для отслеживания уникальных вершин и их индексов
+    # Ключ - кортеж координат, значение - 1-основанный индекс
+    vertex_to_index = {}
+    unique_vertices = []
+
+    for vertex in all_vertices:
+        # Округляем значения для корректного сравнения float-чисел
+        v_tuple = (round(vertex.x, 6), -round(vertex.y, 6), round(vertex.z, 6))
+        if v_tuple not in vertex_to_index:
+            unique_vertices.append(vertex)
+            # .obj использует 1-основанную индексацию
+            vertex_to_index[v_tuple] = len(unique_vertices)
+
+    try:
+        with open(filename, 'w') as f:
+            f.write("# Model saved from 3DRenderer\n")
+
+            # Записываем все уникальные вершины с применением АНТИ-масштабирования
+            for v in unique_vertices:
+                # Делим координаты на тот же коэффициент, на который умножали при загрузке
+                f.write(f"v {v.x / scale} {v.y / scale} {v.z / scale}\n")
+
+            f.write("\n")
+
+            # Записываем информацию о гранях (полигонах)
+            for poly in obj.polygons:
+                f.write("f")
+                for vertex in poly.vertices:
+                    v_tuple = (round(vertex.x, 6), round(-vertex.y, 6), round(vertex.z, 6))
+                    index = vertex_to_index[v_tuple]
+                    f.write(f" {index}")
+                f.write("\n")
+
+        print(f"Модель успешно сохранена в файл {filename}")
+
+    except Exception as e:
+        print(f"Ошибка при сохранении файла {filename}: {e}")
+
+
+def _align(offset: int) -> int:
+    return (offset + MESH_ALIGN - 1) // MESH_ALIGN * MESH_ALIGN
+
+
+def _mesh_layout(n_vertices: int, n_faces: int, face_width: int, has_normals: bool):
+    """Смещения массивов вершин, нормалей и граней в бинарном файле."""
+    vertices_offset = MESH_HEADER_SIZE
+    normals_offset = _align(vertices_offset + n_vertices * 3 * 4)
+    faces_offset = _align(normals_offset + (n_vertices * 3 * 4 if has_normals else 0))
+    end = faces_offset + n_faces * face_width * 4
+    return vertices_offset, normals_offset, faces_offset, end
+
+
+def save_mesh_binary(mesh: Mesh, filename: str, normals: bool = True):
+    """
+    Сохраняет сетку в бинарный формат MESH_EXT.
+
+    Args:
+        mesh: Сетка для сохранения.
+        filename: Имя файла.
+        normals: Записать нормали вершин (берутся из mesh.normals или вычисляются).
+    """
+    n_vertices, n_faces = len(mesh.vertices), len(mesh.faces)
+    face_width = mesh.faces.shape[1]
+    if max(n_vertices, n_faces * face_width) >= 2 ** 31:
+        raise ValueError("Сетка слишком велика для 32-битных индексов")
+
+    layout = _mesh_layout(n_vertices, n_faces, face_width, normals)
+    header = MESH_HEADER.pack(MESH_MAGIC, MESH_VERSION, MESH_FLAG_NORMALS if normals else 0,
+                              n_vertices, n_faces, face_width)
+
+    arrays = [(layout[0], mesh.vertices, '<f4')]
+    if normals:
+        vertex_normals = mesh.normals if mesh.normals is not None else mesh.vertex_normals()
+        arrays.append((layout[1], vertex_normals, '<f4'))
+    arrays.append((layout[2], mesh.faces, '<i4'))
+
+    with open(filename, 'wb') as f:
+        f.write(header.ljust(MESH_HEADER_SIZE, b'\0'))
+        for offset, array, dtype in arrays:
+            f.write(b'\0' * (offset - f.tell()))
+            np.ascontiguousarray(array, dtype=dtype).tofile(f)
+    print(f"Сетка сохранена в файл {filename}")
+
+
+def open_mesh_binary(filename: str, mode: str = 'r') -> Mesh:
+    """
+    Открывает бинарную сетку через np.memmap за постоянное время:
+    данные читаются с диска только при обращении к страницам массивов.
+
+    Args:
+        filename: Путь к файлу MESH_EXT.
+        mode: Режим np.memmap ('r' - только чтение, 'r+' - изменение на месте,
+            'c' - копирование при записи).
+
+    Returns:
+        Сетка Mesh, массивы которой отображены в память (пустая в случае ошибки).
+    """
+    try:
+        with open(filename, 'rb') as f:
+            raw = f.read(MESH_HEADER.size)
+        magic, version, flags, n_vertices, n_faces, face_width = MESH_HEADER.unpack(raw)
+        if magic != MESH_MAGIC or version != MESH_VERSION:
+            raise ValueError("неизвестный формат файла")
+
+        has_normals = bool(flags & MESH_FLAG_NORMALS)
+        v_off, n_off, f_off, end = _mesh_layout(n_vertices, n_faces, face_width, has_normals)
+        if os.path.getsize(filename) < end:
+            raise ValueError("файл обрезан")
+
+        def mapped(offset, dtype, shape):
+            if shape[0] == 0:
+                return np.zeros(shape, dtype=dtype)
+            return np.memmap(filename, dtype=dtype, mode=mode, offset=offset, shape=shape)
+
+        vertices = mapped(v_off, '<f4', (n_vertices, 3))
+        normals = mapped(n_off, '<f4', (n_vertices, 3)) if has_normals else None
+        faces = mapped(f_off, '<i4', (n_faces, face_width))
+    except FileNotFoundError:
+        print(f"Ошибка: Файл не найден по пути {filename}")
+        return Mesh()
+    except Exception as e:
+        print(f"Ошибка при чтении файла {filename}: {e}")
+        return Mesh()
+
+    return Mesh(vertices, faces, normals)
+
+
+def convert_mesh(src: str, dst: str, weld: bool = False):
+    """Конвертирует модель между форматами .obj и MESH_EXT (по расширению файлов)."""
+    mesh = load_mesh(src, weld)
+    if dst.lower().endswith(MESH_EXT):
+        save_mesh_binary(mesh, dst)
+    else:
+        save_obj(mesh.to_object(), dst)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Операции с файлами моделей")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    convert = commands.add_parser('convert', help=f"конвертация .obj <-> {MESH_EXT}")
+    convert.add_argument('src', help="исходный файл")
+    convert.add_argument('dst', help="файл результата (формат определяется расширением)")
+    convert.add_argument('--weld', action='store_true', help="очистить сетку перед сохранением")
+
+    args = parser.parse_args()
+    if args.command == 'convert':
+        convert_mesh(args.src, args.dst, args.weld)
@@ -1,7 +1,7 @@
 
 import numpy as np
 import pygame
-import config
+from . import config
 from typing import List, Tuple, Optional
 
 
@@ -119,42 +119,119 @@ class Polygon:
         return self.vertices[index]
 
 class Object:
+    """
+    Объект из полигонов с отложенными преобразованиями.
+
+    apply_transformation только домножает накопленную матрицу и пересчитывает
+    закэшированный центр; вершины переписываются один раз - при следующем
+    обращении к polygons (отрисовка, сохранение) или явном вызове flush().
+    Добавлять грани нужно через add_face, чтобы кэш вершин оставался верным.
+    """
+
     def __init__(self, polies: List[Polygon] = []):
-        self.polygons = polies.copy()
+        self._polygons = polies.copy()
+        self._pending: Optional[np.ndarray] = None
+        self._center: Optional[np.ndarray] = None
+        self._unique_vertices: Optional[List[Point]] = None
+        # Координаты уникальных вершин (N, 3), грани и рёбра (E, 2) для отрисовки массивами
+        self._coords: Optional[np.ndarray] = None
+        self._faces: Optional[np.ndarray] = None
+        self._edges: Optional[np.ndarray] = None
+
+    @property
+    def polygons(self) -> List[Polygon]:
+        self.flush()
+        # Вершины доступны снаружи и могут быть изменены - кэш координат и центра больше не верен
+        self._coords = None
+        self._center = None
+        return self._polygons
+
+    @polygons.setter
+    def polygons(self, polies: List[Polygon]):
+        self.flush()
+        self._polygons = polies
+        self._invalidate()
 
     def add_face(self, p: Polygon):
-        self.polygons.append(p)
+        self.flush()
+        self._polygons.append(p)
+        self._invalidate()
+
+    def _invalidate(self):
+        self._center = None
+        self._unique_vertices = None
+        self._coords = None
+        self._faces = None
+        self._edges = None
+
+    def unique_vertices(self) -> List[Point]:
+        """Уникальные вершины объекта (без учёта ещё не применённых преобразований)."""
+        if self._unique_vertices is None:
+            seen = {}
+            for poly in self._polygons:
+                for vertex in poly.vertices:
+                    seen[id(vertex)] = vertex
+            self._unique_vertices = list(seen.values())
+        return self._unique_vertices
+
+    def vertex_array(self) -> np.ndarray:
+        """
+        Текущие координаты уникальных вершин (N, 3) с учётом отложенных преобразований.
+        Вершины при этом не переписываются (flush не вызывается).
+        """
+        if self._coords is None:
+            coords = [(v.x, v.y, v.z) for v in self.unique_vertices()]
+            self._coords = np.array(coords, dtype=float).reshape(-1, 3)
+        if self._pending is None:
+            return self._coords
+        return self._coords @ self._pending[:3, :3].T + self._pending[:3, 3]
+
+    def face_array(self) -> np.ndarray:
+        """Грани (F, K) - индексы в unique_vertices(), дополненные -1; строятся один раз, только для чтения."""
+        if self._faces is None:
+            from .mesh import pack_faces
+            index = {id(v): i for i, v in enumerate(self.unique_vertices())}
+            self._faces = pack_faces([[index[id(v)] for v in poly.vertices] for poly in self._polygons])
+            self._faces.setflags(write=False)
+        return self._faces
+
+    def edges(self) -> np.ndarray:
+        """Уникальные рёбра (E, 2) - индексы в unique_vertices(); строятся один раз."""
+        if self._edges is None:
+            from .mesh import unique_edges
+            self._edges = unique_edges(self.face_array())
+        return self._edges
 
     def get_center(self) -> Point:
-        all_vertices = []
-        unique_vertices = set()
-        for poly in self.polygons:
-            for vertex in poly.vertices:
-                unique_vertices.add(vertex)
-
-        if not unique_vertices:
-            return Point(0, 0, 0)
-
-        all_vertices = list(unique_vertices)
-        cx = sum(v.x for v in all_vertices) / len(all_vertices)
-        cy = sum(v.y for v in all_vertices) / len(all_vertices)
-        cz = sum(v.z for v in all_vertices) / len(all_vertices)
-        return Point(cx, cy, cz)
+        if self._center is None:
+            vertices = self.unique_vertices()
+            if not vertices:
+                return Point(0, 0, 0)
+            coords = np.array([(v.x, v.y, v.z) for v in vertices])
+            self._center = np.append(coords.mean(axis=0), 1.0)
+            if self._pending is not None:
+                self._center = self._pending @ self._center
+        return Point(self._center[0], self._center[1], self._center[2])
 
     def apply_transformation(self, matrix: np.ndarray):
-        unique_vertices = set()
-        for poly in self.polygons:
-            for vertex in poly.vertices:
-                unique_vertices.add(vertex)
-
-        for vertex in unique_vertices:
-            h = vertex.to_homogeneous()
-            transformed = np.dot(matrix, h)
-            vertex.from_homogeneous(transformed)
-
+        matrix = np.asarray(matrix, dtype=float)
+        self._pending = matrix if self._pending is None else matrix @ self._pending
+        # Центр - среднее вершин, а аффинное преобразование сохраняет средние
+        if self._center is not None:
+            self._center = matrix @ self._center
+
+    def flush(self):
+        """Применяет накопленную матрицу ко всем вершинам за один проход."""
+        if self._pending is None:
+            return
+        transformed = self.vertex_array()
+        self._pending = None
+        self._coords = transformed
+        for vertex, (x, y, z) in zip(self.unique_vertices(), transformed.tolist()):
+            vertex.x, vertex.y, vertex.z = x, y, z
 
     def __len__(self):
-        return len(self.polygons)
+        return len(self._polygons)
 
     def __iter__(self):
         return iter(self.polygons)
@@ -0,0 +1,222 @@
+import numpy as np
+from typing import Optional
+
+# Максимальное количество пикселей-кандидатов, обрабатываемых за один проход
+CHUNK_PIXELS = 1 << 21
+
+
+class FrameBuffer:
+    """
+    Буферы кадра в виде массивов NumPy (строка - y, столбец - x).
+
+    depth - глубина (меньше - ближе), face_id - номер треугольника в пикселе (-1 - пусто),
+    attributes - интерполированные атрибуты вершин (создаются при первом использовании).
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.depth = np.full((height, width), np.inf, dtype=np.float32)
+        self.face_id = np.full((height, width), -1, dtype=np.int32)
+        self.attributes: Optional[np.ndarray] = None
+
+    def clear(self):
+        self.depth.fill(np.inf)
+        self.face_id.fill(-1)
+        if self.attributes is not None:
+            self.attributes.fill(0)
+
+
+def rasterize_triangles(fb: FrameBuffer, xy: np.ndarray, depth: np.ndarray,
+                        ids: Optional[np.ndarray] = None,
+                        attributes: Optional[np.ndarray] = None):
+    """
+    Растеризует треугольники в буфер кадра с проверкой глубины.
+
+    Для каждой строки пикселей треугольника отрезок [x_lo, x_hi] внутренних центров
+    пикселей находится сразу из уравнений трёх рёбер, поэтому перебираются только
+    покрытые пиксели, а не весь ограничивающий прямоугольник. Глубина считается по
+    плоскости треугольника, барицентрические координаты - только для записанных
+    пикселей. Пиксели порции строк обрабатываются одним массивом; если несколько
+    кандидатов попали в один пиксель, ближайший выбирается сортировкой по (пиксель, глубина).
+
+    Args:
+        fb: Буфер кадра.
+        xy: Экранные координаты вершин, массив (T, 3, 2).
+        depth: Глубина вершин (T, 3); интерполируется линейно по экрану.
+        ids: Номера, записываемые в fb.face_id (по умолчанию 0..T-1).
+        attributes: Атрибуты вершин (T, 3, K), интерполируются в fb.attributes.
+    """
+    xy = np.asarray(xy, dtype=np.float64)
+    depth = np.asarray(depth, dtype=np.float64)
+    if ids is None:
+        ids = np.arange(len(xy))
+    if attributes is not None and (fb.attributes is None or fb.attributes.shape[2] != attributes.shape[2]):
+        fb.attributes = np.zeros((fb.height, fb.width, attributes.shape[2]), dtype=np.float32)
+
+    a, b, c = xy[:, 0], xy[:, 1], xy[:, 2]
+    area = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+
+    # Ограничивающие прямоугольники по центрам пикселей, обрезанные экраном
+    x0 = np.maximum(np.ceil(xy[..., 0].min(axis=1) - 0.5), 0).astype(np.int64)
+    x1 = np.minimum(np.floor(xy[..., 0].max(axis=1) - 0.5), fb.width - 1).astype(np.int64)
+    y0 = np.maximum(np.ceil(xy[..., 1].min(axis=1) - 0.5), 0).astype(np.int64)
+    y1 = np.minimum(np.floor(xy[..., 1].max(axis=1) - 0.5), fb.height - 1).astype(np.int64)
+    rows = y1 - y0 + 1
+
+    visible = (np.abs(area) > 1e-12) & (x1 >= x0) & (rows > 0) & np.all(np.isfinite(depth), axis=1)
+    tri = np.nonzero(visible)[0]
+    if len(tri) == 0:
+        return
+
+    # Строки всех треугольников
+    rows = rows[tri]
+    t = np.repeat(tri, rows)
+    py = y0[t] + np.arange(rows.sum()) - np.repeat(np.cumsum(rows) - rows, rows)
+    x_lo, x_hi = _row_spans(xy[t], np.sign(area[t]), py + 0.5)
+    x_lo = np.maximum(x_lo, x0[t])
+    x_hi = np.minimum(x_hi, x1[t])
+    span = np.maximum(x_hi - x_lo + 1, 0)
+    nonempty = span > 0
+    t, py, x_lo, span = t[nonempty], py[nonempty], x_lo[nonempty], span[nonempty]
+
+    # Плоскость глубины каждого треугольника: z = p0 + p1 * x + p2 * y
+    d1 = depth[:, 1] - depth[:, 0]
+    d2 = depth[:, 2] - depth[:, 0]
+    e1 = b - a
+    e2 = c - a
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p1 = (d1 * e2[:, 1] - e1[:, 1] * d2) / area
+        p2 = (e1[:, 0] * d2 - d1 * e2[:, 0]) / area
+    planes = np.stack([depth[:, 0] - p1 * a[:, 0] - p2 * a[:, 1], p1, p2], axis=1)
+
+    # Порции строк с ограниченным суммарным числом пикселей
+    cumulative = np.cumsum(span)
+    start = 0
+    while start < len(t):
+        limit = (cumulative[start - 1] if start else 0) + CHUNK_PIXELS
+        stop = max(int(np.searchsorted(cumulative, limit, side='right')), start + 1)
+        _rasterize_chunk(fb, t[start:stop], py[start:stop], x_lo[start:stop], span[start:stop],
+                         planes, xy, area, ids, attributes)
+        start = stop
+
+
+def _row_spans(corners: np.ndarray, sign: np.ndarray, cy: np.ndarray):
+    """
+    Диапазон номеров пикселей [x_lo, x_hi] строки с центром cy внутри треугольника.
+
+    Функция ребра (p, q) на строке линейна по x: E(x) = k + m * x. Центр пикселя
+    внутри, если sign * E >= 0 для всех трёх рёбер - это даёт до трёх границ по x.
+    """
+    lo = np.full(len(cy), -np.inf)
+    hi = np.full(len(cy), np.inf)
+    empty = np.zeros(len(cy), dtype=bool)
+    for p, q in ((1, 2), (2, 0), (0, 1)):
+        px, py = corners[:, p, 0], corners[:, p, 1]
+        qx, qy = corners[:, q, 0], corners[:, q, 1]
+        m = (py - qy) * sign
+        k = (px * (qy - cy) - qx * (py - cy)) * sign
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bound = -k / m
+        lo = np.where(m > 0, np.maximum(lo, bound), lo)
+        hi = np.where(m < 0, np.minimum(hi, bound), hi)
+        empty |= (m == 0) & (k < 0)
+    x_lo = np.ceil(np.maximum(lo, -1.0) - 0.5)
+    x_hi = np.floor(np.minimum(hi, 1e9) - 0.5)
+    x_hi[empty] = x_lo[empty] - 1
+    return x_lo.astype(np.int64), x_hi.astype(np.int64)
+
+
+def _rasterize_chunk(fb, t, py, x_lo, span, planes, xy, area, ids, attributes):
+    total = span.sum()
+    owner = np.repeat(np.arange(len(t)), span)
+    px = x_lo[owner] + np.arange(total) - np.repeat(np.cumsum(span) - span, span)
+
+    # Глубина линейна по экрану: на строке z = row_z + slope * x
+    row_z = planes[t, 0] + planes[t, 2] * (py + 0.5)
+    slope = planes[t, 1]
+    z = row_z[owner] + slope[owner] * (px + 0.5)
+    pixel = py[owner] * fb.width + px
+
+    # Пиксели с единственным кандидатом пишутся сразу; сортировка нужна только для остальных
+    counts = np.bincount(pixel, minlength=fb.width * fb.height)
+    single = counts[pixel] == 1
+    if single.all():
+        keep = np.arange(total)
+    else:
+        shared = np.flatnonzero(~single)
+        order = shared[np.lexsort((z[shared], pixel[shared]))]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = pixel[order[1:]] != pixel[order[:-1]]
+        keep = np.concatenate([np.flatnonzero(single), order[first]])
+    pixel, z = pixel[keep], z[keep]
+
+    flat_depth = fb.depth.reshape(-1)
+    closer = z < flat_depth[pixel]
+    keep, pixel = keep[closer], pixel[closer]
+    flat_depth[pixel] = z[closer]
+    tk = t[owner[keep]]
+    fb.face_id.reshape(-1)[pixel] = ids[tk]
+
+    if attributes is not None:
+        # Барицентрические координаты только для записанных пикселей
+        cx = px[keep] + 0.5
+        cy = py[owner[keep]] + 0.5
+        a, b, c = xy[tk, 0], xy[tk, 1], xy[tk, 2]
+        inv_area = 1.0 / area[tk]
+        l0 = ((b[:, 0] - cx) * (c[:, 1] - cy) - (b[:, 1] - cy) * (c[:, 0] - cx)) * inv_area
+        l1 = ((c[:, 0] - cx) * (a[:, 1] - cy) - (c[:, 1] - cy) * (a[:, 0] - cx)) * inv_area
+        bary = np.stack([l0, l1, 1.0 - l0 - l1], axis=1)
+        values = np.einsum('ij,ijk->ik', bary, attributes[tk])
+        fb.attributes.reshape(-1, fb.attributes.shape[2])[pixel] = values
+
+
+def downsample(image: np.ndarray, factor: int) -> np.ndarray:
+    """
+    Сводит изображение, отрисованное в factor раз крупнее по каждой оси, к исходному
+    размеру: среднее по блокам factor x factor (box-фильтр через reshape).
+    Тип элементов сохраняется (целые округляются).
+    """
+    if factor <= 1:
+        return image
+    h, w = image.shape[0] // factor, image.shape[1] // factor
+    blocks = image[:h * factor, :w * factor].reshape((h, factor, w, factor) + image.shape[2:])
+    mean = blocks.mean(axis=(1, 3))
+    if np.issubdtype(image.dtype, np.integer):
+        return np.rint(mean).astype(image.dtype)
+    return mean.astype(image.dtype)
+
+
+def rasterize_lines(width: int, height: int, p0: np.ndarray, p1: np.ndarray):
+    """
+    Пиксели отрезков p0 -> p1 (массивы (E, 2)) методом DDA, сразу для всех отрезков.
+
+    Отрезки предварительно обрезаются прямоугольником экрана (Лианг - Барски),
+    поэтому число шагов каждого ограничено размером экрана.
+    Возвращает массивы координат x, y закрашиваемых пикселей.
+    """
+    p0 = np.asarray(p0, dtype=np.float64).reshape(-1, 2)
+    p1 = np.asarray(p1, dtype=np.float64).reshape(-1, 2)
+    d = p1 - p0
+    t0 = np.zeros(len(p0))
+    t1 = np.ones(len(p0))
+    outside = ~np.all(np.isfinite(p0) & np.isfinite(p1), axis=1)
+    for p, q in ((-d[:, 0], p0[:, 0]), (d[:, 0], width - 1 - p0[:, 0]),
+                 (-d[:, 1], p0[:, 1]), (d[:, 1], height - 1 - p0[:, 1])):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r = q / p
+        outside |= (p == 0) & (q < 0)
+        t0 = np.where(p < 0, np.maximum(t0, r), t0)
+        t1 = np.where(p > 0, np.minimum(t1, r), t1)
+    keep = ~outside & (t0 <= t1)
+    start = p0[keep] + t0[keep, None] * d[keep]
+    delta = (t1[keep] - t0[keep])[:, None] * d[keep]
+
+    steps = np.ceil(np.abs(delta).max(axis=1) - 1e-9).astype(np.int64)
+    count = steps + 1
+    owner = np.repeat(np.arange(len(start)), count)
+    t = (np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)) / np.maximum(steps, 1)[owner]
+    xy = np.rint(start[owner] + t[:, None] * delta[owner]).astype(np.int64)
+    x = np.clip(xy[:, 0], 0, width - 1)
+    y = np.clip(xy[:, 1], 0, height - 1)
+    return x, y
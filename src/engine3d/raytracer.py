@@ -0,0 +1,230 @@
+import numpy as np
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple, Union
+from .primitives import Object, Point
+from .mesh import Mesh
+from .bvh import BVH
+from .transformations import look_at_matrix
+from . import config
+
+# Размер квадратной плитки изображения, обрабатываемой одним заданием
+TILE_SIZE = 64
+
+# Доля рассеянного света
+AMBIENT = 0.2
+
+
+class RayCamera:
+    """Камера-обскура: положение eye, точка взгляда target, вертикальный угол обзора fov (радианы)."""
+
+    def __init__(self, eye, target, up=(0.0, -1.0, 0.0), fov: float = np.radians(45),
+                 width: int = 640, height: int = 480):
+        self.eye = np.asarray(eye, dtype=float)
+        self.width = width
+        self.height = height
+        self.fov = fov
+        view = look_at_matrix(Point(*eye), Point(*target), Point(*up))
+        self.camera_to_world = np.linalg.inv(view)[:3, :3]
+
+    def rays(self, x0: int, y0: int, x1: int, y1: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Лучи через центры пикселей прямоугольника [x0, x1) x [y0, y1): начала и единичные направления."""
+        scale = np.tan(self.fov / 2)
+        aspect = self.width / self.height
+        ys, xs = np.mgrid[y0:y1, x0:x1]
+        cx = (2 * (xs.reshape(-1) + 0.5) / self.width - 1) * scale * aspect
+        cy = (1 - 2 * (ys.reshape(-1) + 0.5) / self.height) * scale
+        local = np.stack([cx, cy, -np.ones_like(cx)], axis=1)
+        dirs = local @ self.camera_to_world.T
+        dirs /= np.linalg.norm(dirs, axis=1, keepdims=True)
+        return np.broadcast_to(self.eye, dirs.shape), dirs
+
+
+class RayTracer:
+    """
+    Трассировка лучей по сцене из объектов: один BVH над треугольниками всех объектов,
+    плоское затенение по Ламберту и жёсткие тени от точечного источника.
+    """
+
+    def __init__(self, scene: Sequence[Union[Object, Mesh]], light=None, colors=None,
+                 ambient: float = AMBIENT, background=config.BLACK):
+        vertices, triangles, owners = [], [], []
+        offset = 0
+        for index, item in enumerate(scene):
+            mesh = item if isinstance(item, Mesh) else Mesh.from_object(item)
+            vertices.append(np.asarray(mesh.vertices, dtype=float))
+            triangles.append(mesh.triangles() + offset)
+            owners.append(np.full(len(triangles[-1]), index))
+            offset += len(mesh.vertices)
+        self.vertices = np.concatenate(vertices) if vertices else np.zeros((0, 3))
+        self.triangles = np.concatenate(triangles) if triangles else np.zeros((0, 3), dtype=np.int64)
+        self.owner = np.concatenate(owners) if owners else np.zeros(0, dtype=np.int64)
+        self.bvh = BVH(self.vertices, self.triangles)
+
+        corners = self.vertices[self.triangles]
+        normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        length = np.linalg.norm(normals, axis=1, keepdims=True)
+        self.normals = normals / np.where(length > 1e-12, length, 1.0)
+
+        palette = np.array(colors if colors is not None else [config.GRAY], dtype=float)
+        self.colors = palette[np.arange(len(scene)) % len(palette)] if len(scene) else palette
+        self.light = None if light is None else np.asarray(light, dtype=float)
+        self.ambient = ambient
+        self.background = np.asarray(background, dtype=np.uint8)
+
+        extent = np.ptp(self.vertices, axis=0).max() if len(self.vertices) else 1.0
+        # Смещение начала теневого луча от поверхности, чтобы не попадать в свой треугольник
+        self.bias = 1e-4 * max(extent, 1e-9)
+
+    def trace(self, origins: np.ndarray, dirs: np.ndarray, light=None):
+        """
+        Трассирует пакет лучей.
+
+        Returns:
+            depth (R,) - расстояние до попадания (inf при промахе),
+            normals (R, 3) - нормали, повёрнутые к наблюдателю,
+            colors (R, 3) uint8 - освещённый цвет.
+        """
+        light = self.light if light is None else np.asarray(light, dtype=float)
+        t, tri = self.bvh.intersect(origins, dirs)
+        hit = tri >= 0
+        depth = np.where(hit, t, np.inf)
+        normals = np.zeros(dirs.shape)
+        colors = np.empty(dirs.shape, dtype=np.uint8)
+        colors[:] = self.background
+        if not hit.any():
+            return depth, normals, colors
+
+        h_tri = tri[hit]
+        h_dirs = dirs[hit]
+        n = self.normals[h_tri]
+        n = np.where((np.einsum('ij,ij->i', n, h_dirs) > 0)[:, None], -n, n)
+        normals[hit] = n
+        points = origins[hit] + t[hit, None] * h_dirs
+
+        if light is None:
+            # Свет от камеры
+            cos = -np.einsum('ij,ij->i', n, h_dirs)
+            lit = np.ones(len(cos), dtype=bool)
+        else:
+            to_light = light - points
+            distance = np.linalg.norm(to_light, axis=1)
+            to_light /= np.maximum(distance, 1e-12)[:, None]
+            cos = np.einsum('ij,ij->i', n, to_light)
+            lit = cos > 0
+            if lit.any():
+                # Теневые лучи: любое пересечение до источника
+                starts = points[lit] + n[lit] * self.bias
+                lit[lit] = ~self.bvh.occluded(starts, to_light[lit], distance[lit] - self.bias)
+        intensity = self.ambient + (1 - self.ambient) * np.clip(cos, 0, 1) * lit
+        colors[hit] = np.clip(self.colors[self.owner[h_tri]] * intensity[:, None], 0, 255).astype(np.uint8)
+        return depth, normals, colors
+
+    def render_tile(self, camera: RayCamera, x0: int, y0: int, x1: int, y1: int):
+        origins, dirs = camera.rays(x0, y0, x1, y1)
+        depth, normals, colors = self.trace(origins, dirs)
+        h, w = y1 - y0, x1 - x0
+        return depth.reshape(h, w).astype(np.float32), normals.reshape(h, w, 3).astype(np.float32), \
+            colors.reshape(h, w, 3)
+
+
+def tiles(width: int, height: int, size: int = TILE_SIZE) -> List[Tuple[int, int, int, int]]:
+    return [(x, y, min(x + size, width), min(y + size, height))
+            for y in range(0, height, size) for x in range(0, width, size)]
+
+
+# Трассировщик и камера, переданные процессу-исполнителю один раз при запуске
+_worker_state = None
+
+
+def _init_worker(tracer: RayTracer, camera: RayCamera):
+    global _worker_state
+    _worker_state = (tracer, camera)
+
+
+def _render_tile_job(tile):
+    tracer, camera = _worker_state
+    return tile, tracer.render_tile(camera, *tile)
+
+
+def render(tracer: RayTracer, camera: RayCamera, workers: Optional[int] = None, tile_size: int = TILE_SIZE):
+    """
+    Рендерит кадр плитками в пуле процессов.
+
+    Returns:
+        image (H, W, 3) uint8, depth (H, W) float32 (inf - фон), normals (H, W, 3) float32.
+    """
+    w, h = camera.width, camera.height
+    image = np.empty((h, w, 3), dtype=np.uint8)
+    depth = np.empty((h, w), dtype=np.float32)
+    normals = np.empty((h, w, 3), dtype=np.float32)
+    jobs = tiles(w, h, tile_size)
+    workers = workers or os.cpu_count() or 1
+
+    def place(tile, result):
+        x0, y0, x1, y1 = tile
+        depth[y0:y1, x0:x1], normals[y0:y1, x0:x1], image[y0:y1, x0:x1] = result
+
+    if workers == 1:
+        for tile in jobs:
+            place(tile, tracer.render_tile(camera, *tile))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(tracer, camera)) as executor:
+            for tile, result in executor.map(_render_tile_job, jobs, chunksize=4):
+                place(tile, result)
+    return image, depth, normals
+
+
+def depth_image(depth: np.ndarray) -> np.ndarray:
+    """Изображение глубины (ближе - светлее), фон чёрный."""
+    finite = np.isfinite(depth)
+    image = np.zeros(depth.shape + (3,), dtype=np.uint8)
+    if finite.any():
+        near, far = depth[finite].min(), depth[finite].max()
+        value = 1 - (depth[finite] - near) / max(far - near, 1e-12)
+        image[finite] = (55 + 200 * value)[:, None].astype(np.uint8)
+    return image
+
+
+def normal_image(normals: np.ndarray) -> np.ndarray:
+    """Нормали в цвет: компоненты из [-1, 1] в [0, 255]."""
+    return np.clip((normals + 1) * 127.5, 0, 255).astype(np.uint8)
+
+
+if __name__ == '__main__':
+    import argparse
+    import pygame
+    from .object_IO import load_mesh
+
+    parser = argparse.ArgumentParser(description='Трассировка лучей модели')
+    parser.add_argument('model', nargs='?', default=os.path.join(config.MODELS_DIR, 'pot.obj'))
+    parser.add_argument('output', nargs='?', default='raytrace.png')
+    parser.add_argument('--size', default='1920x1080')
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    width, height = map(int, args.size.split('x'))
+    mesh = load_mesh(args.model)
+    lo, hi = mesh.vertices.min(axis=0), mesh.vertices.max(axis=0)
+    center, radius = (lo + hi) / 2, np.linalg.norm(hi - lo) / 2
+
+    # Пол под моделью, чтобы была видна тень (Y модели перевёрнут при загрузке)
+    floor_y = hi[1]
+    floor = Mesh([[center[0] - 4 * radius, floor_y, center[2] - 4 * radius],
+                  [center[0] + 4 * radius, floor_y, center[2] - 4 * radius],
+                  [center[0] + 4 * radius, floor_y, center[2] + 4 * radius],
+                  [center[0] - 4 * radius, floor_y, center[2] + 4 * radius]], [[0, 1, 2, 3]])
+    eye = center + radius * np.array([1.2, -1.2, 2.5])
+    light = center + radius * np.array([-2.0, -4.0, 2.0])
+    tracer = RayTracer([mesh, floor], light, colors=[config.ORANGE, config.GRAY])
+    camera = RayCamera(eye, center, width=width, height=height)
+
+    start = time.perf_counter()
+    image, depth, normals = render(tracer, camera, args.workers)
+    print(f"Кадр {width}x{height} за {time.perf_counter() - start:.2f} с")
+
+    base = os.path.splitext(args.output)[0]
+    for suffix, data in (('', image), ('_depth', depth_image(depth)), ('_normals', normal_image(normals))):
+        pygame.image.save(pygame.surfarray.make_surface(data.swapaxes(0, 1)), base + suffix + '.png')
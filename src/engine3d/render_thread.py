@@ -0,0 +1,148 @@
+import threading
+import numpy as np
+from typing import Callable, Iterable, Optional, Tuple
+from . import config
+from .mesh import Mesh
+from .primitives import Object
+from .z_buffer_renderer import render_mesh, render_mesh_progressive
+
+
+class SceneSnapshot:
+    """
+    Неизменяемый снимок сцены для кадра: копия координат вершин, грани объекта,
+    матрицы камеры и параметры изображения. Массивы только для чтения, поэтому
+    поток рендера может работать со снимком, пока UI меняет сам объект.
+    """
+
+    def __init__(self, vertices: np.ndarray, faces: np.ndarray, view_matrix, projection_matrix,
+                 width: int, height: int, color=config.GRAY, background=config.BLACK, samples: int = 1):
+        self.vertices = _frozen(vertices)
+        self.faces = _frozen(faces)
+        self.view_matrix = _frozen(view_matrix)
+        self.projection_matrix = _frozen(projection_matrix)
+        self.width = width
+        self.height = height
+        self.color = tuple(color)
+        self.background = tuple(background)
+        self.samples = samples
+
+    @staticmethod
+    def from_object(obj: Object, view_matrix, projection_matrix, width: int, height: int,
+                    **options) -> 'SceneSnapshot':
+        """Снимок объекта с учётом ещё не применённых преобразований (объект не изменяется)."""
+        return SceneSnapshot(obj.vertex_array(), obj.face_array(), view_matrix, projection_matrix,
+                             width, height, **options)
+
+    def matches(self, other: Optional['SceneSnapshot']) -> bool:
+        """Снимки дают одинаковый кадр (можно не отправлять повторно)."""
+        if other is None:
+            return False
+        return (self.width, self.height, self.color, self.background, self.samples) == \
+            (other.width, other.height, other.color, other.background, other.samples) and \
+            np.array_equal(self.view_matrix, other.view_matrix) and \
+            np.array_equal(self.projection_matrix, other.projection_matrix) and \
+            np.array_equal(self.faces, other.faces) and np.array_equal(self.vertices, other.vertices)
+
+    def render(self) -> np.ndarray:
+        """Кадр (H, W, 3) uint8 через Z-буфер."""
+        return render_mesh(Mesh(self.vertices, self.faces), self.view_matrix, self.projection_matrix,
+                           self.width, self.height, self.color, self.background,
+                           samples=self.samples, msaa=True)
+
+    def render_progressive(self) -> Iterable[np.ndarray]:
+        """Кадры растущего качества (см. render_mesh_progressive); последний - как render()."""
+        return render_mesh_progressive(Mesh(self.vertices, self.faces), self.view_matrix, self.projection_matrix,
+                                       self.width, self.height, self.color, self.background,
+                                       samples=self.samples)
+
+
+def _frozen(array) -> np.ndarray:
+    """Копия массива, защищённая от записи (массивы только для чтения не копируются)."""
+    array = np.asarray(array)
+    if array.flags.writeable:
+        array = array.copy()
+        array.setflags(write=False)
+    return array
+
+
+class RenderThread(threading.Thread):
+    """
+    Фоновый поток рендера.
+
+    UI отправляет снимки через submit(); поток берёт самый свежий снимок
+    (необработанные промежуточные заменяются), рисует его в задний буфер и
+    меняет буферы местами. latest() сразу возвращает последний готовый кадр,
+    поэтому цикл событий не ждёт, пока кадр считается.
+
+    render возвращает кадры снимка по мере уточнения (по умолчанию - прогрессивный
+    рендер): каждый публикуется сразу, а новый снимок прерывает уточнение старого.
+
+    Используется поток, а не процесс: снимок не нужно сериализовать, а NumPy
+    отпускает GIL на больших массивах, и цикл UI продолжает работать.
+    """
+
+    def __init__(self, render: Callable[[SceneSnapshot], Iterable[np.ndarray]] = SceneSnapshot.render_progressive):
+        super().__init__(daemon=True, name="render")
+        self._render = render
+        self._condition = threading.Condition()
+        self._pending: Optional[SceneSnapshot] = None
+        self._running = True
+        # Двойной буфер: front - показываемый кадр, back - последний отрисованный поверх него
+        self._front: Optional[np.ndarray] = None
+        self._back: Optional[np.ndarray] = None
+        self._published = 0
+        self._complete = False
+        self._error: Optional[Exception] = None
+
+    def submit(self, snapshot: SceneSnapshot):
+        """Ставит снимок в очередь вместо ещё не начатого и прерывает уточнение текущего."""
+        with self._condition:
+            self._pending = snapshot
+            self._condition.notify()
+
+    def latest(self) -> Tuple[Optional[np.ndarray], int, bool]:
+        """
+        Последний готовый кадр (или None), номер публикации (растёт с каждым кадром
+        и уточнением) и признак того, что кадр последнего снимка окончательный.
+        """
+        with self._condition:
+            return self._front, self._published, self._complete and self._pending is None
+
+    def error(self) -> Optional[Exception]:
+        """Исключение, прервавшее рендер последнего снимка (None, если он отрисован или еще считается)."""
+        with self._condition:
+            return self._error
+
+    def stop(self):
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+
+    def run(self):
+        while True:
+            with self._condition:
+                while self._running and self._pending is None:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                snapshot = self._pending
+                self._pending = None
+                self._complete = False
+                self._error = None
+            try:
+                for frame in self._render(snapshot):
+                    self._back = frame
+                    with self._condition:
+                        self._front, self._back = self._back, self._front
+                        self._published += 1
+                        if self._pending is not None or not self._running:
+                            break
+                else:
+                    with self._condition:
+                        self._complete = True
+            except Exception as e:
+                print(f"Ошибка рендера кадра: {e}")
+                # Снимок больше не уточняется: кадр окончательный, а ошибку показывает UI
+                with self._condition:
+                    self._complete = True
+                    self._error = e
@@ -0,0 +1,20 @@
+from .primitives import *
+from .transformations import *
+
+
+def create_rotation_figure(profile_points: List[Point], axis: str, divisions: int,
+                           caps: bool = False) -> Object:
+    """
+    Создание фигуры вращения
+    profile_points: точки образующей
+    axis: ось вращения ('X', 'Y' или 'Z')
+    divisions: количество разбиений
+    caps: закрыть торцы (если конец образующей не лежит на оси)
+    """
+    # Импорт здесь: rotation_shape импортирует create_test_models, а тот - этот модуль
+    from .rotation_shape import revolution_mesh
+
+    if len(profile_points) < 2:
+        return Object()
+    profile = np.array([[p.x, p.y, p.z] for p in profile_points], dtype=float)
+    return revolution_mesh(profile, divisions, axis, caps).to_object()
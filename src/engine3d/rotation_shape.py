@@ -0,0 +1,97 @@
+import pygame
+from .primitives import *
+from .create_test_models import *
+from datetime import datetime
+from .object_IO import *
+from .D3Renderer import *
+import os
+import math
+from .plot import Plot
+from .transformations import rotation_matrices
+from .mesh import Mesh, clean_mesh
+from . import config
+import re
+
+test_string = "(0, 0) (100, 100) (150, 50) (200, 100)"  # тестовая строка
+
+# ===== ТОчки из строки =====
+
+def get_dots_from_string(coords_string=test_string):
+    pattern = r'\(([^,]+),([^)]+)\)'
+    matches = re.findall(pattern, coords_string)
+    
+    points = []
+    for x_str, y_str in matches:
+        x = float(x_str.strip())
+        y = float(y_str.strip())
+        points.append([x, y])
+    
+    return points
+
+# ====== Создание фигуры вращения
+
+def revolution_mesh(profile, segments: int, axis: str = 'X', caps: bool = False) -> Mesh:
+    """
+    Строит сетку фигуры вращения без циклов по точкам.
+
+    Вся сетка вершин (сегменты x точки профиля) получается одним einsum,
+    индексы четырёхугольников - арифметикой с замыканием шва по модулю.
+
+    Args:
+        profile: Точки образующей, массив (P, 2) или (P, 3); 2D-точки лежат в плоскости z = 0.
+        segments: Количество разбиений по углу.
+        axis: Ось вращения ('X', 'Y' или 'Z').
+        caps: Закрыть торцы веером треугольников (если конец профиля не лежит на оси).
+    """
+    profile = np.asarray(profile, dtype=float)
+    if profile.shape[1] == 2:
+        profile = np.column_stack([profile, np.zeros(len(profile))])
+    n = len(profile)
+    if n < 2 or segments < 1:
+        return Mesh()
+
+    angles = 2 * np.pi * np.arange(segments) / segments
+    grid = np.einsum('sij,pj->spi', rotation_matrices(axis, angles)[:, :3, :3], profile)
+    vertices = grid.reshape(-1, 3)
+
+    s = np.arange(segments)[:, None]
+    s_next = (s + 1) % segments
+    p = np.arange(n - 1)[None, :]
+    faces = np.stack([s * n + p, s * n + p + 1, s_next * n + p + 1, s_next * n + p], axis=-1)
+    faces = faces.reshape(-1, 4)
+
+    if caps:
+        axis_index = 'XYZ'.index(axis)
+        vertices = [vertices]
+        cap_faces = []
+        for end, reverse in ((0, False), (n - 1, True)):
+            radius = np.hypot(*np.delete(profile[end], axis_index))
+            if radius < 1e-9:
+                continue
+            center = np.zeros(3)
+            center[axis_index] = profile[end, axis_index]
+            c = sum(len(v) for v in vertices)
+            vertices.append(center[None, :])
+            ring, ring_next = s[:, 0] * n + end, s_next[:, 0] * n + end
+            if reverse:
+                ring, ring_next = ring_next, ring
+            cap_faces.append(np.stack([np.full(segments, c), ring, ring_next, np.full(segments, -1)], axis=1))
+        vertices = np.concatenate(vertices)
+        faces = np.concatenate([faces] + cap_faces)
+
+    return Mesh(vertices, faces)
+
+
+def create_solid_of_revolution(dots, iterations, weld=False, caps=False):
+    """
+    Фигура вращения профиля dots вокруг оси X.
+
+    Шов не дублируется; weld дополнительно убирает вырожденные грани
+    у точек профиля, лежащих на оси.
+    """
+    if len(dots) < 2:
+        return Object()
+    mesh = revolution_mesh(dots, iterations, 'X', caps)
+    if weld:
+        mesh = clean_mesh(mesh, config.WELD_TOLERANCE)
+    return mesh.to_object()
@@ -1,4 +1,4 @@
-from primitives import *
+from .primitives import *
 
 def create_surface(func, x_range: Tuple[float, float], y_range: Tuple[float, float],
                    x_divisions: int, y_divisions: int) -> Object:
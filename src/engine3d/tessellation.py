@@ -0,0 +1,223 @@
+import numpy as np
+from .mesh import Mesh
+from typing import Callable, Tuple
+
+
+def evaluate(f: Callable, *grids):
+    """
+    Вычисляет f сразу на массивах координат.
+    Если f не векторизуется (например, использует math), считает поэлементно.
+    """
+    try:
+        return f(*grids)
+    except (TypeError, ValueError):
+        return np.vectorize(f)(*grids)
+
+
+def grid_faces(nu: int, nv: int, closed_u: bool = False, closed_v: bool = False) -> np.ndarray:
+    """Индексы четырёхугольников регулярной сетки nu x nv (вершина (i, j) имеет номер i * nv + j)."""
+    i = np.arange(nu if closed_u else nu - 1)[:, None]
+    j = np.arange(nv if closed_v else nv - 1)[None, :]
+    i_next = (i + 1) % nu
+    j_next = (j + 1) % nv
+    faces = np.stack(np.broadcast_arrays(i * nv + j, i_next * nv + j,
+                                         i_next * nv + j_next, i * nv + j_next), axis=-1)
+    return faces.reshape(-1, 4)
+
+
+def _curvature_samples(points: np.ndarray, n: int, axis: int, uniform_weight: float) -> np.ndarray:
+    """
+    Новые значения параметра (доли от 0 до 1) вдоль оси axis сетки точек:
+    плотность пропорциональна углу поворота линий сетки (оценка кривизны).
+    """
+    p = np.moveaxis(points, axis, 0)
+    d = np.diff(p, axis=0)
+    length = np.linalg.norm(d, axis=-1)
+    unit = d / np.where(length > 1e-12, length, 1.0)[..., None]
+    turn = np.arccos(np.clip(np.sum(unit[1:] * unit[:-1], axis=-1), -1.0, 1.0))
+    # Поворот в узле делим между двумя соседними отрезками и усредняем по второй оси
+    bend = np.zeros(d.shape[:-1])
+    bend[1:] += turn / 2
+    bend[:-1] += turn / 2
+    bend = bend.mean(axis=tuple(range(1, bend.ndim)))
+    density = uniform_weight * bend.mean() + bend if bend.sum() > 1e-12 else np.ones_like(bend)
+    cdf = np.concatenate([[0.0], np.cumsum(density)])
+    cdf /= cdf[-1]
+    coarse = np.linspace(0.0, 1.0, len(cdf))
+    return np.interp(np.linspace(0.0, 1.0, n), cdf, coarse)
+
+
+def parametric_mesh(f: Callable, u_range: Tuple[float, float], v_range: Tuple[float, float],
+                    nu: int, nv: int, closed_u: bool = False, closed_v: bool = False,
+                    adaptive: bool = False, uniform_weight: float = 0.5) -> Mesh:
+    """
+    Тесселяция параметрической поверхности (u, v) -> (x, y, z).
+
+    Args:
+        f: Функция f(u, v), возвращающая тройку (x, y, z); вызывается сразу на сетке.
+        u_range, v_range: Диапазоны параметров.
+        nu, nv: Количество точек по u и v.
+        closed_u, closed_v: Поверхность замкнута по параметру (тор, сфера по долготе):
+            последняя точка диапазона не дублируется, шов замыкается гранями.
+        adaptive: Распределить точки по кривизне - чаще там, где поверхность изгибается,
+            реже на плоских участках (при том же количестве треугольников).
+        uniform_weight: Доля равномерной плотности при adaptive (чтобы плоские участки не пустели).
+    """
+    def samples(rng, n, closed, t=None):
+        t = np.linspace(0.0, 1.0, n, endpoint=not closed) if t is None else t
+        return rng[0] + (rng[1] - rng[0]) * t
+
+    def surface(u, v):
+        uu, vv = np.meshgrid(u, v, indexing='ij')
+        xyz = np.broadcast_arrays(uu, *evaluate(f, uu, vv))[1:]
+        return np.stack(xyz, axis=-1).astype(float)
+
+    u = samples(u_range, nu, closed_u)
+    v = samples(v_range, nv, closed_v)
+    if adaptive:
+        # Оценка кривизны по грубой сетке, затем перераспределение параметров
+        coarse = surface(samples(u_range, max(nu // 2, 3), False), samples(v_range, max(nv // 2, 3), False))
+        t_u = _curvature_samples(coarse, nu + int(closed_u), 0, uniform_weight)
+        t_v = _curvature_samples(coarse, nv + int(closed_v), 1, uniform_weight)
+        u = samples(u_range, nu, closed_u, t_u[:nu])
+        v = samples(v_range, nv, closed_v, t_v[:nv])
+
+    vertices = surface(u, v).reshape(-1, 3)
+    return Mesh(vertices, grid_faces(nu, nv, closed_u, closed_v))
+
+
+def height_field_mesh(f: Callable, x_range: Tuple[float, float], y_range: Tuple[float, float],
+                      nx: int, ny: int, adaptive: bool = False) -> Mesh:
+    """Поверхность z = f(x, y) как частный случай параметрической."""
+    return parametric_mesh(lambda x, y: (x, y, f(x, y)), x_range, y_range, nx, ny, adaptive=adaptive)
+
+
+# ===== Marching tetrahedra =====
+
+# Вершины куба: номер -> смещение (x, y, z)
+_CUBE_CORNERS = np.array([
+    [0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+    [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]
+])
+
+# Разбиение куба на 6 тетраэдров вокруг диагонали 0-6. Все кубы делятся одинаково,
+# поэтому диагонали на общих гранях соседних кубов совпадают и поверхность без щелей.
+_CUBE_TETS = np.array([
+    [0, 5, 1, 6], [0, 1, 2, 6], [0, 2, 3, 6],
+    [0, 3, 7, 6], [0, 7, 4, 6], [0, 4, 5, 6]
+])
+
+
+def _build_tet_table() -> np.ndarray:
+    """
+    Таблица случаев тетраэдра: для каждой из 16 масок "внутри" - до двух треугольников,
+    каждый из трёх рёбер (внутренняя вершина, внешняя вершина). Пустые места - -1.
+    """
+    table = np.full((16, 2, 3, 2), -1, dtype=np.int64)
+    for case in range(16):
+        inside = [k for k in range(4) if case >> k & 1]
+        outside = [k for k in range(4) if not case >> k & 1]
+        if len(inside) == 1:
+            a = inside[0]
+            table[case, 0] = [[a, b] for b in outside]
+        elif len(inside) == 3:
+            b = outside[0]
+            table[case, 0] = [[a, b] for a in inside]
+        elif len(inside) == 2:
+            (a, b), (c, d) = inside, outside
+            table[case, 0] = [[a, c], [a, d], [b, d]]
+            table[case, 1] = [[a, c], [b, d], [b, c]]
+    return table
+
+
+_TET_TABLE = _build_tet_table()
+
+
+def implicit_mesh(F: Callable, bounds: Tuple[Tuple[float, float], Tuple[float, float], Tuple[float, float]],
+                  resolution, level: float = 0.0, slab: int = 16) -> Mesh:
+    """
+    Извлекает поверхность F(x, y, z) = level векторизованным методом marching tetrahedra.
+
+    Поле вычисляется на равномерной сетке одним вызовом, затем кубы обрабатываются
+    слоями по оси X (slab слоёв за раз), чтобы ограничить память. Общие вершины
+    соседних треугольников свариваются по ключу ребра сетки. Нормали направлены
+    в сторону возрастания F.
+
+    Args:
+        F: Скалярное поле F(x, y, z), вызывается сразу на трёхмерных массивах.
+        bounds: ((x0, x1), (y0, y1), (z0, z1)) - область выборки.
+        resolution: Количество точек по каждой оси (число или тройка).
+        level: Уровень изоповерхности.
+        slab: Количество слоёв кубов, обрабатываемых за раз.
+    """
+    res = np.broadcast_to(np.asarray(resolution, dtype=np.int64), (3,))
+    axes = [np.linspace(b[0], b[1], n) for b, n in zip(bounds, res)]
+    X, Y, Z = np.meshgrid(*axes, indexing='ij')
+    field = np.broadcast_to(evaluate(F, X, Y, Z), X.shape).astype(float) - level
+    nx, ny, nz = field.shape
+    flat_field = field.reshape(-1)
+
+    # Номера вершин тетраэдров куба относительно его угла в плоском индексе сетки
+    corner_offsets = _CUBE_CORNERS @ np.array([ny * nz, nz, 1])
+    tet_offsets = corner_offsets[_CUBE_TETS]
+
+    keys_parts, t_parts, edge_parts = [], [], []
+    cj, ck = np.meshgrid(np.arange(ny - 1), np.arange(nz - 1), indexing='ij')
+    for i0 in range(0, nx - 1, slab):
+        ci = np.arange(i0, min(i0 + slab, nx - 1))
+        base = (ci[:, None, None] * ny * nz + cj * nz + ck).reshape(-1)
+        tets = base[:, None, None] + tet_offsets[None]            # (кубы, 6, 4)
+        tets = tets.reshape(-1, 4)
+        inside = flat_field[tets] < 0
+        case = inside @ np.array([1, 2, 4, 8])
+        active = (case != 0) & (case != 15)
+        tets, case = tets[active], case[active]
+
+        rows = _TET_TABLE[case]                                    # (T, 2, 3, 2)
+        valid = rows[:, :, 0, 0] >= 0
+        tet_index = np.broadcast_to(np.arange(len(tets))[:, None], valid.shape)[valid]
+        edges = rows[valid]                                        # (tri, 3, 2) в локальных номерах
+        g = tets[tet_index[:, None, None], edges]                  # глобальные номера вершин рёбер
+        fa, fb = flat_field[g[..., 0]], flat_field[g[..., 1]]
+        keys_parts.append(np.minimum(g[..., 0], g[..., 1]) * flat_field.size + np.maximum(g[..., 0], g[..., 1]))
+        t_parts.append(fa / (fa - fb))
+        edge_parts.append(g)
+
+    if not keys_parts:
+        return Mesh()
+    keys = np.concatenate(keys_parts)
+    if len(keys) == 0:
+        return Mesh()
+    t = np.concatenate(t_parts)
+    g = np.concatenate(edge_parts)
+
+    points = np.stack([X.reshape(-1), Y.reshape(-1), Z.reshape(-1)], axis=1)
+    pa, pb = points[g[..., 0]], points[g[..., 1]]
+    positions = pa + t[..., None] * (pb - pa)
+
+    # Треугольник ориентируем так, чтобы нормаль смотрела от внутренней вершины к внешней
+    normal = np.cross(positions[:, 1] - positions[:, 0], positions[:, 2] - positions[:, 0])
+    flip = np.einsum('ij,ij->i', normal, pb[:, 0] - pa[:, 0]) < 0
+    keys[flip] = keys[flip][:, ::-1]
+    positions[flip] = positions[flip][:, ::-1]
+
+    unique_keys, first, inverse = np.unique(keys.reshape(-1), return_index=True, return_inverse=True)
+    vertices = positions.reshape(-1, 3)[first]
+    faces = inverse.reshape(-1, 3)
+    # Треугольники, выродившиеся в точку (поле ровно на уровне в вершинах сетки), отбрасываем
+    good = (faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 0] != faces[:, 2])
+    return Mesh(vertices, faces[good])
+
+
+if __name__ == '__main__':
+    import os
+    from . import config
+    from .object_IO import save_obj
+
+    torus = parametric_mesh(
+        lambda u, v: ((1 + 0.4 * np.cos(v)) * np.cos(u), 0.4 * np.sin(v), (1 + 0.4 * np.cos(v)) * np.sin(u)),
+        (0, 2 * np.pi), (0, 2 * np.pi), 48, 24, closed_u=True, closed_v=True)
+    save_obj(torus.to_object(), os.path.join(config.MODELS_DIR, 'torus.obj'))
+
+    sphere = implicit_mesh(lambda x, y, z: x * x + y * y + z * z, ((-1.2, 1.2),) * 3, 40, level=1.0)
+    save_obj(sphere.to_object(), os.path.join(config.MODELS_DIR, 'implicit_sphere.obj'))
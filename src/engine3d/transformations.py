@@ -0,0 +1,221 @@
+import numpy as np
+from .primitives import *
+
+
+# Тип элементов матриц по умолчанию; np.float32 - быстрый путь для больших пакетов
+DEFAULT_DTYPE = np.float64
+
+
+# ===== Пакетные матрицы (N, 4, 4) =====
+
+def _identity_stack(n: int, dtype) -> np.ndarray:
+    m = np.zeros((n, 4, 4), dtype=dtype)
+    m[:, [0, 1, 2, 3], [0, 1, 2, 3]] = 1
+    return m
+
+
+def translation_matrices(offsets, dtype=DEFAULT_DTYPE) -> np.ndarray:
+    """Стек матриц переноса по массиву смещений (N, 3)."""
+    offsets = np.asarray(offsets, dtype=dtype).reshape(-1, 3)
+    m = _identity_stack(len(offsets), dtype)
+    m[:, :3, 3] = offsets
+    return m
+
+
+def scale_matrices(factors, dtype=DEFAULT_DTYPE) -> np.ndarray:
+    """Стек матриц масштабирования по массиву коэффициентов (N, 3)."""
+    factors = np.asarray(factors, dtype=dtype).reshape(-1, 3)
+    m = _identity_stack(len(factors), dtype)
+    m[:, [0, 1, 2], [0, 1, 2]] = factors
+    return m
+
+
+def rotation_matrices(axis: str, angles, dtype=DEFAULT_DTYPE) -> np.ndarray:
+    """Стек матриц поворота вокруг оси 'X', 'Y' или 'Z' по массиву углов (N,)."""
+    angles = np.asarray(angles, dtype=dtype).reshape(-1)
+    c, s = np.cos(angles), np.sin(angles)
+    i, j = {'X': (1, 2), 'Y': (2, 0), 'Z': (0, 1)}[axis]
+    m = _identity_stack(len(angles), dtype)
+    m[:, i, i] = c
+    m[:, i, j] = -s
+    m[:, j, i] = s
+    m[:, j, j] = c
+    return m
+
+
+def axis_angle_matrices(axes, angles, dtype=DEFAULT_DTYPE) -> np.ndarray:
+    """Стек матриц поворота вокруг осей (N, 3) на углы (N,) через origin (формула Родрига)."""
+    axes = np.asarray(axes, dtype=dtype).reshape(-1, 3)
+    angles = np.asarray(angles, dtype=dtype).reshape(-1)
+    axes = axes / np.linalg.norm(axes, axis=1, keepdims=True)
+    c, s = np.cos(angles)[:, None, None], np.sin(angles)[:, None, None]
+    x, y, z = axes[:, 0], axes[:, 1], axes[:, 2]
+    zero = np.zeros_like(x)
+    cross = np.stack([np.stack([zero, -z, y], -1),
+                      np.stack([z, zero, -x], -1),
+                      np.stack([-y, x, zero], -1)], axis=1)
+    outer = axes[:, :, None] * axes[:, None, :]
+    m = _identity_stack(len(axes), dtype)
+    m[:, :3, :3] = c * np.eye(3, dtype=dtype) + s * cross + (1 - c) * outer
+    return m
+
+
+def compose(*matrices) -> np.ndarray:
+    """
+    Композиция преобразований: compose(A, B, C) = A @ B @ C (сначала применяется C).
+    Аргументы могут быть одиночными матрицами (4, 4) или стеками (N, 4, 4) -
+    стеки перемножаются поэлементно с broadcasting.
+    """
+    result = matrices[-1]
+    for m in reversed(matrices[:-1]):
+        result = np.matmul(m, result)
+    return result
+
+
+def transform_points(matrices, points) -> np.ndarray:
+    """
+    Применяет матрицу (4, 4) или стек (M, 4, 4) к точкам (N, 3).
+    Возвращает (N, 3) или (M, N, 3) соответственно (без деления на w).
+    """
+    matrices = np.asarray(matrices)
+    points = np.asarray(points)
+    return np.einsum('...ij,nj->...ni', matrices[..., :3, :3], points) + matrices[..., None, :3, 3]
+
+
+# ===== Матрицы камеры =====
+
+def look_at_matrix(eye: Point, target: Point, up: Point, dtype=DEFAULT_DTYPE) -> np.ndarray:
+    """Создает матрицу вида (view matrix)."""
+    # Вектор взгляда (вперед)
+    z_axis = np.array([eye.x - target.x, eye.y - target.y, eye.z - target.z], dtype=float)
+    z_axis /= np.linalg.norm(z_axis)
+
+    # Вектор "вправо"
+    up_vec = np.array([up.x, up.y, up.z], dtype=float)
+    x_axis = np.cross(up_vec, z_axis)
+    x_axis /= np.linalg.norm(x_axis)
+
+    # Вектор "вверх"
+    y_axis = np.cross(z_axis, x_axis)
+
+    # Матрица перехода в новую систему координат (камеры)
+    rotation = np.identity(4, dtype=dtype)
+    rotation[0, :3] = x_axis
+    rotation[1, :3] = y_axis
+    rotation[2, :3] = z_axis
+
+    # Матрица смещения (чтобы камера была в начале координат)
+    translation = translation_matrix(-eye.x, -eye.y, -eye.z, dtype)
+
+    return rotation @ translation
+
+
+def perspective_matrix(fov: float, aspect: float, near: float, far: float, dtype=DEFAULT_DTYPE) -> np.ndarray:
+    """
+    Матрица перспективной проекции (камера смотрит вдоль -Z, как после look_at_matrix).
+    fov - вертикальный угол обзора в радианах, aspect - отношение ширины к высоте.
+    """
+    f = 1.0 / np.tan(fov / 2)
+    m = np.zeros((4, 4), dtype=dtype)
+    m[0, 0] = f / aspect
+    m[1, 1] = f
+    m[2, 2] = (far + near) / (near - far)
+    m[2, 3] = 2 * far * near / (near - far)
+    m[3, 2] = -1
+    return m
+
+
+def orthographic_matrix(left: float, right: float, bottom: float, top: float, near: float, far: float,
+                        dtype=DEFAULT_DTYPE) -> np.ndarray:
+    """Матрица ортографической проекции объёма [left, right] x [bottom, top] x [-far, -near]."""
+    m = np.identity(4, dtype=dtype)
+    m[0, 0] = 2 / (right - left)
+    m[1, 1] = 2 / (top - bottom)
+    m[2, 2] = -2 / (far - near)
+    m[0, 3] = -(right + left) / (right - left)
+    m[1, 3] = -(top + bottom) / (top - bottom)
+    m[2, 3] = -(far + near) / (far - near)
+    return m
+
+
+# ===== Матрицы преобразований =====
+
+def translation_matrix(dx: float, dy: float, dz: float, dtype=DEFAULT_DTYPE) -> np.ndarray:
+    """Матрица переноса"""
+    return translation_matrices([dx, dy, dz], dtype)[0]
+
+
+def scale_matrix(sx: float, sy: float, sz: float, dtype=DEFAULT_DTYPE) -> np.ndarray:
+    """Матрица масштабирования"""
+    return scale_matrices([sx, sy, sz], dtype)[0]
+
+
+def rotation_x_matrix(angle: float, dtype=DEFAULT_DTYPE) -> np.ndarray:
+    """Матрица поворота вокруг оси X"""
+    return rotation_matrices('X', angle, dtype)[0]
+
+
+def rotation_y_matrix(angle: float, dtype=DEFAULT_DTYPE) -> np.ndarray:
+    """Матрица поворота вокруг оси Y"""
+    return rotation_matrices('Y', angle, dtype)[0]
+
+
+def rotation_z_matrix(angle: float, dtype=DEFAULT_DTYPE) -> np.ndarray:
+    """Матрица поворота вокруг оси Z"""
+    return rotation_matrices('Z', angle, dtype)[0]
+
+
+def reflection_xy_matrix(dtype=DEFAULT_DTYPE) -> np.ndarray:
+    """Отражение относительно плоскости XY"""
+    return scale_matrix(1, 1, -1, dtype)
+
+
+def reflection_xz_matrix(dtype=DEFAULT_DTYPE) -> np.ndarray:
+    """Отражение относительно плоскости XZ"""
+    return scale_matrix(1, -1, 1, dtype)
+
+
+def reflection_yz_matrix(dtype=DEFAULT_DTYPE) -> np.ndarray:
+    """Отражение относительно плоскости YZ"""
+    return scale_matrix(-1, 1, 1, dtype)
+
+
+def scale_relative_to_center(obj: Object, sx: float, sy: float, sz: float):
+    """Масштабирование относительно центра объекта"""
+    center = obj.get_center()
+
+    # Перенос в начало координат, масштабирование, перенос обратно
+    matrix = compose(
+        translation_matrix(center.x, center.y, center.z),
+        scale_matrix(sx, sy, sz),
+        translation_matrix(-center.x, -center.y, -center.z)
+    )
+    obj.apply_transformation(matrix)
+
+
+def rotate_around_center(obj: Object, axis: str, angle: float):
+    """Вращение вокруг центра объекта"""
+    center = obj.get_center()
+
+    matrix = compose(
+        translation_matrix(center.x, center.y, center.z),
+        rotation_matrices(axis if axis in ('X', 'Y') else 'Z', angle)[0],
+        translation_matrix(-center.x, -center.y, -center.z)
+    )
+    obj.apply_transformation(matrix)
+
+
+def rotate_around_line(obj: Object, p1: Point, p2: Point, angle: float):
+    """Поворот вокруг произвольной прямой"""
+    # Вектор направления прямой
+    direction = np.array([p2.x - p1.x, p2.y - p1.y, p2.z - p1.z], dtype=float)
+    if np.linalg.norm(direction) < 1e-6:
+        return
+
+    # Перенос p1 в начало координат, поворот по формуле Родрига, перенос обратно
+    matrix = compose(
+        translation_matrix(p1.x, p1.y, p1.z),
+        axis_angle_matrices(direction, angle)[0],
+        translation_matrix(-p1.x, -p1.y, -p1.z)
+    )
+    obj.apply_transformation(matrix)
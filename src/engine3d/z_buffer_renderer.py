@@ -0,0 +1,441 @@
+# z_buffer_renderer.py
+
+import numpy as np
+import pygame
+from .mesh import Mesh
+from .rasterizer import FrameBuffer, rasterize_triangles, downsample
+from .transformations import look_at_matrix, orthographic_matrix
+from .primitives import Object, Point
+from typing import Optional, Tuple
+from . import config
+
+# Глобальный буфер кадра (глубина + номера граней)
+frame_buffer: Optional[FrameBuffer] = None
+WIDTH, HEIGHT = 0, 0
+
+# Доля рассеянного света при плоском затенении
+AMBIENT = 0.25
+
+# Прогрессивный рендер: шаг чередующихся проходов и число граней в черновом кадре
+PROGRESSIVE_STEP = 4
+PREVIEW_FACES = 20000
+
+
+def init_z_buffer(width, height):
+    """Инициализирует Z-буфер."""
+    global frame_buffer, WIDTH, HEIGHT
+    WIDTH, HEIGHT = width, height
+    frame_buffer = FrameBuffer(width, height)
+
+
+def clear_z_buffer():
+    """Очищает Z-буфер перед каждым кадром."""
+    if frame_buffer is not None:
+        frame_buffer.clear()
+
+
+def view_to_screen(view: np.ndarray, projection_matrix, width: int, height: int) -> np.ndarray:
+    """Экранные координаты (N, 2) точек (N, 3) пространства камеры."""
+    p = np.asarray(projection_matrix, dtype=float)
+    clip = view @ p[:, :3].T + p[:, 3]
+    w = clip[:, 3:4]
+    ndc = clip[:, :2] / np.where(np.abs(w) > 1e-12, w, 1e-12)
+    return np.stack([(ndc[:, 0] + 1) * width / 2, (1 - ndc[:, 1]) * height / 2], axis=1)
+
+
+def project_vertices(vertices: np.ndarray, view_matrix, projection_matrix,
+                     width: int, height: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Переводит вершины (N, 3) в пространство камеры и на экран.
+
+    Returns:
+        view - координаты в пространстве камеры (N, 3),
+        screen - экранные координаты (N, 2),
+        depth - расстояние вдоль направления взгляда (N,); камера смотрит вдоль -Z.
+    """
+    m = np.asarray(view_matrix, dtype=float)
+    view = np.asarray(vertices, dtype=float) @ m[:3, :3].T + m[:3, 3]
+    return view, view_to_screen(view, projection_matrix, width, height), -view[:, 2]
+
+
+def clip_near(depth: np.ndarray, near: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Отсечение треугольников плоскостью near по глубинам их вершин (T, 3).
+
+    Треугольник с одной вершиной перед плоскостью становится меньшим треугольником,
+    с двумя - четырёхугольником (два треугольника), порядок обхода сохраняется.
+    Вершины результата заданы весами (T', 3, 3) относительно вершин исходного
+    треугольника, поэтому так же интерполируются координаты и атрибуты.
+
+    Returns:
+        weights - веса вершин (T', 3, 3), source - номер исходного треугольника (T',).
+    """
+    inside = depth > near
+    count = inside.sum(axis=1)
+    identity = np.eye(3)
+
+    def edge(rows, p, q):
+        """Точка на ребре p -> q, где глубина равна near."""
+        dp, dq = depth[rows, p], depth[rows, q]
+        s = (dp - near) / (dp - dq)
+        return identity[p] * (1 - s)[:, None] + identity[q] * s[:, None]
+
+    full = np.flatnonzero(count == 3)
+    weights = [np.broadcast_to(identity, (len(full), 3, 3))]
+    source = [full]
+
+    one = np.flatnonzero(count == 1)
+    a = np.argmax(inside[one], axis=1)
+    b, c = (a + 1) % 3, (a + 2) % 3
+    weights.append(np.stack([identity[a], edge(one, a, b), edge(one, a, c)], axis=1))
+    source.append(one)
+
+    two = np.flatnonzero(count == 2)
+    k = np.argmin(inside[two], axis=1)
+    a, b = (k + 1) % 3, (k + 2) % 3
+    bk, ka = edge(two, b, k), edge(two, a, k)
+    weights.append(np.stack([identity[a], identity[b], bk], axis=1))
+    weights.append(np.stack([identity[a], bk, ka], axis=1))
+    source += [two, two]
+
+    return np.concatenate(weights), np.concatenate(source)
+
+
+def project_mesh(mesh: Mesh, view_matrix, projection_matrix, width: int, height: int,
+                 near: float = config.NEAR):
+    """
+    Геометрическая часть draw_mesh: переводит треугольники сетки в пространство камеры,
+    отсекает плоскостью near (см. clip_near) и проецирует на экран width x height.
+
+    Returns:
+        tris (T, 3), faces - номер грани каждого треугольника, view - вершины в пространстве камеры,
+        weights, source - результат clip_near, screen (T', 3, 2) и depth (T', 3) отсечённых треугольников.
+    """
+    tris, faces = mesh.triangles(return_faces=True)
+    m = np.asarray(view_matrix, dtype=float)
+    view = np.asarray(mesh.vertices, dtype=float) @ m[:3, :3].T + m[:3, 3]
+    corners = view[tris]
+    weights, source = clip_near(-corners[..., 2], near)
+    clipped = np.einsum('tij,tjk->tik', weights, corners[source])
+    depth = -clipped[..., 2]
+    screen = view_to_screen(clipped.reshape(-1, 3), projection_matrix, width, height).reshape(-1, 3, 2)
+    return tris, faces, view, weights, source, screen, depth
+
+
+def draw_mesh(fb: FrameBuffer, mesh: Mesh, view_matrix, projection_matrix,
+              near: float = config.NEAR, attributes: Optional[np.ndarray] = None):
+    """
+    Растеризует треугольники сетки в буфер кадра.
+    Треугольники отсекаются плоскостью near (см. clip_near).
+
+    Args:
+        attributes: Атрибуты вершин (N, K), например мировые координаты. Интерполируются
+            с учётом перспективы (a / d и 1 / d линейно по экрану) в fb.attributes (H, W, K).
+
+    Returns:
+        tris - треугольники (T, 3), faces - номер грани каждого треугольника,
+        view - вершины в пространстве камеры (N, 3).
+        В fb.face_id записываются номера треугольников в tris.
+    """
+    tris, faces, view, weights, source, screen, depth = project_mesh(
+        mesh, view_matrix, projection_matrix, fb.width, fb.height, near)
+
+    tri_attributes = None
+    if attributes is not None:
+        values = np.einsum('tij,tjk->tik', weights, np.asarray(attributes, dtype=float)[tris[source]])
+        inv_depth = 1.0 / depth[..., None]
+        tri_attributes = np.concatenate([values * inv_depth, inv_depth], axis=2)
+    rasterize_triangles(fb, screen, depth, source, tri_attributes)
+    if attributes is not None:
+        covered = fb.face_id >= 0
+        fb.attributes[covered, :-1] /= fb.attributes[covered, -1:]
+        fb.attributes = np.ascontiguousarray(fb.attributes[..., :-1])
+    return tris, faces, view
+
+
+class ShadowMap:
+    """
+    Карта теней направленного источника света.
+
+    Сцена рисуется тем же растеризатором из положения источника в ортографической
+    проекции; в буфере остаётся глубина ближайшей к свету поверхности. Точка в тени,
+    если она дальше от света, чем записанная глубина. PCF - доля освещённых выборок
+    в окне (2 * pcf + 1)^2 texel-ей, считается одним массивом для всех точек.
+    """
+
+    def __init__(self, direction=(0.3, -1.0, 0.4), size: int = 1024, pcf: int = 1):
+        direction = np.asarray(direction, dtype=float)
+        # Направление НА источник (от поверхности к свету)
+        self.direction = direction / np.linalg.norm(direction)
+        self.size = size
+        self.pcf = pcf
+        self.view = None
+        self.projection = None
+        self.depth: Optional[np.ndarray] = None
+        self.bias = 0.0
+        self.normal_offset = 0.0
+
+    def build(self, mesh: Mesh):
+        """Проход глубины из положения источника."""
+        vertices = np.asarray(mesh.vertices, dtype=float)
+        if len(vertices) == 0:
+            self.depth = np.full((self.size, self.size), np.inf, dtype=np.float32)
+            return
+        center = (vertices.min(axis=0) + vertices.max(axis=0)) / 2
+        radius = max(np.linalg.norm(vertices - center, axis=1).max(), 1e-9)
+        eye = center + self.direction * 2 * radius
+        up = (0.0, 0.0, 1.0) if abs(self.direction[2]) < 0.9 else (1.0, 0.0, 0.0)
+        self.view = look_at_matrix(Point(*eye), Point(*center), Point(*up))
+        self.projection = orthographic_matrix(-radius, radius, -radius, radius, radius * 0.5, radius * 3.5)
+        fb = FrameBuffer(self.size, self.size)
+        draw_mesh(fb, mesh, self.view, self.projection, near=0.0)
+        self.depth = fb.depth
+        # Смещения против "теневых прыщей" в единицах сцены: по глубине и вдоль нормали
+        texel = 2 * radius / self.size
+        self.bias = texel
+        self.normal_offset = 1.5 * texel
+
+    def lit_fraction(self, points: np.ndarray, normals: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Доля освещённости точек (P, 3) мира; вне карты точки считаются освещёнными.
+        Если даны нормали, точка выборки сдвигается вдоль нормали (наклонные грани без полос).
+        """
+        if normals is not None:
+            points = points + normals * self.normal_offset
+        _, screen, depth = project_vertices(points, self.view, self.projection, self.size, self.size)
+        px = np.floor(screen[:, 0]).astype(np.int64)
+        py = np.floor(screen[:, 1]).astype(np.int64)
+        outside = (px < 0) | (px >= self.size) | (py < 0) | (py >= self.size)
+
+        # Окно PCF - одна выборка по плоскому индексу: центр окна прижимается к краю
+        # карты, чтобы все смещения оставались внутри
+        k = np.arange(-self.pcf, self.pcf + 1)
+        offsets = (k[:, None] * self.size + k[None, :]).reshape(-1)
+        edge = min(self.pcf, self.size // 2)
+        base = np.clip(py, edge, self.size - 1 - edge) * self.size + np.clip(px, edge, self.size - 1 - edge)
+        stored = self.depth.reshape(-1)[base[:, None] + offsets]
+        reference = (depth - self.bias).astype(np.float32)
+        lit = np.count_nonzero(reference[:, None] <= stored, axis=1) / len(offsets)
+        lit[outside] = 1.0
+        return lit
+
+
+def shade_triangles(view: np.ndarray, tris: np.ndarray, colors: np.ndarray,
+                    light_dir=(0.0, 0.0, 1.0), ambient: float = AMBIENT) -> np.ndarray:
+    """
+    Плоское двустороннее затенение по Ламберту в пространстве камеры.
+    По умолчанию свет идёт от камеры. colors - базовые цвета треугольников (T, 3).
+    """
+    normals = np.cross(view[tris[:, 1]] - view[tris[:, 0]], view[tris[:, 2]] - view[tris[:, 0]])
+    length = np.linalg.norm(normals, axis=1)
+    light = np.asarray(light_dir, dtype=float)
+    light = light / np.linalg.norm(light)
+    cos = np.abs(normals @ light) / np.where(length > 1e-12, length, 1.0)
+    intensity = ambient + (1 - ambient) * cos
+    return np.clip(colors * intensity[:, None], 0, 255).astype(np.uint8)
+
+
+def resolve_colors(fb: FrameBuffer, colors: np.ndarray, background=config.BLACK) -> np.ndarray:
+    """Изображение (H, W, 3) uint8 по номерам треугольников в буфере и их цветам."""
+    image = np.empty((fb.height, fb.width, 3), dtype=np.uint8)
+    image[:] = background
+    covered = fb.face_id >= 0
+    image[covered] = colors[fb.face_id[covered]]
+    return image
+
+
+def render_mesh(mesh: Mesh, view_matrix, projection_matrix, width: int, height: int,
+                color=config.GRAY, background=config.BLACK, light_dir=(0.0, 0.0, 1.0),
+                near: float = config.NEAR, shadow: Optional[ShadowMap] = None,
+                samples: int = 1, msaa: bool = False) -> np.ndarray:
+    """
+    Рендерит сетку без окна (без pygame.display) с Z-буфером и плоским затенением.
+    Возвращает изображение (H, W, 3) uint8.
+
+    Без shadow свет light_dir задан в пространстве камеры. С shadow свет идёт от
+    направленного источника карты теней (строится при первом вызове, если не построена).
+
+    samples > 1 включает сглаживание: сцена растеризуется в буфер в samples раз больше
+    по каждой оси. SSAA затеняет все выборки и усредняет блоки samples x samples.
+    MSAA (msaa=True) затеняет одну выборку на пиксель и все выборки только там, где
+    блок покрыт разными треугольниками, то есть на краях.
+    """
+    n = max(int(samples), 1)
+    fb = FrameBuffer(width * n, height * n)
+    if shadow is not None and shadow.depth is None:
+        shadow.build(mesh)
+    tris, faces, view = draw_mesh(fb, mesh, view_matrix, projection_matrix, near,
+                                  attributes=None if shadow is None else mesh.vertices)
+    color = np.asarray(color, dtype=float)
+    face_ids = fb.face_id.reshape(-1)
+
+    if shadow is None:
+        triangle_colors = shade_triangles(view, tris, np.broadcast_to(color, (len(tris), 3)), light_dir)
+    else:
+        # Нормали граней в мировых координатах, повёрнутые к камере
+        v = np.asarray(mesh.vertices, dtype=float)
+        normals = np.cross(v[tris[:, 1]] - v[tris[:, 0]], v[tris[:, 2]] - v[tris[:, 0]])
+        normals /= np.maximum(np.linalg.norm(normals, axis=1, keepdims=True), 1e-12)
+        camera_position = np.linalg.inv(np.asarray(view_matrix, dtype=float))[:3, 3]
+        facing_away = np.einsum('ij,ij->i', normals, camera_position - v[tris[:, 0]]) < 0
+        normals[facing_away] *= -1
+        positions = fb.attributes.reshape(-1, 3)
+
+    def shade(samples_index: np.ndarray) -> np.ndarray:
+        """Цвета (P, 3) выборок буфера по их плоским номерам."""
+        out = np.empty((len(samples_index), 3))
+        out[:] = background
+        tri = face_ids[samples_index]
+        covered = tri >= 0
+        tri = tri[covered]
+        if shadow is None:
+            out[covered] = triangle_colors[tri]
+            return out
+        cos = np.clip(normals[tri] @ shadow.direction, 0.0, 1.0)
+        lit = np.zeros(len(tri))
+        facing = cos > 0
+        lit[facing] = shadow.lit_fraction(positions[samples_index[covered][facing]], normals[tri[facing]])
+        out[covered] = color * (AMBIENT + (1 - AMBIENT) * cos * lit)[:, None]
+        return out
+
+    if n == 1 or not msaa:
+        image = shade(np.arange(fb.width * fb.height)).reshape(fb.height, fb.width, 3)
+        return np.rint(downsample(image, n)).astype(np.uint8)
+
+    # Номера выборок каждого пикселя: (H, W, n * n)
+    ys = np.arange(height)[:, None, None, None] * n + np.arange(n)[None, None, :, None]
+    xs = np.arange(width)[None, :, None, None] * n + np.arange(n)[None, None, None, :]
+    sample_index = (ys * fb.width + xs).reshape(height, width, n * n)
+    ids = face_ids[sample_index]
+    edge = (ids != ids[..., :1]).any(axis=2)
+
+    image = np.empty((height, width, 3))
+    image[~edge] = shade(sample_index[~edge][:, 0])
+    edge_samples = sample_index[edge]
+    image[edge] = shade(edge_samples.reshape(-1)).reshape(len(edge_samples), n * n, 3).mean(axis=1)
+    return np.rint(image).astype(np.uint8)
+
+
+def _interleave_order(step: int):
+    """Смещения (i, j) проходов от грубого к мелкому: каждый следующий проход делит пустоты пополам."""
+    bits = max(step - 1, 0).bit_length()
+
+    def reverse(k):
+        return int(format(k, f'0{bits}b')[::-1], 2) if bits else 0
+
+    cells = [(i, j) for j in range(step) for i in range(step)]
+    return sorted(cells, key=lambda c: (max(reverse(c[0]), reverse(c[1])), reverse(c[1]), reverse(c[0])))
+
+
+def render_mesh_progressive(mesh: Mesh, view_matrix, projection_matrix, width: int, height: int,
+                            color=config.GRAY, background=config.BLACK, light_dir=(0.0, 0.0, 1.0),
+                            near: float = config.NEAR, samples: int = 1,
+                            step: int = PROGRESSIVE_STEP, preview_faces: int = PREVIEW_FACES):
+    """
+    Прогрессивный вариант render_mesh: генератор кадров (H, W, 3) uint8 растущего качества.
+
+    1. Черновик: каждая N-я грань (если граней больше preview_faces) в step раз меньшем
+       разрешении, увеличенный блоками.
+    2. step * step чередующихся проходов полной сетки в step раз меньшем разрешении;
+       проход (i, j) заполняет пиксели image[j::step, i::step], порядок проходов - от
+       грубого к мелкому, так что картинка равномерно уточняется по всему кадру.
+       Геометрия и цвета треугольников считаются один раз, проход только растеризует.
+    3. При samples > 1 - итоговый кадр со сглаживанием (MSAA).
+
+    Каждый кадр - новый массив. Потребитель может прервать генератор в любой момент
+    (например, при движении камеры) - незавершённая работа просто отбрасывается.
+    """
+    pass_width, pass_height = -(-width // step), -(-height // step)
+    color = np.asarray(color, dtype=float)
+
+    def prepare(source: Mesh):
+        tris, _, view, _, ids, screen, depth = project_mesh(source, view_matrix, projection_matrix,
+                                                             width, height, near)
+        colors = shade_triangles(view, tris, np.broadcast_to(color, (len(tris), 3)), light_dir)
+        return screen, depth, ids, colors
+
+    def render_pass(prepared, i: int, j: int) -> np.ndarray:
+        """Кадр из пикселей (x * step + i, y * step + j) полного разрешения."""
+        screen, depth, ids, colors = prepared
+        fb = FrameBuffer(pass_width, pass_height)
+        # Центр пикселя (x, y) прохода - центр пикселя (x * step + i, y * step + j) кадра
+        rasterize_triangles(fb, (screen - [i + 0.5, j + 0.5]) / step + 0.5, depth, ids)
+        return resolve_colors(fb, colors, background)
+
+    def upscale(part: np.ndarray) -> np.ndarray:
+        return part.repeat(step, axis=0).repeat(step, axis=1)[:height, :width]
+
+    order = _interleave_order(step)
+    stride = -(-len(mesh.faces) // preview_faces) if preview_faces > 0 else 1
+    if stride > 1:
+        yield upscale(render_pass(prepare(Mesh(mesh.vertices, mesh.faces[::stride])), *order[0]))
+
+    prepared = prepare(mesh)
+    image = None
+    for i, j in order:
+        part = render_pass(prepared, i, j)
+        if image is None:
+            image = upscale(part)
+        else:
+            target = image[j::step, i::step]
+            target[:] = part[:target.shape[0], :target.shape[1]]
+        yield image.copy()
+
+    if samples > 1:
+        yield render_mesh(mesh, view_matrix, projection_matrix, width, height, color, background,
+                          light_dir, near, samples=samples, msaa=True)
+
+
+def blit_image(screen: pygame.Surface, image: np.ndarray, mask: Optional[np.ndarray] = None):
+    """Копирует изображение (H, W, 3) на поверхность; mask - какие пиксели копировать."""
+    pixels = pygame.surfarray.pixels3d(screen)  # (W, H, 3)
+    target = pixels.swapaxes(0, 1)
+    if mask is None:
+        target[:] = image
+    else:
+        target[mask] = image[mask]
+    del pixels, target
+
+
+def render_object_zbuffer(screen, obj: Object, view_matrix, projection_matrix):
+    """Рендерит объект с использованием Z-буфера."""
+    if frame_buffer is None:
+        init_z_buffer(*screen.get_size())
+
+    mesh = Mesh.from_object(obj)
+    tris, faces, view = draw_mesh(frame_buffer, mesh, view_matrix, projection_matrix)
+
+    # Дадим каждой грани свой цвет
+    palette = np.array(config.COLORS, dtype=np.uint8)
+    colors = palette[faces % len(palette)]
+    image = resolve_colors(frame_buffer, colors)
+    blit_image(screen, image, frame_buffer.face_id >= 0)
+
+
+if __name__ == '__main__':
+    import os
+    import time
+    from .object_IO import load_mesh
+    from .transformations import perspective_matrix
+
+    # Два прохода одного растеризатора: глубина из источника и кадр с камеры
+    mesh = load_mesh(os.path.join(config.MODELS_DIR, 'pot.obj'))
+    lo, hi = mesh.vertices.min(axis=0), mesh.vertices.max(axis=0)
+    center, radius = (lo + hi) / 2, np.linalg.norm(hi - lo) / 2
+    floor = np.array([[-4, 0, -4], [4, 0, -4], [4, 0, 4], [-4, 0, 4]]) * radius + [center[0], hi[1], center[2]]
+    scene = Mesh(np.vstack([mesh.vertices, floor]),
+                 np.vstack([mesh.triangles(), np.array([[0, 1, 2], [0, 2, 3]]) + len(mesh.vertices)]))
+
+    width, height = 1280, 720
+    eye = center + radius * np.array([1.2, -1.2, 2.5])
+    view = look_at_matrix(Point(*eye), Point(*center), Point(0, -1, 0))
+    projection = perspective_matrix(np.radians(45), width / height, 1.0, 100 * radius)
+    shadow = ShadowMap(direction=(-0.5, -1.0, 0.5), size=2048, pcf=2)
+
+    start = time.perf_counter()
+    shadow.build(scene)
+    middle = time.perf_counter()
+    image = render_mesh(scene, view, projection, width, height, shadow=shadow)
+    end = time.perf_counter()
+    print(f"Карта теней: {(middle - start) * 1000:.0f} мс, кадр: {(end - middle) * 1000:.0f} мс")
+    pygame.image.save(pygame.surfarray.make_surface(image.swapaxes(0, 1)), 'shadow_test.png')
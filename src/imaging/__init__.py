@@ -0,0 +1,11 @@
+"""
+Общий пакет загрузки изображений для лабораторных (lab2, lab3).
+
+Модули:
+    image_cache   - ленивый LRU-кэш изображений и миниатюр, список файлов папки
+    prefetch      - фоновая подготовка текущего и соседних изображений
+    color_convert - приведение типа изображения и яркость в фиксированной точке
+
+Лабораторные добавляют папку src в sys.path и импортируют модули пакета:
+    from imaging.image_cache import ImageCache
+"""
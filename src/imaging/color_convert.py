@@ -0,0 +1,75 @@
+from functools import lru_cache
+
+import numpy as np
+
+
+# ===== Приведение типа и яркость =====
+# Тип изображения приводится один раз при загрузке (normalize_image), дальше операции
+# lab2 получают uint8 и не гадают о диапазоне значений. Яркость для uint8 считается
+# в фиксированной точке: веса * 256 целыми числами, сумма в uint16 и сдвиг на 8 бит.
+# Временные uint16-массивы вдвое больше uint8-входа, но вчетверо меньше float64,
+# а результат не зависит от округления float. Для остальных типов - float32.
+
+GRAYSCALE_BT601 = (0.299, 0.587, 0.114)  # полутоновое 1
+GRAYSCALE_BT709 = (0.2126, 0.7152, 0.0722)  # полутоновое 2
+
+FIXED_POINT_SHIFT = 8
+FIXED_POINT_ONE = 1 << FIXED_POINT_SHIFT
+
+
+def to_uint8(img: np.ndarray) -> np.ndarray:
+    """Приводит изображение к uint8: float в [0, 1] масштабируется в [0, 255]."""
+    img = np.asarray(img)
+    if img.dtype == np.uint8:
+        return img
+    if img.dtype.kind == 'f':
+        return np.rint(np.clip(img, 0.0, 1.0) * 255).astype(np.uint8)
+    return np.clip(img, 0, 255).astype(np.uint8)
+
+
+def normalize_image(img: np.ndarray) -> np.ndarray:
+    """
+    Изображение в виде (H, W, 3|4) uint8 - единый формат для всех операций lab2.
+    uint8-вход возвращается как есть (view не копируется), одноканальное (H, W) - в три канала.
+    """
+    img = to_uint8(img)
+    if img.ndim == 2:
+        img = np.repeat(img[..., np.newaxis], 3, axis=2)
+    return img
+
+
+@lru_cache(maxsize=None)
+def fixed_point_weights(weights) -> tuple:
+    """
+    Целые веса round(w * 256) с суммой ровно 256 (по наибольшим остаткам),
+    так что белый остается белым, а сумма 255 * 256 + 128 помещается в uint16.
+    """
+    total = sum(weights)
+    scaled = [w / total * FIXED_POINT_ONE for w in weights]
+    fixed = [int(w) for w in scaled]
+    by_remainder = sorted(range(len(scaled)), key=lambda i: scaled[i] - fixed[i], reverse=True)
+    for i in by_remainder[:FIXED_POINT_ONE - sum(fixed)]:
+        fixed[i] += 1
+    return tuple(fixed)
+
+
+def luminance(img: np.ndarray, weights=GRAYSCALE_BT601) -> np.ndarray:
+    """
+    Яркость Y = w_r*R + w_g*G + w_b*B как (H, W).
+    Для uint8 - uint8 в фиксированной точке с округлением, для остальных типов - float32.
+    """
+    if img.dtype == np.uint8:
+        w_r, w_g, w_b = fixed_point_weights(tuple(float(w) for w in weights))
+        acc = np.multiply(img[..., 0], w_r, dtype=np.uint16)
+        tmp = np.multiply(img[..., 1], w_g, dtype=np.uint16)
+        acc += tmp
+        np.multiply(img[..., 2], w_b, out=tmp, dtype=np.uint16)
+        acc += tmp
+        acc += FIXED_POINT_ONE // 2
+        acc >>= FIXED_POINT_SHIFT
+        return acc.astype(np.uint8)
+
+    gray = np.multiply(img[..., 0], np.float32(weights[0]), dtype=np.float32)
+    gray += np.multiply(img[..., 1], np.float32(weights[1]), dtype=np.float32)
+    gray += np.multiply(img[..., 2], np.float32(weights[2]), dtype=np.float32)
+    return gray
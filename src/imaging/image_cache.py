@@ -0,0 +1,131 @@
+import os
+import threading
+from collections import OrderedDict
+
+import pygame
+
+from .color_convert import normalize_image
+
+
+# ===== Общий кэш изображений для lab2 и lab3 =====
+# Файл декодируется один раз (pygame.image.load), surface и numpy-массив берутся из
+# одного буфера. Полноразмерные изображения грузятся лениво при первом обращении и
+# живут в LRU ограниченного размера, миниатюры после создания остаются в памяти всегда.
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp')
+
+
+def list_images(folder):
+    """Пути ко всем изображениям в папке (без декодирования), отсортированные по имени."""
+    if not os.path.isdir(folder):
+        print(f"Папка не найдена: {folder}")
+        return []
+    return [
+        os.path.join(folder, filename)
+        for filename in sorted(os.listdir(folder))
+        if filename.lower().endswith(IMAGE_EXTENSIONS)
+    ]
+
+
+class ImageCache:
+    """
+    Ленивый кэш изображений по списку путей.
+
+    thumbnail(i) - миниатюра thumb_size (pygame.Surface), хранится всегда;
+    surface(i)   - полноразмерный surface, не более max_full штук (LRU);
+    array(i)     - (H, W, 3) uint8 view на пиксели полноразмерного surface без копии.
+
+    Пока view из array(i) жив, surface заблокирован и его нельзя блитить, поэтому
+    для вывода на экран используются миниатюры. Методы можно вызывать из фонового
+    потока (см. prefetch.Prefetcher): словари защищены блокировкой, а само
+    декодирование идет без нее, чтобы UI не ждал чужую загрузку.
+    """
+
+    def __init__(self, paths, thumb_size=(400, 400), max_full=4):
+        self.paths = [path for path in paths if os.path.exists(path)]
+        self.thumb_size = (int(thumb_size[0]), int(thumb_size[1]))
+        self.max_full = max(1, int(max_full))
+        self._full = OrderedDict()  # индекс -> полноразмерный surface
+        self._thumbs = {}  # индекс -> миниатюра
+        self._lock = threading.RLock()
+
+        self.thumbnails = _LazySequence(self, self.thumbnail)
+        self.arrays = _LazySequence(self, self.array)
+
+    def __len__(self):
+        return len(self.paths)
+
+    def surface(self, index):
+        """Полноразмерный surface; декодирует файл при первом обращении."""
+        with self._lock:
+            if index in self._full:
+                self._full.move_to_end(index)
+                return self._full[index]
+
+        surf = self._decode(self.paths[index])
+        with self._lock:
+            surf = self._full.setdefault(index, surf)  # другой поток мог успеть раньше
+            self._full.move_to_end(index)
+            while len(self._full) > self.max_full:
+                self._full.popitem(last=False)
+            return surf
+
+    def thumbnail(self, index):
+        """Миниатюра thumb_size; создается из полноразмерного surface один раз."""
+        with self._lock:
+            if index in self._thumbs:
+                return self._thumbs[index]
+
+        thumb = pygame.transform.scale(self.surface(index), self.thumb_size)
+        with self._lock:
+            return self._thumbs.setdefault(index, thumb)
+
+    def array(self, index):
+        """
+        Пиксели полноразмерного изображения как (H, W, 3) uint8.
+
+        Для 24/32-битных surface - view через surfarray.pixels3d (без копии), иначе копия.
+        Тип приводится здесь, один раз (color_convert.normalize_image), и дальше не проверяется.
+        """
+        surf = self.surface(index)
+        self.thumbnail(index)  # миниатюру делаем до блокировки surface
+        try:
+            pixels = pygame.surfarray.pixels3d(surf)
+        except ValueError:
+            pixels = pygame.surfarray.array3d(surf)
+        return normalize_image(pixels.transpose(1, 0, 2))
+
+    def _decode(self, path):
+        try:
+            surf = pygame.image.load(path)
+            if pygame.display.get_surface() is not None:
+                surf = surf.convert()
+            print(f"Загружено изображение: {os.path.basename(path)}")
+            return surf
+        except Exception as e:
+            print(f"Ошибка загрузки {path}: {e}")
+            surf = pygame.Surface(self.thumb_size)
+            surf.fill((100, 100, 100))
+            return surf
+
+
+class _LazySequence:
+    """Список-обертка над кэшем: len и индексация без загрузки всех изображений."""
+
+    def __init__(self, cache, getter):
+        self.cache = cache
+        self.getter = getter
+
+    def __len__(self):
+        return len(self.cache)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.cache)
+        if not 0 <= index < len(self.cache):
+            raise IndexError(index)
+        return self.getter(index)
+
+    def __iter__(self):
+        for index in range(len(self.cache)):
+            yield self.getter(index)
@@ -0,0 +1,84 @@
+import threading
+from typing import Callable, Dict, List, Optional
+
+
+# ===== Фоновая подготовка соседних изображений =====
+
+class Prefetcher(threading.Thread):
+    """
+    Поток, заранее готовящий текущее и соседние изображения просмотрщика.
+
+    UI вызывает request(index, count) при каждой смене картинки: поток готовит
+    index, затем index+1, index-1, ... (до radius соседей, по кругу) через
+    prepare(index, cancelled) и складывает результаты; get(index) сразу отдает
+    готовый результат или None. Результаты для изображений вне окна выбрасываются.
+
+    prepare должен время от времени проверять cancelled() и возвращать None, если
+    задача отменена: это происходит, когда пользователь ушел дальше и индекс
+    выпал из окна, или при stop(). Как и в engine3d.render_thread, используется
+    поток: декодирование и NumPy отпускают GIL, и цикл UI не ждет обработки.
+    """
+
+    def __init__(self, prepare: Callable[[int, Callable[[], bool]], object], radius: int = 1):
+        super().__init__(daemon=True, name="prefetch")
+        self._prepare = prepare
+        self._radius = radius
+        self._condition = threading.Condition()
+        self._wanted: List[int] = []
+        self._results: Dict[int, object] = {}
+        self._running = True
+
+    def request(self, index: int, count: int):
+        """Делает index текущим: ставит его и соседей в очередь, отменяя лишнее."""
+        if count <= 0:
+            return
+        wanted = [index]
+        for offset in range(1, self._radius + 1):
+            for neighbour in ((index + offset) % count, (index - offset) % count):
+                if neighbour not in wanted:
+                    wanted.append(neighbour)
+        with self._condition:
+            self._wanted = wanted
+            self._results = {i: r for i, r in self._results.items() if i in wanted}
+            self._condition.notify()
+
+    def get(self, index: int) -> Optional[object]:
+        """Готовый результат для index или None, если он еще считается."""
+        with self._condition:
+            return self._results.get(index)
+
+    def stop(self):
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+
+    def _next_job(self) -> Optional[int]:
+        for index in self._wanted:
+            if index not in self._results:
+                return index
+        return None
+
+    def run(self):
+        while True:
+            with self._condition:
+                while self._running and self._next_job() is None:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                index = self._next_job()
+
+            def cancelled(index=index):
+                return not self._running or index not in self._wanted
+
+            try:
+                result = self._prepare(index, cancelled)
+            except Exception as e:
+                print(f"Ошибка подготовки изображения {index}: {e}")
+                result = None
+
+            with self._condition:
+                if result is not None and not cancelled():
+                    self._results[index] = result
+                elif result is None and not cancelled():
+                    # Подготовка не удалась: не пытаемся снова до следующего request
+                    self._wanted = [i for i in self._wanted if i != index]
@@ -0,0 +1,166 @@
+"""
+Пакетная обработка изображений без GUI: цепочка операций lab2 над папкой файлов.
+
+    python batch.py INPUT_DIR OUTPUT_DIR --ops gray1 hsv:0.5,0,0.1 red --workers 4
+
+Операции (применяются по порядку):
+    gray1, gray2     - полутоновое (BT.601 / BT.709), как в grayscale.py
+    diff             - разность gray1 и gray2, усиленная в 10 раз
+    red, green, blue - выделение канала, как в channel_allocation.py
+    hsv:H,S,V        - сдвиг тона, насыщенности и яркости, как в rgb2hsv.py
+
+Файлы обрабатываются в пуле процессов; исполнитель сам читает файл и пишет
+результат на диск, в работе одновременно не больше window файлов, так что память
+не зависит от размера папки. Скорость (изобр/с и МБ/с по декодированным пикселям)
+печатается по ходу работы и в конце.
+"""
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+import pygame
+
+# Общий пакет загрузки изображений лежит в src/imaging
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from imaging.color_convert import normalize_image, GRAYSCALE_BT601, GRAYSCALE_BT709
+from imaging.image_cache import list_images
+from image_ops import is_pointwise, isolate_channel, pointwise, shift_hsv, to_grayscale
+from op_graph import evaluate, image
+
+
+# Разность полутоновых версий одним проходом, без промежуточных полноразмерных массивов
+GRAYSCALE_DIFF = image().grayscale(GRAYSCALE_BT601).abs_diff(image().grayscale(GRAYSCALE_BT709), gain=10).rgb()
+
+# Все операции попиксельные, поэтому цепочку можно применять и по полосам (tiling.py)
+OPERATIONS = {
+    'gray1': pointwise(lambda img: to_grayscale(img, GRAYSCALE_BT601)),
+    'gray2': pointwise(lambda img: to_grayscale(img, GRAYSCALE_BT709)),
+    'diff': pointwise(lambda img: evaluate([GRAYSCALE_DIFF], img)[0]),
+    'red': pointwise(lambda img: isolate_channel(img, 0)),
+    'green': pointwise(lambda img: isolate_channel(img, 1)),
+    'blue': pointwise(lambda img: isolate_channel(img, 2)),
+    'hsv': shift_hsv,
+}
+
+
+def parse_operation(text):
+    """'hsv:0.5,0,0.1' -> ('hsv', (0.5, 0.0, 0.1)); 'gray1' -> ('gray1', ())."""
+    name, _, args = text.partition(':')
+    if name not in OPERATIONS:
+        raise ValueError(f"Неизвестная операция: {name}")
+    return name, tuple(float(arg) for arg in args.split(',')) if args else ()
+
+
+def operation_function(name, args=()):
+    """Операция с подставленными аргументами: img -> img, пометка @pointwise сохраняется."""
+    func = OPERATIONS[name]
+
+    def operation(img):
+        return func(img, *args)
+    operation.pointwise = is_pointwise(func)
+    return operation
+
+
+def apply_operations(img, operations):
+    """Применяет цепочку [(имя, аргументы), ...] к изображению (H, W, 3) uint8."""
+    for name, args in operations:
+        img = OPERATIONS[name](img, *args)
+    return img
+
+
+def load_image(path):
+    """Изображение с диска как (H, W, 3) uint8 (без окна pygame)."""
+    return normalize_image(pygame.surfarray.array3d(pygame.image.load(path)).transpose(1, 0, 2))
+
+
+def save_image(path, img):
+    pygame.image.save(pygame.surfarray.make_surface(np.ascontiguousarray(img[..., :3]).swapaxes(0, 1)), path)
+
+
+def process_file(operations, output_dir, extension, skip_existing, path):
+    """
+    Обрабатывает один файл (в процессе-исполнителе) и пишет результат в output_dir.
+    Возвращает объем декодированных пикселей в байтах (0 - файл пропущен или ошибка).
+    """
+    name = os.path.splitext(os.path.basename(path))[0] + extension
+    output = os.path.join(output_dir, name)
+    if skip_existing and os.path.exists(output):
+        return 0
+    try:
+        img = load_image(path)
+        save_image(output, apply_operations(img, operations))
+        return img.nbytes
+    except Exception as e:
+        print(f"\nОшибка обработки {path}: {e}")
+        return 0
+
+
+def process_directory(input_dir, output_dir, operations, extension='.png', workers=None,
+                      window=None, skip_existing=False, progress=None):
+    """
+    Обрабатывает все изображения папки в пуле процессов.
+
+    Задачи отправляются окном из window файлов (по умолчанию 2 * workers), поэтому
+    список результатов не копится в памяти. progress(done, total, processed, nbytes)
+    вызывается после каждого файла: done учитывает и пропущенные файлы, processed - нет.
+    Возвращает (число обработанных файлов, байт пикселей).
+    """
+    paths = list_images(input_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    window = window or 2 * workers
+    job = partial(process_file, operations, output_dir, extension, skip_existing)
+
+    done, processed, total_bytes = 0, 0, 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        next_path = 0
+        while next_path < len(paths) or pending:
+            while next_path < len(paths) and len(pending) < window:
+                pending.append(executor.submit(job, paths[next_path]))
+                next_path += 1
+            nbytes = pending.popleft().result()
+            done += 1
+            processed += nbytes > 0
+            total_bytes += nbytes
+            if progress is not None:
+                progress(done, len(paths), processed, total_bytes)
+    return processed, total_bytes
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Пакетная обработка изображений операциями lab2')
+    parser.add_argument('input', help='папка с изображениями')
+    parser.add_argument('output', help='папка для результатов')
+    parser.add_argument('--ops', nargs='+', type=parse_operation, required=True,
+                        help='цепочка операций: ' + ', '.join(OPERATIONS))
+    parser.add_argument('--format', default='png', help='формат результата: png, jpg, bmp, tga')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--skip-existing', action='store_true', help='не перезаписывать готовые файлы')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    last_report = 0.0
+
+    def report(done, total, processed, nbytes):
+        global last_report
+        now = time.perf_counter()
+        if now - last_report < 0.5 and done < total:
+            return
+        last_report = now
+        elapsed = max(now - start, 1e-9)
+        # Скорость - только по обработанным файлам: пропущенные (--skip-existing) и ошибки не считаются
+        print(f"\rФайлов {done}/{total}: {processed / elapsed:.1f} изобр/с, "
+              f"{nbytes / elapsed / 2 ** 20:.1f} МБ/с", end='', flush=True)
+
+    processed, nbytes = process_directory(args.input, args.output, args.ops, '.' + args.format.lstrip('.'),
+                                          args.workers, skip_existing=args.skip_existing, progress=report)
+    elapsed = time.perf_counter() - start
+    print(f"\nГотово: {processed} изображений, {nbytes / 2 ** 20:.1f} МБ за {elapsed:.1f} с "
+          f"({processed / elapsed:.1f} изобр/с, {nbytes / elapsed / 2 ** 20:.1f} МБ/с)")
@@ -1,10 +1,19 @@
 import random
 import pygame
 import os
+import sys
 import numpy as np
-import matplotlib.pyplot as plt
 from pygame.locals import *
 
+# Общий пакет загрузки изображений лежит в src/imaging
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from imaging.image_cache import ImageCache
+from imaging.prefetch import Prefetcher
+from histogram import channel_histograms, histogram_surface
+
+CHANNEL_MASKS = {"red": (255, 0, 0), "green": (0, 255, 0), "blue": (0, 0, 255)}
+
 base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 Image_list = [
     os.path.join(base_dir, "assets", "win1991.jpg"),
@@ -61,7 +70,10 @@ class App:
         self.image_size = (200, 150)
         self.image_surfaces = []
         self.histogram_surfaces = []
+        self.processed_surfaces = []
         self.selected_image_index = 0
+        self.shown_image_index = None  # для какого изображения готовы processed_surfaces и гистограммы
+        self.prefetcher = Prefetcher(self.prepare_image)
         self.current_image_path = None
 
         # Позиции и размеры
@@ -93,19 +105,17 @@ class App:
 
     def load_images(self):
         """
-        Загружает все доступные изображения
+        Подключает все доступные изображения через общий кэш: файлы декодируются
+        лениво при первом выборе, а не все сразу при старте
         """
-        self.image_surfaces = []
-        self.images = []
-
-        # Пробуем загрузить изображения из списка
-        loaded_count = 0
-        for path in Image_list:
-            if self.load_single_image(path):
-                loaded_count += 1
-
-        # Если не удалось загрузить изображения, создаем тестовые
-        if loaded_count == 0:
+        self.image_cache = ImageCache(Image_list, (self.thumb_width, self.thumb_height))
+        self.image_surfaces = self.image_cache.thumbnails
+        self.images = self.image_cache.arrays
+
+        # Если не нашлось ни одного изображения, создаем тестовые
+        if len(self.image_cache) == 0:
+            self.image_surfaces = []
+            self.images = []
             print("Не найдены файлы изображений, создаем тестовые изображения")
             test_colors = [(255, 100, 100), (100, 255, 100), (100, 100, 255), (255, 255, 100)]
             for i, color in enumerate(test_colors):
@@ -116,120 +126,32 @@ class App:
                 self.images.append(fake_array)
                 print(f"Создано тестовое изображение {i + 1}")
 
-    def load_single_image(self, path):
-        """
-        Загружает одно изображение
-        """
-        try:
-            if os.path.exists(path):
-                img_surf = pygame.image.load(path).convert()
-                scaled_img_surf = pygame.transform.scale(
-                    img_surf,
-                    (self.thumb_width, self.thumb_height)
-                )
-                self.image_surfaces.append(scaled_img_surf)
-
-                # Загружаем как numpy array для гистограммы
-                try:
-                    img_array = plt.imread(path)
-                    self.images.append(img_array)
-                except:
-                    # Если plt.imread не работает, создаем массив из pygame surface
-                    img_array = pygame.surfarray.array3d(scaled_img_surf)
-                    img_array = np.transpose(img_array, (1, 0, 2))  # Поворачиваем массив
-                    self.images.append(img_array)
-
-                print(f"Загружено изображение: {os.path.basename(path)}")
-                return True
-            else:
-                print(f"Файл не найден: {path}")
-                return False
-        except Exception as e:
-            print(f"Ошибка загрузки {path}: {e}")
-            return False
-
-    def create_histograms(self):
+    def create_histograms(self, index):
         """
         Создает 4 гистограммы для текущего изображения:
         - 3 отдельные гистограммы для каждого цветового канала
         - 1 совмещенная гистограмма со всеми тремя каналами
         """
-        if not self.images or self.selected_image_index >= len(self.images):
+        if not self.images or index >= len(self.images):
             return []
 
         try:
-            img = self.images[self.selected_image_index]
-            # print(np.unique(img[:, :, 0]).size)
-            # print(np.unique(img[:, :, 1]).size)
-            # print(np.unique(img[:, :, 2]).size)
-            # print(img[:, :, 1])
-
-            # Нормализуем значения, если они в диапазоне [0, 1]
-            if abs(int(img[:, :, 0][0][0]) - img[:, :, 0][0][0]) > 0.0001:
-                img = img.copy()
-                img *= 255
-
+            img = self.images[index]
             histogram_surfaces = []
-
-            bins = 16
+            size = (int(self.histogram_area.width // 2 - 15), int(self.histogram_area.height // 2 - 40))
 
             if len(img.shape) == 3:  # Цветное изображение
-                colors = ['red', 'green', 'blue']
-                color_names = ['Красный', 'Зеленый', 'Синий']
+                colors = [(255, 0, 0), (0, 128, 0), (0, 0, 255)]  # red, green, blue
+
+                # Все каналы одним проходом bincount, 16 корзин
+                counts = channel_histograms(img[:, :, :3], bins=16)
 
                 # Создаем 3 отдельные гистограммы для каждого канала
-                for i, (color, name) in enumerate(zip(colors, color_names)):
-                    fig, ax = plt.subplots(figsize=(2, 3))
-                    ax.hist(img[:, :, i].flatten(), bins=bins, alpha=0.8, color=color, density=True)
-                    ax.set_title(f'{name} канал', fontsize=9)
-                    ax.tick_params(axis='both', which='major', labelsize=7)
-                    plt.tight_layout()
-
-                    # Конвертируем в pygame surface
-                    fig.canvas.draw()
-                    buf = np.frombuffer(fig.canvas.buffer_rgba(), dtype=np.uint8)
-                    width, height = fig.canvas.get_width_height()
-                    buf = buf.reshape(height, width, 4)  # RGBA формат
-
-                    # Конвертируем в RGB для pygame (убираем альфа-канал)
-                    rgb_buf = buf[:, :, :3]
-                    histogram_surf = pygame.surfarray.make_surface(rgb_buf.swapaxes(0, 1))
-
-                    # Масштабируем под размер области
-                    scaled_surf = pygame.transform.scale(
-                        histogram_surf,
-                        (int(self.histogram_area.width // 2 - 15), int(self.histogram_area.height // 2 - 40))
-                    )
-                    histogram_surfaces.append(scaled_surf)
-                    plt.close(fig)
+                for channel, color in zip(counts, colors):
+                    histogram_surfaces.append(histogram_surface(channel, size, [color]))
 
                 # Создаем совмещенную гистограмму
-                fig, ax = plt.subplots(figsize=(2, 3))
-                for i, color in enumerate(colors):
-                    ax.hist(img[:, :, i].flatten(), bins=bins, alpha=0.6, color=color,
-                            density=True, label=color_names[i])
-
-                ax.set_title('Совмещенные каналы', fontsize=9)
-                ax.legend(fontsize=7)
-                ax.tick_params(axis='both', which='major', labelsize=7)
-                plt.tight_layout()
-
-                # Конвертируем в pygame surface
-                fig.canvas.draw()
-                buf = np.frombuffer(fig.canvas.buffer_rgba(), dtype=np.uint8)
-                width, height = fig.canvas.get_width_height()
-                buf = buf.reshape(height, width, 4)  # RGBA формат
-
-                # Конвертируем в RGB для pygame (убираем альфа-канал)
-                rgb_buf = buf[:, :, :3]
-                histogram_surf = pygame.surfarray.make_surface(rgb_buf.swapaxes(0, 1))
-
-                scaled_surf = pygame.transform.scale(
-                    histogram_surf,
-                    (int(self.histogram_area.width // 2 - 15), int(self.histogram_area.height // 2 - 40))
-                )
-                histogram_surfaces.append(scaled_surf)
-                plt.close(fig)
+                histogram_surfaces.append(histogram_surface(counts, size, colors, alpha=0.6))
 
             return histogram_surfaces
 
@@ -244,78 +166,54 @@ class App:
                 histogram_surfaces.append(fallback_surf)
             return histogram_surfaces
 
-    def process_image(self, img_array, process_type="original"):
-        """
-        Обрабатывает изображение в зависимости от типа обработки
-        Args:
-            img_array: numpy array изображения
-            process_type: тип обработки ("original", "red", "green", "blue")
-        Returns:
-            обработанный numpy array
+    def create_processed_surfaces(self, index):
         """
+        Создает 4 версии изображения index для показа: оригинал и три канала.
 
-        if abs(int(img_array[:, :, 0][0][0]) - img_array[:, :, 0][0][0]) > 0.0001:
-            img_array = img_array.copy()
-            img_array *= 255
-
-        if process_type == "original":
-            return img_array.copy()
-        # red -> 0, green -> 1, blue -> 2
-        elif process_type == "red":
-            processed = img_array.copy()
-            if len(processed.shape) == 3:
-                processed[:, :, 1] = 0
-                processed[:, :, 2] = 0
-                # print(np.unique(processed[:, :, 1]).shape)
-            # plt.imsave(arr=processed, fname=os.path.join(base_dir, "assets", 'red.jpg'))
-            return processed
-        elif process_type == "green":
-            processed = img_array.copy()
-            if len(processed.shape) == 3:
-                processed[:, :, 0] = 0
-                processed[:, :, 2] = 0
-            return processed
-        elif process_type == "blue":
-            processed = img_array.copy()
-            if len(processed.shape) == 3:
-                processed[:, :, 0] = 0
-                processed[:, :, 1] = 0
-            return processed
-        return img_array.copy()
-
-    def create_processed_surfaces(self):
-        """Создает 4 обработанные версии текущего изображения"""
-        if not self.images or self.selected_image_index >= len(self.images):
+        Каналы выделяются на миниатюре из кэша, а не на полноразмерном массиве:
+        копия миниатюры умножается на маску канала (BLEND_RGB_MULT с (255, 0, 0) и т.п.),
+        так что полноразмерное изображение не копируется ни разу. Масштабирование
+        и выделение канала перестановочны, поэтому результат тот же.
+        """
+        if not self.image_surfaces or index >= len(self.image_surfaces):
             return []
 
-        base_img = self.images[self.selected_image_index].copy()
-        process_types = ["original", "red", "green", "blue"]
-        processed_surfaces = []
-
-        for process_type in process_types:
-            processed_img = self.process_image(base_img, process_type)
-
-            try:
-                # Создаем pygame surface через разные подходы
-                if processed_img.shape[2] == 3:  # RGB
-                    surf = pygame.surfarray.make_surface(processed_img.swapaxes(0, 1))
-                else:  # RGBA
-                    surf = pygame.surfarray.make_surface(processed_img[:, :, :3].swapaxes(0, 1))
-
-                scaled_surf = pygame.transform.scale(surf, (self.thumb_width, self.thumb_height))
-                processed_surfaces.append(scaled_surf)
-
-            except Exception as e:
-                print(f"Ошибка создания surface для {process_type}: {e}")
-                print(f"Форма массива: {processed_img.shape}, тип: {processed_img.dtype}")
-
-                # Создаем заглушку
-                fallback_surf = pygame.Surface((self.thumb_width, self.thumb_height))
-                fallback_surf.fill((100, 100, 100))  # Серый цвет
-                processed_surfaces.append(fallback_surf)
-
+        size = (self.thumb_width, self.thumb_height)
+        try:
+            original = self.image_surfaces[index]
+            if original.get_size() != size:
+                original = pygame.transform.scale(original, size)
+        except Exception as e:
+            print(f"Ошибка создания surface для изображения {index}: {e}")
+            original = pygame.Surface(size)
+            original.fill((100, 100, 100))  # Серый цвет
+
+        processed_surfaces = [original]
+        for mask in CHANNEL_MASKS.values():
+            surf = original.copy()
+            surf.fill(mask, special_flags=BLEND_RGB_MULT)
+            processed_surfaces.append(surf)
         return processed_surfaces
 
+    def prepare_image(self, index, cancelled):
+        """
+        Готовит все для показа изображения index: разложение по каналам и гистограммы.
+        Вызывается в фоновом потоке (Prefetcher), при отмене возвращает None.
+        """
+        processed_surfaces = self.create_processed_surfaces(index)
+        if cancelled():
+            return None
+        return processed_surfaces, self.create_histograms(index)
+
+    def update_shown_image(self):
+        """Подхватывает результат фоновой подготовки для выбранного изображения, если он готов."""
+        if self.shown_image_index == self.selected_image_index:
+            return
+        prepared = self.prefetcher.get(self.selected_image_index)
+        if prepared is not None:
+            self.processed_surfaces, self.histogram_surfaces = prepared
+            self.shown_image_index = self.selected_image_index
+
     def draw_interface(self):
         """
         Отрисовка интерфейса
@@ -329,7 +227,12 @@ class App:
 
         # Отрисовка текущего изображения
         if self.image_surfaces and self.selected_image_index < len(self.image_surfaces):
-            processed_surfaces = self.create_processed_surfaces()
+            ready = self.shown_image_index == self.selected_image_index
+            processed_surfaces = self.processed_surfaces if ready else []
+
+            if not ready:
+                text_surf = self.font_medium.render("Обработка...", True, self.colors['text'])
+                self.screen.blit(text_surf, (self.images_area.x + 10, self.images_area.y + 40))
 
             if processed_surfaces:
                 # Заголовки для каждой версии
@@ -356,7 +259,7 @@ class App:
             self.screen.blit(text_surf, (self.images_area.x + 10, self.images_area.y + 10))
 
             # Отрисовка четырех гистограмм
-            if self.histogram_surfaces:
+            if ready and self.histogram_surfaces:
                 histogram_titles = ["Красный канал", "Зеленый канал", "Синий канал", "Совмещенная"]
 
                 for i, (hist_surf, title) in enumerate(zip(self.histogram_surfaces, histogram_titles)):
@@ -404,7 +307,8 @@ class App:
                     new_index = event.key - K_1
                     if new_index < len(self.image_surfaces):
                         self.selected_image_index = new_index
-                        self.histogram_surfaces = self.create_histograms()  # Пересоздаем гистограммы
+                        # Каналы и гистограммы считаются в фоне, см. update_shown_image
+                        self.prefetcher.request(new_index, len(self.images))
 
     def main_loop(self):
         """
@@ -413,19 +317,22 @@ class App:
         # Загружаем изображения
         self.load_images()
 
-        # Создаем начальные гистограммы
+        # Запускаем фоновую подготовку первого изображения и соседей
+        self.prefetcher.start()
         if self.images:
-            self.histogram_surfaces = self.create_histograms()
+            self.prefetcher.request(self.selected_image_index, len(self.images))
 
         self.running = True
         clock = pygame.time.Clock()
 
         while self.running:
             self.handle_events()
+            self.update_shown_image()
             self.draw_interface()  # Добавили отрисовку!
             pygame.display.flip()
             clock.tick(60)
 
+        self.prefetcher.stop()
         pygame.quit()
 
 
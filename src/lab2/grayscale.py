@@ -1,10 +1,25 @@
 import random
 import pygame
 import os
+import sys
 import numpy as np
-import matplotlib.pyplot as plt
 from pygame.locals import *
 
+# Общий пакет загрузки изображений лежит в src/imaging
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from imaging.color_convert import GRAYSCALE_BT601, GRAYSCALE_BT709
+from imaging.image_cache import ImageCache
+from imaging.prefetch import Prefetcher
+from histogram import channel_histograms, histogram_surface
+from op_graph import image, evaluate
+
+# Полутоновые версии и их разность одним проходом: общие полутоновые узлы считаются один раз
+_source = image()
+_gray1 = _source.grayscale(GRAYSCALE_BT601)
+_gray2 = _source.grayscale(GRAYSCALE_BT709)
+GRAYSCALE_VIEWS = [_gray1.rgb(), _gray2.rgb(), _gray1.abs_diff(_gray2, gain=10).rgb()]
+
 base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 Image_list = [
     os.path.join(base_dir, "assets", "house1.jpg"),
@@ -59,11 +74,13 @@ class App:
 
         # Изображения и данные
         self.images = []
-        self.processed_images = []
         self.image_size = (200, 200)
         self.image_surfaces = []
         self.histogram_surfaces = []
+        self.processed_surfaces = []
         self.selected_image_index = 0
+        self.shown_image_index = None  # для какого изображения готовы processed_surfaces и гистограммы
+        self.prefetcher = Prefetcher(self.prepare_image)
         self.current_image_path = None
 
         # Позиции и размеры
@@ -111,19 +128,17 @@ class App:
 
     def load_images(self):
         """
-        Загружает все доступные изображения
+        Подключает все доступные изображения через общий кэш: файлы декодируются
+        лениво при первом выборе, а не все сразу при старте
         """
-        self.image_surfaces = []
-        self.images = []
-
-        # Пробуем загрузить изображения из списка
-        loaded_count = 0
-        for path in Image_list:
-            if self.load_single_image(path):
-                loaded_count += 1
-
-        # Если не удалось загрузить изображения, создаем тестовые
-        if loaded_count == 0:
+        self.image_cache = ImageCache(Image_list, (self.thumb_width, self.thumb_height))
+        self.image_surfaces = self.image_cache.thumbnails
+        self.images = self.image_cache.arrays
+
+        # Если не нашлось ни одного изображения, создаем тестовые
+        if len(self.image_cache) == 0:
+            self.image_surfaces = []
+            self.images = []
             print("Не найдены файлы изображений, создаем тестовые изображения")
             test_colors = [(255, 100, 100), (100, 255, 100), (100, 100, 255), (255, 255, 100)]
             for i, color in enumerate(test_colors):
@@ -134,123 +149,30 @@ class App:
                 self.images.append(fake_array)
                 print(f"Создано тестовое изображение {i + 1}")
 
-    def load_single_image(self, path):
+    def create_histograms(self, processed_images):
         """
-        Загружает одно изображение
+        Создает 2 гистограммы по обработанным версиям изображения
+        (для каждого метода перевода в полутоновое)
         """
-        try:
-            if os.path.exists(path):
-                img_surf = pygame.image.load(path).convert()
-                scaled_img_surf = pygame.transform.scale(
-                    img_surf,
-                    (self.thumb_width, self.thumb_height)
-                )
-                self.image_surfaces.append(scaled_img_surf)
-
-                # Загружаем как numpy array для гистограммы
-                try:
-                    img_array = plt.imread(path)
-                    self.images.append(img_array)
-                except:
-                    # Если plt.imread не работает, создаем массив из pygame surface
-                    img_array = pygame.surfarray.array3d(scaled_img_surf)
-                    img_array = np.transpose(img_array, (1, 0, 2))  # Поворачиваем массив
-                    self.images.append(img_array)
-
-                print(f"Загружено изображение: {os.path.basename(path)}")
-                return True
-            else:
-                print(f"Файл не найден: {path}")
-                return False
-        except Exception as e:
-            print(f"Ошибка загрузки {path}: {e}")
-            return False
-
-    def to_grayscale_1(self, img):
-        temp_img = img.copy()
-        new_img = img.copy()
-        temp_array = temp_img[:,:,0]*0.299 + temp_img[:,:,1]*0.587 + temp_img[:,:,2]*0.114
-        new_img[:,:,0] = temp_array
-        new_img[:,:,1] = temp_array
-        new_img[:,:,2] = temp_array
-        return new_img
-
-    def to_grayscale_2(self, img):
-        # temp_img = img.copy()
-        # new_img = temp_img[:,:,0]#*0.2126 + temp_img[:,:,1]*0.7152 + temp_img[:,:,2]*0.0722
-        temp_img = img.copy()
-        new_img = img.copy()
-        temp_array = temp_img[:,:,0]*0.2126 + temp_img[:,:,1]*0.7152 + temp_img[:,:,2]*0.0722
-        new_img[:,:,0] = temp_array
-        new_img[:,:,1] = temp_array
-        new_img[:,:,2] = temp_array
-        return new_img
-
-    def grayscale_sub(self, img1, img2):
-        # new_img = np.abs(img1 - img2)
-        # for i in range(new_img.shape[0]):
-        #     new_img[:,i] = np.abs(img1[:,i] - img2[:,i])
-        #     print(img1[i])
-        # # new_img = img2
-        # print (new_img)
-
-        height, width, channels = img1.shape
-        new_img = np.zeros_like(img1)  # Создаем пустое изображение для результата
-
-        for i in range(height):
-            for j in range(width):
-                lmao = np.uint8(abs(int(img1[i, j, 0]) - int(img2[i, j, 0])))*10
-                for c in range(channels):
-                    new_img[i, j, c] = lmao
-        return new_img
-
-    def create_histograms(self):
-        """
-        Создает 4 гистограммы для текущего изображения:
-        - 3 отдельные гистограммы для каждого цветового канала
-        - 1 совмещенная гистограмма со всеми тремя каналами
-        """
-        if not self.images or self.selected_image_index >= len(self.images):
+        if not processed_images:
             return []
 
         try:
-            img = self.images[self.selected_image_index]
+            img = processed_images[0]
 
             # Нормализуем значения, если они в диапазоне [0, 1]
 
             histogram_surfaces = []
 
             if len(img.shape) == 3:  # Цветное изображение
-                colors = ['lightgray', 'darkgray']
-                methods_names = ['Полутоновое 1', 'Полутоновое 2']
-
-                # Создаем 2 гистограммы для каждого метода
-                for i, (color, name) in enumerate(zip(colors, methods_names)):
-                    fig, ax = plt.subplots(figsize=(2, 2))
-                    ax.hist(self.processed_images[i][:, :, 0].flatten(), bins=16, alpha=0.8, color=color, density=True)
-                    # ax.set_xlabel('Значение пикселя', fontsize=8)
-                    # ax.set_ylabel('Плотность', fontsize=8)
-                    ax.set_title(name, fontsize=9)
-                    ax.tick_params(axis='both', which='major', labelsize=7)
-                    plt.tight_layout()
-                    
-                    # Конвертируем в pygame surface
-                    fig.canvas.draw()
-                    buf = np.frombuffer(fig.canvas.buffer_rgba(), dtype=np.uint8)
-                    width, height = fig.canvas.get_width_height()
-                    buf = buf.reshape(height, width, 4)  # RGBA формат
-
-                    # Конвертируем в RGB для pygame (убираем альфа-канал)
-                    rgb_buf = buf[:, :, :3]
-                    histogram_surf = pygame.surfarray.make_surface(rgb_buf.swapaxes(0, 1))
-                    
-                    # Масштабируем под размер области
-                    scaled_surf = pygame.transform.scale(
-                        histogram_surf,
-                        (int(self.thumb_width), int(self.thumb_height))
+                colors = [(211, 211, 211), (169, 169, 169)]  # lightgray, darkgray
+
+                # Создаем 2 гистограммы для каждого метода (16 корзин, один проход bincount)
+                for i, color in enumerate(colors):
+                    counts = channel_histograms(processed_images[i + 1][:, :, 0], bins=16)
+                    histogram_surfaces.append(
+                        histogram_surface(counts, (self.thumb_width, self.thumb_height), [color])
                     )
-                    histogram_surfaces.append(scaled_surf)
-                    plt.close(fig)
 
             return histogram_surfaces
 
@@ -265,40 +187,11 @@ class App:
                 histogram_surfaces.append(fallback_surf)
             return histogram_surfaces
 
-    def process_image(self, img_array, process_type="original"):
-        """
-        Обрабатывает изображение в зависимости от типа обработки
-        Args:
-            img_array: numpy array изображения
-            process_type: тип обработки ("original", "halftone1", "halftone2", "substraction")
-        Returns:
-            обработанный numpy array
-        """
-
-        if process_type == "original":
-            return img_array.copy()
-        # red -> 0, green -> 1, blue -> 2
-        elif process_type == "halftone1":
-            processed = self.to_grayscale_1(img_array)
-            # plt.imsave(arr=processed, fname=os.path.join(base_dir, "assets", 'red.jpg'))
-            return processed
-        elif process_type == "halftone2":
-            processed = self.to_grayscale_2(img_array)
-            return processed
-        elif process_type == "substraction":
-            processed = self.grayscale_sub(self.to_grayscale_1(img_array), self.to_grayscale_2(img_array))
-            return processed
-        return img_array.copy()
-
-    def create_processed_surfaces(self):
-        """Создает 4 обработанные версии текущего изображения"""
-        if not self.images or self.selected_image_index >= len(self.images):
-            return []
-
+    def create_processed_surfaces(self, processed_images):
+        """Создает миниатюры 4 обработанных версий изображения"""
         processed_surfaces = []
 
-        for processed_img in self.processed_images:
-
+        for processed_img in processed_images:
 
             try:
                 # Создаем pygame surface через разные подходы
@@ -311,7 +204,7 @@ class App:
                 processed_surfaces.append(scaled_surf)
 
             except Exception as e:
-                print(f"Ошибка создания surface для {process_type}: {e}")
+                print(f"Ошибка создания surface: {e}")
                 print(f"Форма массива: {processed_img.shape}, тип: {processed_img.dtype}")
 
                 # Создаем заглушку
@@ -321,30 +214,48 @@ class App:
 
         return processed_surfaces
 
-    def create_processed_images(self):
-        """Создает 4 обработанные версии текущего изображения"""
-        if not self.images or self.selected_image_index >= len(self.images):
+    def create_processed_images(self, index):
+        """Создает 4 обработанные версии изображения index"""
+        if not self.images or index >= len(self.images):
             return []
 
-        base_img = self.images[self.selected_image_index].copy()
-        print(np.max(base_img))
-        process_types = ["original", "halftone1", "halftone2", "substraction"]
-        processed_images = []
-
-        for process_type in process_types:
-            processed_img = self.process_image(base_img, process_type)
+        base_img = self.images[index]  # evaluate только читает вход, копия не нужна
 
-            try:
-                processed_images.append(processed_img)
+        try:
+            # "halftone1", "halftone2", "substraction" - одним проходом графа GRAYSCALE_VIEWS
+            return [base_img] + evaluate(GRAYSCALE_VIEWS, base_img)
 
-            except Exception as e:
-                print(f"Ошибка обработки изображения для {process_type}: {e}")
-                print(f"Форма массива: {processed_img.shape}, тип: {processed_img.dtype}")
+        except Exception as e:
+            print(f"Ошибка обработки изображения: {e}")
+            print(f"Форма массива: {base_img.shape}, тип: {base_img.dtype}")
 
-                # Возвращаем то же изображение
-                processed_images.append(base_img)
+            # Возвращаем то же изображение
+            return [base_img] * 4
 
-        return processed_images
+    def prepare_image(self, index, cancelled):
+        """
+        Готовит все для показа изображения index: миниатюры обработанных версий
+        и гистограммы. Вызывается в фоновом потоке (Prefetcher), между этапами
+        проверяет отмену и тогда возвращает None. Полноразмерные обработанные версии
+        в результат не входят: Prefetcher держит его для соседних изображений тоже.
+        """
+        processed_images = self.create_processed_images(index)
+        if cancelled():
+            return None
+        processed_surfaces = self.create_processed_surfaces(processed_images)
+        if cancelled():
+            return None
+        histogram_surfaces = self.create_histograms(processed_images)
+        return processed_surfaces, histogram_surfaces
+
+    def update_shown_image(self):
+        """Подхватывает результат фоновой подготовки для выбранного изображения, если он готов."""
+        if self.shown_image_index == self.selected_image_index:
+            return
+        prepared = self.prefetcher.get(self.selected_image_index)
+        if prepared is not None:
+            self.processed_surfaces, self.histogram_surfaces = prepared
+            self.shown_image_index = self.selected_image_index
 
     def draw_interface(self):
         """
@@ -369,7 +280,12 @@ class App:
 
         # Отрисовка текущего изображения
         if self.image_surfaces and self.selected_image_index < len(self.image_surfaces):
-            processed_surfaces = self.create_processed_surfaces()
+            ready = self.shown_image_index == self.selected_image_index
+            processed_surfaces = self.processed_surfaces if ready else []
+
+            if not ready:
+                text_surf = self.font_medium.render("Обработка...", True, self.colors['text'])
+                self.screen.blit(text_surf, (self.images_area.x + 10, self.images_area.y + 40))
 
             if processed_surfaces:
                 # Заголовки для каждой версии
@@ -394,7 +310,7 @@ class App:
             self.screen.blit(text_surf, (self.images_area.x + 10, self.images_area.y + 5))
 
             # Отрисовка двух гистограмм
-            if self.histogram_surfaces:
+            if ready and self.histogram_surfaces:
                 histogram_titles = ["Полутоновое 1", "Полутоновое 2", "asd"]
 
                 y = self.histogram_area.y + 35
@@ -416,8 +332,8 @@ class App:
         new_index = (len(self.image_surfaces) + self.selected_image_index + changer) % len(self.image_surfaces)
         if new_index < len(self.image_surfaces):
             self.selected_image_index = new_index
-            self.processed_images = self.create_processed_images() # Пересоздаём изображения
-            self.histogram_surfaces = self.create_histograms()  # Пересоздаем гистограммы
+            # Обработка и гистограммы считаются в фоне (вместе с соседями), см. update_shown_image
+            self.prefetcher.request(new_index, len(self.images))
 
     def collide(self, point, collision_box):
         x_col = (collision_box.x <= point[0]) and (collision_box.x + collision_box.width >= point[0])
@@ -453,20 +369,22 @@ class App:
         # Загружаем изображения
         self.load_images()
 
-        # Создаем начальные гистограммы
+        # Запускаем фоновую подготовку первого изображения и соседей
+        self.prefetcher.start()
         if self.images:
-            self.processed_images = self.create_processed_images()
-            self.histogram_surfaces = self.create_histograms()
+            self.prefetcher.request(self.selected_image_index, len(self.images))
 
         self.running = True
         clock = pygame.time.Clock()
 
         while self.running:
             self.handle_events()
+            self.update_shown_image()
             self.draw_interface()  # Добавили отрисовку!
             pygame.display.flip()
             clock.tick(60)
 
+        self.prefetcher.stop()
         pygame.quit()
 
 
@@ -0,0 +1,101 @@
+import numpy as np
+import pygame
+from image_ops import to_uint8
+
+
+# ===== Гистограммы изображений без matplotlib =====
+# Все каналы считаются одним np.bincount по uint8-данным, столбцы рисуются прямо в
+# NumPy-буфер. matplotlib нужен только для экспорта в файл и импортируется лениво.
+
+STRIP_PIXELS = 1 << 16  # пикселей на полосу: ограничивает память под индексы bincount
+
+
+def channel_histograms(img: np.ndarray, bins: int = 256) -> np.ndarray:
+    """
+    Гистограммы всех каналов изображения (H, W, C) или (H, W), форма (C, bins).
+
+    К значению канала c прибавляется смещение c * 256, и все каналы считаются
+    одним вызовом np.bincount. Большие изображения идут полосами по строкам,
+    чтобы не держать в памяти int-индексы для всего кадра. Диапазон фиксирован
+    [0, 255]; bins должно делить 256.
+    """
+    if bins <= 0 or 256 % bins:
+        raise ValueError(f"Число корзин должно делить 256: {bins}")
+    data = to_uint8(img)
+    if data.ndim == 2:
+        data = data[:, :, np.newaxis]
+    height, width, channels = data.shape
+    offsets = np.arange(channels, dtype=np.intp) * 256
+
+    counts = np.zeros(channels * 256, dtype=np.int64)
+    rows = max(1, STRIP_PIXELS // max(width, 1))
+    for y in range(0, height, rows):
+        idx = data[y:y + rows].astype(np.intp)
+        idx += offsets
+        counts += np.bincount(idx.ravel(), minlength=channels * 256)
+
+    return counts.reshape(channels, bins, 256 // bins).sum(axis=2)
+
+
+def draw_histogram(counts: np.ndarray, size, colors, background=(255, 255, 255),
+                   alpha: float = 0.8) -> np.ndarray:
+    """
+    Рисует столбцы гистограмм в RGB-буфер в раскладке pygame.surfarray (W, H, 3).
+
+    counts - (bins,) или (C, bins), colors - по цвету RGB на канал. Каналы
+    накладываются полупрозрачно в общем масштабе (по максимуму всех столбцов),
+    поэтому совмещенная гистограмма сравнима по высоте, как при density=True.
+    """
+    counts = np.atleast_2d(np.asarray(counts, dtype=np.float64))
+    width, height = int(size[0]), int(size[1])
+    buf = np.empty((width, height, 3), dtype=np.float32)
+    buf[:] = background
+
+    peak = counts.max()
+    if peak <= 0 or width <= 0 or height <= 0:
+        return buf.astype(np.uint8)
+
+    bins = counts.shape[1]
+    column_bin = np.arange(width) * bins // width  # корзина для каждого столбца пикселей
+    rows = np.arange(height)
+    for channel, color in zip(counts, colors):
+        bar = np.rint(channel[column_bin] / peak * (height - 1)).astype(np.intp)
+        mask = rows[np.newaxis, :] >= (height - bar)[:, np.newaxis]
+        buf[mask] = buf[mask] * (1 - alpha) + np.asarray(color, dtype=np.float32) * alpha
+
+    # Ось абсцисс
+    buf[:, height - 1] = 0
+    return buf.astype(np.uint8)
+
+
+def histogram_surface(counts: np.ndarray, size, colors, background=(255, 255, 255),
+                      alpha: float = 0.8) -> pygame.Surface:
+    """Гистограмма как pygame.Surface заданного размера, без масштабирования."""
+    return pygame.surfarray.make_surface(draw_histogram(counts, size, colors, background, alpha))
+
+
+def export_histogram(counts: np.ndarray, path: str, colors, title: str = "", labels=None):
+    """
+    Сохраняет гистограмму в файл через matplotlib (импортируется только здесь).
+
+    colors - RGB-кортежи 0..255, как для draw_histogram.
+    """
+    from matplotlib.figure import Figure
+
+    counts = np.atleast_2d(np.asarray(counts, dtype=np.float64))
+    bins = counts.shape[1]
+    edges = np.linspace(0, 256, bins + 1)
+    density = counts / (counts.sum(axis=1, keepdims=True) * (256 / bins))
+
+    fig = Figure(figsize=(4, 3))
+    ax = fig.subplots()
+    for i, (channel, color) in enumerate(zip(density, colors)):
+        label = labels[i] if labels else None
+        ax.stairs(channel, edges, fill=True, alpha=0.6,
+                  color=np.asarray(color) / 255, label=label)
+    if title:
+        ax.set_title(title)
+    if labels:
+        ax.legend()
+    fig.tight_layout()
+    fig.savefig(path)
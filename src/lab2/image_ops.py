@@ -0,0 +1,188 @@
+import numpy as np
+
+from imaging import color_convert
+from imaging.color_convert import luminance, GRAYSCALE_BT601
+
+
+# ===== Операции над изображениями (H, W, C) =====
+# Все операции векторизованы. Изображения приходят уже в uint8 (тип приводится при загрузке,
+# imaging.color_convert.normalize_image), но float в [0, 1] тоже принимается.
+# Операции, помеченные @pointwise, считают каждый пиксель независимо от соседей, поэтому
+# их можно применять к полосам изображения по отдельности (см. tiling.py).
+
+def pointwise(func):
+    """Помечает операцию как попиксельную: результат полосы не зависит от остальных строк."""
+    func.pointwise = True
+    return func
+
+
+def is_pointwise(func) -> bool:
+    return getattr(func, 'pointwise', False)
+
+
+@pointwise
+def to_uint8(img: np.ndarray) -> np.ndarray:
+    """Приводит изображение к uint8 (см. imaging.color_convert.to_uint8)."""
+    return color_convert.to_uint8(img)
+
+
+@pointwise
+def abs_diff(img1: np.ndarray, img2: np.ndarray, gain: int = 1) -> np.ndarray:
+    """
+    Разность изображений |img1 - img2| * gain с насыщением в [0, 255], uint8.
+
+    Всё считается в uint8 на месте, без промежуточных int16-массивов:
+    |a - b| = max(a, b) - min(a, b) не переполняется, а при усилении пиксели,
+    которые после умножения вышли бы за 255, заранее помечаются маской и
+    выставляются в 255 побитовым ИЛИ. Изображения должны совпадать по форме
+    (каналы сравниваются попарно).
+    """
+    a, b = to_uint8(img1), to_uint8(img2)
+    if a.shape != b.shape:
+        raise ValueError(f"Разные размеры изображений: {a.shape} и {b.shape}")
+    diff = np.maximum(a, b)
+    diff -= np.minimum(a, b)
+    gain = min(max(int(gain), 0), 255)  # при gain >= 255 любая ненулевая разность уже даёт 255
+    if gain != 1:
+        limit = 255 // gain if gain else 255
+        saturated = np.greater(diff, limit).view(np.uint8)
+        saturated *= 255
+        np.minimum(diff, limit, out=diff)
+        diff *= np.uint8(gain)
+        diff |= saturated
+    return diff
+
+
+# ===== Полутоновое и каналы =====
+
+@pointwise
+def to_grayscale(img: np.ndarray, weights=GRAYSCALE_BT601) -> np.ndarray:
+    """
+    Полутоновое изображение: Y = w_r*R + w_g*G + w_b*B во всех трех каналах.
+    Тип массива и альфа-канал сохраняются; для uint8 Y считается в фиксированной точке
+    (color_convert.luminance), без float-временных массивов.
+    """
+    out = np.array(img, copy=True)
+    gray = luminance(out, weights)
+    out[..., 0] = gray
+    out[..., 1] = gray
+    out[..., 2] = gray
+    return out
+
+
+@pointwise
+def isolate_channel(img: np.ndarray, channel: int) -> np.ndarray:
+    """Оставляет один канал RGB (0 - R, 1 - G, 2 - B), остальные обнуляет; альфа не трогается."""
+    out = np.array(img, copy=True)
+    for other in range(3):
+        if other != channel:
+            out[..., other] = 0
+    return out
+
+
+# ===== HSV =====
+
+def rgb2hsv(rgb):
+    r, g, b = rgb[...,0], rgb[...,1], rgb[...,2]
+
+    maxc = np.max(rgb, axis=-1)
+    minc = np.min(rgb, axis=-1)
+    Δc = (maxc - minc)
+
+    h = np.zeros_like(maxc)
+    s = Δc / maxc
+    v = maxc
+
+    rmask = (maxc == r)
+    gmask = (maxc == g)
+    bmask = (maxc == b)
+
+    rc = (maxc - r) / Δc
+    gc = (maxc - g) / Δc
+    bc = (maxc - b) / Δc
+
+    h[rmask] = bc[rmask] - gc[rmask] + 6
+    h[gmask] = rc[gmask] - bc[gmask] + 2
+    h[bmask] = gc[bmask] - rc[bmask] + 4
+    h = (h / 6.0) % 1.0
+
+    return np.stack([h, s, v], axis=-1)
+
+
+def hsv2rgb(hsv):
+    h, s, v = hsv[...,0], hsv[...,1], hsv[...,2]
+    i = np.floor(h * 6).astype(int)  # номер сектора
+    f = h * 6 - i  # дробная часть сектора
+    p = v * (1 - s)  # V_min минимальное значение канала
+    q = v * (1 - f * s)  # V_dec  промежуточное значение 
+    t = v * (1 - (1 - f) * s)  # V_inc промежуточное значение, но в другую сторону
+    rgb = np.zeros_like(hsv)
+
+    rgb[...,0] = np.choose(i % 6, [v, q, p, p, t, v])
+    rgb[...,1] = np.choose(i % 6, [t, v, v, q, p, p])
+    rgb[...,2] = np.choose(i % 6, [p, p, t, v, v, q])
+    return rgb
+
+
+class HsvAdjuster:
+    """
+    Сдвиг H/S/V изображения, пересчитываемый только при изменении сдвигов.
+
+    hsv2rgb раскладывается как rgb_c = v * (1 - s * K_c(h)), где K_c - кусочно-линейная
+    функция тона. Поворот тона сводится к таблице K на HUE_LEVELS квантованных тонов,
+    которая строится заново за O(HUE_LEVELS), а на пиксель остается одна выборка из
+    таблицы и пара умножений в float32 над заранее выделенными буферами.
+    """
+    HUE_LEVELS = 4096  # ошибка квантования тона < 0.2 уровня яркости из 255
+
+    def __init__(self, rgb):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            hsv = rgb2hsv(np.asarray(rgb, dtype=np.float32))
+        hsv = np.nan_to_num(hsv)  # серые и черные пиксели: тон и насыщенность 0
+        self.hue_index = (np.rint(hsv[..., 0] * self.HUE_LEVELS) % self.HUE_LEVELS).astype(np.uint16)
+        self.s = np.ascontiguousarray(hsv[..., 1], dtype=np.float32)
+        self.v = np.ascontiguousarray(hsv[..., 2], dtype=np.float32)
+
+        self._s = np.empty_like(self.s)
+        self._v = np.empty_like(self.v)
+        self._rgb = np.empty(self.s.shape + (3,), dtype=np.float32)
+        self.result = np.empty(self.s.shape + (3,), dtype=np.uint8)
+        self.shifts = None
+
+    def hue_table(self, h_shift):
+        """K_c для каждого квантованного тона, повернутого на h_shift: (HUE_LEVELS, 3)."""
+        hue = (np.arange(self.HUE_LEVELS, dtype=np.float32) / self.HUE_LEVELS + h_shift) % 1.0
+        ones = np.ones_like(hue)
+        return 1 - hsv2rgb(np.stack([hue, ones, ones], axis=-1))
+
+    def apply(self, h_shift, s_shift, v_shift):
+        """
+        Возвращает uint8 RGB со сдвигами; если сдвиги не менялись - прошлый результат
+        без пересчета. Буфер результата переиспользуется между вызовами.
+        """
+        shifts = (h_shift, s_shift, v_shift)
+        if shifts == self.shifts:
+            return self.result
+        self.shifts = shifts
+
+        np.add(self.s, s_shift, out=self._s)
+        np.clip(self._s, 0, 1, out=self._s)
+        np.add(self.v, v_shift, out=self._v)
+        np.clip(self._v, 0, 1, out=self._v)
+
+        rgb = self._rgb
+        np.take(self.hue_table(h_shift), self.hue_index, axis=0, out=rgb)
+        rgb *= self._s[..., np.newaxis]
+        np.subtract(1, rgb, out=rgb)
+        rgb *= self._v[..., np.newaxis]
+        rgb *= 255
+        np.copyto(self.result, rgb, casting='unsafe')
+        return self.result
+
+
+@pointwise
+def shift_hsv(img: np.ndarray, h_shift: float = 0.0, s_shift: float = 0.0, v_shift: float = 0.0) -> np.ndarray:
+    """Сдвиг тона, насыщенности и яркости изображения (RGB uint8 на выходе), см. HsvAdjuster."""
+    rgb = to_uint8(img)[..., :3].astype(np.float32)
+    rgb /= 255
+    return HsvAdjuster(rgb).apply(h_shift, s_shift, v_shift)
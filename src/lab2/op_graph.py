@@ -0,0 +1,187 @@
+import numpy as np
+
+from imaging.color_convert import fixed_point_weights, to_uint8, FIXED_POINT_ONE, FIXED_POINT_SHIFT, GRAYSCALE_BT601
+
+
+# ===== Ленивый граф попиксельных операций =====
+# Цепочка вида "полутоновое -> разность -> усиление" сначала описывается выражением,
+# а потом считается одним проходом по блокам строк: каждый узел пишет в свой буфер
+# размером с блок (out=, операции на месте), и полноразмерные массивы создаются только
+# для результатов. Одинаковые подвыражения (по структуре, а не по объекту) считаются
+# один раз на блок.
+#
+#     source = image()
+#     gray1, gray2 = source.grayscale(GRAYSCALE_BT601), source.grayscale(GRAYSCALE_BT709)
+#     diff = gray1.abs_diff(gray2, gain=10).rgb()
+#     gray1_rgb, diff_img = evaluate([gray1.rgb(), diff], img)
+
+BLOCK_PIXELS = 1 << 16  # пикселей в блоке: буферы всех узлов блока помещаются в кэш
+
+
+class Expr:
+    """
+    Узел выражения: вид операции, входные узлы и параметры.
+    Все узлы дают uint8 (H, W, C); key описывает узел структурно и служит для мемоизации.
+    """
+
+    def __init__(self, kind, inputs=(), params=()):
+        self.kind = kind
+        self.inputs = tuple(inputs)
+        self.params = tuple(params)
+        self.key = (kind, tuple(node.key for node in self.inputs), self.params)
+
+    def grayscale(self, weights=GRAYSCALE_BT601):
+        """Яркость Y = w·RGB, один канал (фиксированная точка, как color_convert.luminance)."""
+        return Expr('grayscale', (self,), fixed_point_weights(tuple(float(w) for w in weights)))
+
+    def abs_diff(self, other, gain=1):
+        """|self - other| * gain с насыщением, как image_ops.abs_diff."""
+        return Expr('abs_diff', (self, other), (min(max(int(gain), 0), 255),))
+
+    def channel(self, index):
+        """Оставляет канал index (0 - R, 1 - G, 2 - B), остальные RGB-каналы обнуляет."""
+        return Expr('channel', (self,), (int(index),))
+
+    def rgb(self):
+        """Одноканальное изображение в три одинаковых канала (для показа и сохранения)."""
+        return Expr('rgb', (self,))
+
+    def __repr__(self):
+        return f"Expr{self.key}"
+
+
+def image():
+    """Входное изображение выражения."""
+    return Expr('image')
+
+
+# ===== Ядра: пишут результат блока в out, временные массивы берут из workspace =====
+
+def _grayscale(out, workspace, x, *weights):
+    acc = workspace('acc', x.shape[:2], np.uint16)
+    tmp = workspace('tmp', x.shape[:2], np.uint16)
+    np.multiply(x[..., 0], weights[0], out=acc, dtype=np.uint16)
+    np.multiply(x[..., 1], weights[1], out=tmp, dtype=np.uint16)
+    acc += tmp
+    np.multiply(x[..., 2], weights[2], out=tmp, dtype=np.uint16)
+    acc += tmp
+    acc += FIXED_POINT_ONE // 2
+    acc >>= FIXED_POINT_SHIFT
+    np.copyto(out[..., 0], acc, casting='unsafe')
+
+
+def _abs_diff(out, workspace, a, b, gain):
+    np.maximum(a, b, out=out)
+    low = workspace('low', out.shape, np.uint8)
+    np.minimum(a, b, out=low)
+    out -= low
+    if gain != 1:
+        limit = 255 // gain if gain else 255
+        saturated = workspace('saturated', out.shape, np.bool_)
+        np.greater(out, limit, out=saturated)
+        np.minimum(out, limit, out=out)
+        out *= np.uint8(gain)
+        saturated = saturated.view(np.uint8)
+        saturated *= 255
+        out |= saturated
+
+
+def _channel(out, workspace, x, index):
+    out[...] = x
+    for other in range(3):
+        if other != index:
+            out[..., other] = 0
+
+
+def _rgb(out, workspace, x):
+    out[...] = x[..., :1]
+
+
+KERNELS = {
+    'grayscale': _grayscale,
+    'abs_diff': _abs_diff,
+    'channel': _channel,
+    'rgb': _rgb,
+}
+
+
+def _channels(node, source_channels, known):
+    """Число каналов результата узла."""
+    if node.key not in known:
+        inputs = [_channels(i, source_channels, known) for i in node.inputs]
+        known[node.key] = {
+            'image': lambda: source_channels,
+            'grayscale': lambda: 1,
+            'abs_diff': lambda: max(inputs),
+            'channel': lambda: inputs[0],
+            'rgb': lambda: 3,
+        }[node.kind]()
+    return known[node.key]
+
+
+def _topological_order(outputs):
+    """Уникальные (по key) узлы в порядке вычисления."""
+    order, seen = [], set()
+
+    def visit(node):
+        if node.key in seen:
+            return
+        for i in node.inputs:
+            visit(i)
+        seen.add(node.key)
+        order.append(node)
+
+    for node in outputs:
+        visit(node)
+    return order
+
+
+def evaluate(outputs, img, block_pixels=BLOCK_PIXELS):
+    """
+    Считает выражения outputs для изображения img (H, W, C) за один проход по блокам строк.
+    Возвращает список uint8-массивов (H, W, C_i) в порядке outputs.
+    """
+    img = to_uint8(img)
+    height, width = img.shape[:2]
+    order = _topological_order(outputs)
+    channels = {}
+    for node in order:
+        _channels(node, img.shape[2], channels)
+
+    result_of = {}  # полноразмерные массивы только для результатов
+    for node in outputs:
+        if node.key not in result_of:
+            result_of[node.key] = np.empty((height, width, channels[node.key]), dtype=np.uint8)
+
+    rows = max(1, block_pixels // max(width, 1))
+    buffers = {node.key: np.empty((rows, width, channels[node.key]), dtype=np.uint8)
+               for node in order if node.kind != 'image' and node.key not in result_of}
+    scratch = {}
+
+    def workspace(name, shape, dtype):
+        """Временный буфер ядра; общий для всех узлов, т.к. живет только внутри одного ядра."""
+        key = (name, tuple(shape[1:]), np.dtype(dtype))
+        if key not in scratch:
+            scratch[key] = np.empty((rows,) + key[1], dtype=dtype)
+        return scratch[key][:shape[0]]
+
+    for y in range(0, height, rows):
+        n = min(rows, height - y)
+        block = {}
+        for node in order:
+            if node.kind == 'image':
+                block[node.key] = img[y:y + n]
+                if node.key in result_of:
+                    result_of[node.key][y:y + n] = block[node.key]
+                continue
+            out = result_of[node.key][y:y + n] if node.key in result_of else buffers[node.key][:n]
+            KERNELS[node.kind](out, workspace, *(block[i.key] for i in node.inputs), *node.params)
+            block[node.key] = out
+
+    # Повторы одного выражения в outputs получают копии, чтобы массивы не были общими
+    results, returned = [], set()
+    for node in outputs:
+        result = result_of[node.key]
+        results.append(result.copy() if node.key in returned else result)
+        returned.add(node.key)
+    return results
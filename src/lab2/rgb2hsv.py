@@ -4,18 +4,21 @@ import numpy as np
 import os  # просто будь собой бро
 import sys  # просто будь собой бро
 
+# Общий пакет загрузки изображений лежит в src/imaging
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from imaging.image_cache import ImageCache, list_images
+from imaging.prefetch import Prefetcher
+from image_ops import HsvAdjuster
+
 
 class ImagesLoader:
     def __init__(self):
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         assets_dir = os.path.join(base_dir, "assets")
 
-        # Получаем список всех файлов в папке assets
-        self.image_list = [
-            os.path.join(assets_dir, filename)
-            for filename in os.listdir(assets_dir)
-            if filename.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp'))  # Фильтруем только изображения
-        ]
+        # Получаем список всех файлов в папке assets (без декодирования)
+        self.image_list = list_images(assets_dir)
         # self.image_list = [
         #     os.path.join(base_dir, "assets", "house1.jpg"),
         #     os.path.join(base_dir, "assets", "house2.jpg"),
@@ -32,6 +35,11 @@ class ImagesLoader:
 
         self.selected_image_index = 0
 
+        # Соседние миниатюры декодируются заранее в фоновом потоке
+        self.prefetcher = Prefetcher(lambda index, cancelled: self.image_surfaces[index])
+        self.prefetcher.start()
+        self.prefetcher.request(self.selected_image_index, len(self.image_surfaces))
+
 
         # Цвета
         self.colors = {
@@ -68,51 +76,19 @@ class ImagesLoader:
             )
         self.have_changed = False
 
-    def load_single_image(self, path):
-        """
-        Загружает одно изображение
-        """
-        try:
-            if os.path.exists(path):
-                img_surf = pg.image.load(path).convert()
-                scaled_img_surf = pg.transform.scale(
-                    img_surf,
-                    (self.thumb_width, self.thumb_height)
-                )
-                self.image_surfaces.append(scaled_img_surf)
-
-                # Загружаем как numpy array для гистограммы
-                try:
-                    img_array = plt.imread(path)
-                    self.images.append(img_array)
-                except:
-                    # Если plt.imread не работает, создаем массив из pg surface
-                    img_array = pg.surfarray.array3d(scaled_img_surf)
-                    img_array = np.transpose(img_array, (1, 0, 2))  # Поворачиваем массив
-                    self.images.append(img_array)
-
-                print(f"Загружено изображение: {os.path.basename(path)}")
-                return True
-            else:
-                print(f"Файл не найден: {path}")
-                return False
-        except Exception as e:
-            print(f"Ошибка загрузки {path}: {e}")
-            return False
-
     def load_images(self):
         """
-        Загружает все доступные изображения
+        Подключает все доступные изображения через общий кэш: файлы декодируются
+        лениво при первом выборе, а не все сразу при старте
         """
-
-        # Пробуем загрузить изображения из списка
-        loaded_count = 0
-        for path in self.image_list:
-            if self.load_single_image(path):
-                loaded_count += 1
-
-        # Если не удалось загрузить изображения, создаем тестовые
-        if loaded_count == 0:
+        self.image_cache = ImageCache(self.image_list, (self.thumb_width, self.thumb_height))
+        self.image_surfaces = self.image_cache.thumbnails
+        self.images = self.image_cache.arrays
+
+        # Если не нашлось ни одного изображения, создаем тестовые
+        if len(self.image_cache) == 0:
+            self.image_surfaces = []
+            self.images = []
             print("Не найдены файлы изображений, создаем тестовые изображения")
             test_colors = [(255, 100, 100), (100, 255, 100), (100, 100, 255), (255, 255, 100)]
             for i, color in enumerate(test_colors):
@@ -156,6 +132,7 @@ class ImagesLoader:
     def change_selected_image_index(self, changer):
         mod = len(self.image_surfaces)
         self.selected_image_index = (mod + self.selected_image_index + changer) % mod
+        self.prefetcher.request(self.selected_image_index, mod)
 
     def get_image(self):
         return self.image_surfaces[self.selected_image_index]
@@ -191,48 +168,6 @@ def terminate():
     sys.exit()
 
 
-def rgb2hsv(rgb):
-    r, g, b = rgb[...,0], rgb[...,1], rgb[...,2]
-
-    maxc = np.max(rgb, axis=-1)
-    minc = np.min(rgb, axis=-1)
-    Δc = (maxc - minc)
-
-    h = np.zeros_like(maxc)
-    s = Δc / maxc
-    v = maxc
-
-    rmask = (maxc == r)
-    gmask = (maxc == g)
-    bmask = (maxc == b)
-
-    rc = (maxc - r) / Δc
-    gc = (maxc - g) / Δc
-    bc = (maxc - b) / Δc
-
-    h[rmask] = bc[rmask] - gc[rmask] + 6
-    h[gmask] = rc[gmask] - bc[gmask] + 2
-    h[bmask] = gc[bmask] - rc[bmask] + 4
-    h = (h / 6.0) % 1.0
-
-    return np.stack([h, s, v], axis=-1)
-
-
-def hsv2rgb(hsv):
-    h, s, v = hsv[...,0], hsv[...,1], hsv[...,2]
-    i = np.floor(h * 6).astype(int)  # номер сектора
-    f = h * 6 - i  # дробная часть сектора
-    p = v * (1 - s)  # V_min минимальное значение канала
-    q = v * (1 - f * s)  # V_dec  промежуточное значение 
-    t = v * (1 - (1 - f) * s)  # V_inc промежуточное значение, но в другую сторону
-    rgb = np.zeros_like(hsv)
-
-    rgb[...,0] = np.choose(i % 6, [v, q, p, p, t, v])
-    rgb[...,1] = np.choose(i % 6, [t, v, v, q, p, p])
-    rgb[...,2] = np.choose(i % 6, [p, p, t, v, v, q])
-    return rgb
-
-
 class HsvServiceVariation:
     def __init__(self):
         self.images_loager = ImagesLoader()
@@ -250,13 +185,13 @@ class HsvServiceVariation:
         self.s_slider = Slider('S', -0.5, 0.5, 650, 350)
         self.v_slider = Slider('V', -0.5, 0.5, 650, 400)
 
-        self.surf = pg.surfarray.make_surface(np.transpose(self.rgb, (1,0,2)).swapaxes(0,1))
+        self.surf = pg.Surface(self.image.get_size())
 
     def init_image(self):
         self.image = self.images_loager.get_image()
         # self.image = pg.image.load(image_path).convert()
         self.rgb = pg.surfarray.array3d(self.image).astype(np.float32) / 255.0
-        self.hsv = rgb2hsv(self.rgb)
+        self.adjuster = HsvAdjuster(self.rgb)
         self.h_shift = 0.0
         self.s_shift = 0.0
         self.v_shift = 0.0
@@ -265,12 +200,12 @@ class HsvServiceVariation:
     def draw(self):
         x, y = self.position
 
-        hsv = self.hsv.copy()
-        hsv[...,0] = (hsv[...,0] + self.h_shift) % 1.0
-        hsv[...,1] = np.clip(hsv[...,1] + self.s_shift, 0, 1)
-        hsv[...,2] = np.clip(hsv[...,2] + self.v_shift, 0, 1)
-        rgb = (hsv2rgb(hsv) * 255).astype(np.uint8)
-        self.surf = pg.surfarray.make_surface(np.transpose(rgb, (1,0,2)).swapaxes(0,1))
+        # Пересчет и копирование в surface - только когда сдвинули ползунок или сменили картинку
+        shifts = (self.h_shift, self.s_shift, self.v_shift)
+        if shifts != self.adjuster.shifts:
+            if self.surf.get_size() != self.image.get_size():
+                self.surf = pg.Surface(self.image.get_size())
+            pg.surfarray.blit_array(self.surf, self.adjuster.apply(*shifts))
 
         screen.blit(self.surf, (x, y))
 
@@ -307,6 +242,7 @@ class Slider:
 
         self.pos = (x, y)
         self.dragging = False
+        self.font = pg.font.SysFont(None, 24)  # создаем один раз, а не на каждом кадре
 
     def draw(self):
         x, y = self.pos
@@ -314,8 +250,7 @@ class Slider:
         pg.draw.rect(screen, (100, 100, 100), (x, y, 200, 10))
         pos = int((self.value - self.min_value) / (self.max_value - self.min_value) * 200)
         pg.draw.rect(screen, (200, 200, 50), (x + pos - 5, y - 5, 10, 20))
-        font = pg.font.SysFont(None, 24)
-        text = font.render(f"{self.label}: {self.value:.2f}", True, (255,255,255))
+        text = self.font.render(f"{self.label}: {self.value:.2f}", True, (255,255,255))
         screen.blit(text, (x, y - 25))
         # if self.dragging:
         #     print(x + pos - 5, y - 5)
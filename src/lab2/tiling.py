@@ -0,0 +1,116 @@
+"""
+Обработка изображений больше памяти: по полосам строк из файла, отображенного в память.
+
+    python tiling.py input.npy output.npy --ops gray1 hsv:0.5,0,0 --budget-mb 64
+    python tiling.py input.raw output.raw --shape 40000x60000x3 --ops diff
+
+Источник и результат - np.memmap (.npy с заголовком или сырой uint8 с известной
+формой), поэтому в памяти одновременно только одна полоса и ее промежуточные
+массивы. Цепочка операций применяется к полосе целиком, прежде чем та будет
+записана, - так промежуточные результаты тоже размером с полосу, а не с кадр.
+Полосы, а не квадратные плитки: в файле строки лежат подряд, и чтение полосы -
+один последовательный кусок.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Общий пакет загрузки изображений лежит в src/imaging
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from image_ops import is_pointwise
+
+DEFAULT_BUDGET = 64 * 2 ** 20  # байт на полосу вместе с промежуточными массивами
+WORK_BYTES_PER_VALUE = 32  # запас на временные float64-массивы внутри операций
+
+
+def open_image(path, shape=None, dtype=np.uint8):
+    """Изображение (H, W, C) с диска без чтения в память: .npy или сырой файл формы shape."""
+    if path.endswith('.npy'):
+        return np.load(path, mmap_mode='r')
+    if shape is None:
+        raise ValueError(f"Для сырого файла нужна форма (H, W, C): {path}")
+    return np.memmap(path, dtype=dtype, mode='r', shape=tuple(shape))
+
+
+def create_image(path, shape, dtype=np.uint8):
+    """Создает файл результата формы shape, отображенный в память для записи."""
+    if path.endswith('.npy'):
+        return np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=tuple(shape))
+    return np.memmap(path, dtype=dtype, mode='w+', shape=tuple(shape))
+
+
+def strip_rows(shape, memory_budget=DEFAULT_BUDGET):
+    """Сколько строк изображения shape помещается в бюджет памяти вместе с промежуточными массивами."""
+    row_values = int(np.prod(shape[1:]))
+    return max(1, memory_budget // (row_values * WORK_BYTES_PER_VALUE))
+
+
+def apply_chain(strip, operations):
+    for operation in operations:
+        strip = operation(strip)
+    return strip
+
+
+def process_strips(src, dst, operations, rows=None, memory_budget=DEFAULT_BUDGET, progress=None):
+    """
+    Применяет цепочку попиксельных операций к src полосами по rows строк и пишет в dst.
+
+    src и dst - массивы (H, W, C) одной высоты, обычно np.memmap. Операции без
+    пометки @pointwise не допускаются: их результат на полосе зависел бы от соседних
+    строк. progress(done_rows, height) вызывается после каждой полосы.
+    """
+    for operation in operations:
+        if not is_pointwise(operation):
+            raise ValueError(f"Операция не попиксельная, обработка полосами невозможна: {operation}")
+    if src.shape[0] != dst.shape[0]:
+        raise ValueError(f"Разная высота источника и результата: {src.shape} и {dst.shape}")
+
+    height = src.shape[0]
+    rows = rows or strip_rows(src.shape, memory_budget)
+    for y in range(0, height, rows):
+        dst[y:y + rows] = apply_chain(np.asarray(src[y:y + rows]), operations)
+        if progress is not None:
+            progress(min(y + rows, height), height)
+    if isinstance(dst, np.memmap):
+        dst.flush()
+
+
+def process_file(src_path, dst_path, operations, shape=None, memory_budget=DEFAULT_BUDGET, progress=None):
+    """
+    Обрабатывает файл изображения полосами и пишет результат в dst_path.
+    Форма и тип результата определяются пробным прогоном цепочки на одной строке.
+    """
+    src = open_image(src_path, shape)
+    probe = apply_chain(np.asarray(src[:1]), operations)
+    dst = create_image(dst_path, (src.shape[0],) + probe.shape[1:], probe.dtype)
+    process_strips(src, dst, operations, memory_budget=memory_budget, progress=progress)
+    return dst
+
+
+if __name__ == '__main__':
+    from batch import OPERATIONS, operation_function, parse_operation
+
+    parser = argparse.ArgumentParser(description='Обработка большого изображения полосами (.npy или сырой uint8)')
+    parser.add_argument('input')
+    parser.add_argument('output')
+    parser.add_argument('--ops', nargs='+', type=parse_operation, required=True,
+                        help='цепочка операций: ' + ', '.join(OPERATIONS))
+    parser.add_argument('--shape', default=None, help='HxWxC для сырого файла')
+    parser.add_argument('--budget-mb', type=float, default=DEFAULT_BUDGET / 2 ** 20)
+    args = parser.parse_args()
+
+    shape = tuple(map(int, args.shape.split('x'))) if args.shape else None
+    operations = [operation_function(name, op_args) for name, op_args in args.ops]
+
+    def report(done, total):
+        print(f"\rСтрок {done}/{total}", end='', flush=True)
+
+    start = time.perf_counter()
+    result = process_file(args.input, args.output, operations, shape, int(args.budget_mb * 2 ** 20), report)
+    elapsed = time.perf_counter() - start
+    size = os.path.getsize(args.input) / 2 ** 20
+    print(f"\nГотово: {result.shape} за {elapsed:.1f} с ({size / elapsed:.1f} МБ/с)")
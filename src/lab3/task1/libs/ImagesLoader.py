@@ -5,6 +5,11 @@ import os  # просто будь собой бро
 import sys  # просто будь собой бро
 from Button import *
 
+# Общий пакет загрузки изображений лежит в src/imaging
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from imaging.image_cache import ImageCache, list_images
+from imaging.prefetch import Prefetcher
+
 
 class ImagesLoader:
     def __init__(self, screen, assets_path="../../../assets"):
@@ -12,12 +17,8 @@ class ImagesLoader:
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         assets_dir = os.path.join(base_dir, assets_path)
 
-        # Получаем список всех файлов в папке assets
-        self.image_list = [
-            os.path.join(assets_dir, filename)
-            for filename in os.listdir(assets_dir)
-            if filename.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp'))  # Фильтруем только изображения
-        ]
+        # Получаем список всех файлов в папке assets (без декодирования)
+        self.image_list = list_images(assets_dir)
         # self.image_list = [
         #     os.path.join(base_dir, "assets", "house1.jpg"),
         #     os.path.join(base_dir, "assets", "house2.jpg"),
@@ -34,6 +35,11 @@ class ImagesLoader:
 
         self.selected_image_index = 0
 
+        # Соседние миниатюры декодируются заранее в фоновом потоке
+        self.prefetcher = Prefetcher(lambda index, cancelled: self.image_surfaces[index])
+        self.prefetcher.start()
+        self.prefetcher.request(self.selected_image_index, len(self.image_surfaces))
+
 
         # Цвета
         self.colors = {
@@ -70,51 +76,19 @@ class ImagesLoader:
             )
         self.have_changed = False
 
-    def load_single_image(self, path):
-        """
-        Загружает одно изображение
-        """
-        try:
-            if os.path.exists(path):
-                img_surf = pg.image.load(path).convert()
-                scaled_img_surf = pg.transform.scale(
-                    img_surf,
-                    (self.thumb_width, self.thumb_height)
-                )
-                self.image_surfaces.append(scaled_img_surf)
-
-                # Загружаем как numpy array для гистограммы
-                try:
-                    img_array = plt.imread(path)
-                    self.images.append(img_array)
-                except:
-                    # Если plt.imread не работает, создаем массив из pg surface
-                    img_array = pg.surfarray.array3d(scaled_img_surf)
-                    img_array = np.transpose(img_array, (1, 0, 2))  # Поворачиваем массив
-                    self.images.append(img_array)
-
-                print(f"Загружено изображение: {os.path.basename(path)}")
-                return True
-            else:
-                print(f"Файл не найден: {path}")
-                return False
-        except Exception as e:
-            print(f"Ошибка загрузки {path}: {e}")
-            return False
-
     def load_images(self):
         """
-        Загружает все доступные изображения
+        Подключает все доступные изображения через общий кэш: файлы декодируются
+        лениво при первом выборе, а не все сразу при старте
         """
-
-        # Пробуем загрузить изображения из списка
-        loaded_count = 0
-        for path in self.image_list:
-            if self.load_single_image(path):
-                loaded_count += 1
-
-        # Если не удалось загрузить изображения, создаем тестовые
-        if loaded_count == 0:
+        self.image_cache = ImageCache(self.image_list, (self.thumb_width, self.thumb_height))
+        self.image_surfaces = self.image_cache.thumbnails
+        self.images = self.image_cache.arrays
+
+        # Если не нашлось ни одного изображения, создаем тестовые
+        if len(self.image_cache) == 0:
+            self.image_surfaces = []
+            self.images = []
             print("Не найдены файлы изображений, создаем тестовые изображения")
             test_colors = [(255, 100, 100), (100, 255, 100), (100, 100, 255), (255, 255, 100)]
             for i, color in enumerate(test_colors):
@@ -158,6 +132,7 @@ class ImagesLoader:
     def change_selected_image_index(self, changer):
         mod = len(self.image_surfaces)
         self.selected_image_index = (mod + self.selected_image_index + changer) % mod
+        self.prefetcher.request(self.selected_image_index, mod)
 
     def get_image(self):
         return self.image_surfaces[self.selected_image_index]
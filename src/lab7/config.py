@@ -1,28 +0,0 @@
-# Цвета
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-RED = (255, 0, 0)
-GREEN = (0, 255, 0)
-BLUE = (0, 0, 255)
-YELLOW = (255, 255, 0)
-CYAN = (0, 255, 255)
-GRAY = (200, 200, 200)
-ORANGE = (255, 165, 0)
-
-# Геометрические параметры
-POINT_RADIUS = 5
-VERTEX_RADIUS = 4
-LINE_WIDTH = 2
-
-# Параметры камеры
-# Аксиометрическая
-ANGLE = 45
-#Перспективная
-V_POINT = 400
-FOCUS = 1.0
-ASPECT_RATIO = 1.0
-FAR = 250
-NEAR = 0.5
-
-# Параметры obj
-OBJ_SCALE = 300.0
\ No newline at end of file
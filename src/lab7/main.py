@@ -1,17 +1,35 @@
-import pygame
-from primitives import *
-from create_test_models import *
-from datetime import datetime
-from object_IO import *
-from D3Renderer import *
-from camera import *
 import os
+import sys
 import math
-from plot import Plot
-from rotation_shape import * # <-- НОВЫЙ ИМПОРТ
+import pygame
+from datetime import datetime
+
+# Общий пакет рендера лежит в src/engine3d
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from engine3d import config
+from engine3d.primitives import *
+from engine3d.create_test_models import *
+from engine3d.object_IO import *
+from engine3d.D3Renderer import *
+from engine3d.camera import *
+from engine3d.plot import Plot
+from engine3d.rotation_shape import *
 
 FULLSCREEN = False
 
+# Начальное положение камеры lab7; стрелки без Shift двигают сцену
+CAMERA_START = (800, 800, -1000)
+
+
+def draw_object(screen, obj: Object, method: str):
+    """Контуры всех полигонов (без отсечения невидимых граней) и отмеченные вершины, как в lab6."""
+    draw_wireframe(screen, obj, method, config.BLUE)
+    xy, valid = render_points(obj.vertex_array(), method)
+    for x, y in xy[valid].astype(int).tolist():
+        pygame.draw.circle(screen, config.RED, (x, y), config.VERTEX_RADIUS)
+
+
 def app():
     current_file_path = os.path.abspath(__file__)
     current_dir = os.path.dirname(current_file_path)
@@ -21,6 +39,9 @@ def app():
         os.makedirs(models_dir)
 
 
+    camera.x, camera.y, camera.z = CAMERA_START
+    camera.invert_pan = True
+
     pygame.init()
 
     screen = pygame.display.set_mode((1400, 900)) # Рекомендую задать фиксированный размер для удобства верстки UI
@@ -56,7 +77,6 @@ def app():
     dropdown_bounds_renders = Rectangle(220, 20, 230, 35)
 
     main_object: Optional[Object] = objects[current_object].create()
-    rendered_object = render_object(main_object, renders[current_render], window_info)
 
     last_object = -1
     last_render = -1
@@ -190,10 +210,7 @@ def app():
 
         screen.fill(ui_background_color)
 
-        rendered_object = render_object(main_object, renders[current_render], window_info)
-        if rendered_object:
-            for rp in rendered_object:
-                rp.draw(screen)
+        draw_object(screen, main_object, renders[current_render])
 
         # Выпадающий список объектов
         if button(screen, font, dropdown_bounds_objects, objects[current_object].name) and button_clicked:
@@ -219,7 +236,6 @@ def app():
 
         if current_object != last_object:
             main_object = objects[current_object].create()
-            rendered_object = render_object(main_object, renders[current_render], window_info)
             last_object = current_object
 
         # Выпадающий список типов рендера
@@ -245,7 +261,6 @@ def app():
                 button_cnt += 1
 
         if current_render != last_render:
-            rendered_object = render_object(main_object, renders[current_render], window_info)
             last_render = current_render
 
         # Отображение центра объекта
@@ -291,7 +306,6 @@ def app():
 
                 # 5. Загружаем этот файл как основной объект
                 main_object = load_obj(temp_plot_filename)
-                rendered_object = render_object(main_object, renders[current_render], window_info)
 
             except Exception as e:
                 print(f"Ошибка при построении графика: {e}")
@@ -322,7 +336,6 @@ def app():
 
                 # 4. Устанавливаем его как основной объект
                 main_object = rot_shape_object
-                rendered_object = render_object(main_object, renders[current_render], window_info)
 
             except Exception as e:
                 print(f"Ошибка при построении фигуры вращения: {e}")
@@ -355,7 +368,6 @@ def app():
                 dy = float(input_boxes["translation_y"])
                 dz = float(input_boxes["translation_z"])
                 main_object.apply_transformation(translation_matrix(dx, dy, dz))
-                rendered_object = render_object(main_object, renders[current_render], window_info)
             except ValueError:
                 pass
             button_clicked = False
@@ -366,7 +378,6 @@ def app():
                 sy = float(input_boxes["scale_y"])
                 sz = float(input_boxes["scale_z"])
                 scale_relative_to_center(main_object, sx, sy, sz)
-                rendered_object = render_object(main_object, renders[current_render], window_info)
             except ValueError:
                 pass
             button_clicked = False
@@ -375,7 +386,6 @@ def app():
             try:
                 angle = np.radians(float(input_boxes["rotation_angle"]) / 2)
                 rotate_around_center(main_object, 'X', angle)
-                rendered_object = render_object(main_object, renders[current_render], window_info)
             except ValueError:
                 pass
             button_clicked = False
@@ -384,7 +394,6 @@ def app():
             try:
                 angle = np.radians(float(input_boxes["rotation_angle"]) / 2)
                 rotate_around_center(main_object, 'Y', angle)
-                rendered_object = render_object(main_object, renders[current_render], window_info)
             except ValueError:
                 pass
             button_clicked = False
@@ -393,24 +402,20 @@ def app():
             try:
                 angle = np.radians(float(input_boxes["rotation_angle"]) / 2)
                 rotate_around_center(main_object, 'Z', angle)
-                rendered_object = render_object(main_object, renders[current_render], window_info)
             except ValueError:
                 pass
             button_clicked = False
 
         if button(screen, font, transform_buttons[5], "Отражение XY") and button_clicked:
             main_object.apply_transformation(reflection_xy_matrix())
-            rendered_object = render_object(main_object, renders[current_render], window_info)
             button_clicked = False
 
         if button(screen, font, transform_buttons[6], "Отражение XZ") and button_clicked:
             main_object.apply_transformation(reflection_xz_matrix())
-            rendered_object = render_object(main_object, renders[current_render], window_info)
             button_clicked = False
 
         if button(screen, font, transform_buttons[7], "Отражение YZ") and button_clicked:
             main_object.apply_transformation(reflection_yz_matrix())
-            rendered_object = render_object(main_object, renders[current_render], window_info)
             button_clicked = False
 
         if button(screen, font, transform_buttons[8], "Поворот вокруг прямой") and button_clicked:
@@ -424,14 +429,12 @@ def app():
                     p1 = Point(p1_coords[0], p1_coords[1], p1_coords[2])
                     p2 = Point(p2_coords[0], p2_coords[1], p2_coords[2])
                     rotate_around_line(main_object, p1, p2, angle)
-                    rendered_object = render_object(main_object, renders[current_render], window_info)
             except ValueError:
                 pass
             button_clicked = False
 
         if button(screen, font, transform_buttons[9], "Сброс") and button_clicked:
             main_object = objects[current_object].create()
-            rendered_object = render_object(main_object, renders[current_render], window_info)
             button_clicked = False
 
         # Кнопки файловых операций
@@ -440,7 +443,6 @@ def app():
             file_path = os.path.join(models_dir, filename)
             try:
                 main_object = load_obj(file_path)
-                rendered_object = render_object(main_object, renders[current_render], window_info)
                 print(f"Файл {filename} загружен.")
             except:
                 print(f"Не удалось загрузить файл {filename}")
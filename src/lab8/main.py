@@ -1,14 +1,21 @@
-import pygame
-from primitives import *
-from create_test_models import *
-from datetime import datetime
-from object_IO import *
-from D3Renderer import *
-from camera import *
 import os
+import sys
 import math
-from plot import Plot
-from rotation_shape import *
+import multiprocessing
+import pygame
+from datetime import datetime
+
+# Общий пакет рендера лежит в src/engine3d
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from engine3d.primitives import *
+from engine3d.create_test_models import *
+from engine3d.object_IO import *
+from engine3d.D3Renderer import *
+from engine3d.camera import *
+from engine3d.plot import Plot
+from engine3d.rotation_shape import *
+from engine3d.render_thread import RenderThread, SceneSnapshot
 
 FULLSCREEN = False
 
@@ -49,7 +56,7 @@ def app():
 
     dropdown_bounds_objects = Rectangle(20, 20, 180, 35)
 
-    renders = ["Аксонометрическая", "Перспективная"]
+    renders = ["Аксонометрическая", "Перспективная", "Z-буфер"]
     renders_count = len(renders)
     current_render = 0
     show_dropdown_renders = False
@@ -58,6 +65,13 @@ def app():
     main_object: Optional[Object] = objects[current_object].create()
     rendered_object = render_object(main_object, renders[current_render], window_info)
 
+    # Z-буфер считается в отдельном потоке; цикл UI показывает последний готовый кадр
+    render_thread = RenderThread()
+    render_thread.start()
+    last_snapshot: Optional[SceneSnapshot] = None
+    frame_surface: Optional[pygame.Surface] = None
+    frame_version = 0
+
     last_object = -1
     last_render = -1
 
@@ -148,8 +162,22 @@ def app():
     # ===== НОВЫЕ ПЕРЕМЕННЫЕ И КНОПКА ДЛЯ ВРАЩЕНИЯ =====
     auto_rotate = True
     auto_rotate_button = Rectangle(470, 20, 200, 35)
+
+    # Сглаживание (SSAA): количество выборок по каждой оси
+    antialias_options = [1, 2, 4]
+    current_antialias = 0
+    antialias_button = Rectangle(690, 20, 200, 35)
+
+    # Каркасный режим: только рёбра, без заливки и сортировки полигонов
+    wireframe = False
+    wireframe_button = Rectangle(910, 20, 180, 35)
     # ===================================================
 
+    # Загрузка моделей идёт в отдельном процессе, чтобы не блокировать цикл UI
+    load_executor: Optional[ProcessPoolExecutor] = None
+    load_future = None
+    loading_filename = ""
+
     running = True
     clock = pygame.time.Clock()
     button_clicked = False
@@ -179,6 +207,20 @@ def app():
                             active_input = key
                             break
 
+        # ===== ЗАВЕРШЕНИЕ ФОНОВОЙ ЗАГРУЗКИ =====
+        if load_future is not None and load_future.done():
+            try:
+                loaded_mesh = load_future.result()
+                if len(loaded_mesh):
+                    main_object = loaded_mesh.to_object()
+                    print(f"Файл {loading_filename} загружен.")
+                else:
+                    print(f"Не удалось загрузить файл {loading_filename}")
+            except Exception as e:
+                print(f"Не удалось загрузить файл {loading_filename}: {e}")
+            load_future = None
+        # ========================================
+
         # ===== АВТОМАТИЧЕСКОЕ ВРАЩЕНИЕ =====
         if auto_rotate and main_object:
             rotate_around_center(main_object, 'Y', np.radians(0.7))
@@ -188,10 +230,33 @@ def app():
         camera.update()
         screen.fill(ui_background_color)
 
-        rendered_object = render_object(main_object, renders[current_render], window_info)
-        if rendered_object:
-            for rp in rendered_object:
-                rp.draw(screen)
+        if renders[current_render] == "Z-буфер":
+            width, height = screen.get_size()
+            view, projection = perspective_camera_matrices(width, height)
+            snapshot = SceneSnapshot.from_object(main_object, view, projection, width, height,
+                                                 background=ui_background_color,
+                                                 samples=antialias_options[current_antialias])
+            if not snapshot.matches(last_snapshot):
+                render_thread.submit(snapshot)
+                last_snapshot = snapshot
+            frame, version, complete = render_thread.latest()
+            if version != frame_version and frame is not None:
+                # Поверхность кадра создаётся один раз на готовый кадр, а не на каждой итерации цикла
+                frame_surface = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
+                frame_version = version
+            if frame_surface is not None:
+                screen.blit(frame_surface, (0, 0))
+            render_error = render_thread.error()
+            if render_error is not None:
+                screen.blit(small_font.render(f"Ошибка рендера: {render_error}", True, (200, 0, 0)), (470, 65))
+            elif not complete:
+                screen.blit(small_font.render("Уточнение кадра...", True, (0, 0, 0)), (470, 65))
+        elif wireframe:
+            draw_wireframe(screen, main_object, renders[current_render])
+        else:
+            rendered_object = render_object(main_object, renders[current_render], window_info)
+            if rendered_object:
+                draw_projected(screen, rendered_object, antialias_options[current_antialias])
 
         # ===== UI-ЭЛЕМЕНТЫ =====
 
@@ -201,6 +266,19 @@ def app():
             auto_rotate = not auto_rotate
             button_clicked = False
 
+        # Кнопка переключения сглаживания
+        samples = antialias_options[current_antialias]
+        antialias_btn_text = f"Сглаживание: x{samples}" if samples > 1 else "Сглаживание: ВЫКЛ"
+        if button(screen, font, antialias_button, antialias_btn_text) and button_clicked:
+            current_antialias = (current_antialias + 1) % len(antialias_options)
+            button_clicked = False
+
+        # Кнопка переключения каркасного режима
+        wireframe_btn_text = "Каркас: ВКЛ" if wireframe else "Каркас: ВЫКЛ"
+        if button(screen, font, wireframe_button, wireframe_btn_text) and button_clicked:
+            wireframe = not wireframe
+            button_clicked = False
+
         # Выпадающий список объектов
         if button(screen, font, dropdown_bounds_objects, objects[current_object].name) and button_clicked:
             show_dropdown_objects = not show_dropdown_objects
@@ -297,7 +375,7 @@ def app():
                 profile_str = input_boxes["rot_shape_profile"]
                 iterations = int(input_boxes["rot_shape_iterations"])
                 dots = get_dots_from_string(profile_str)
-                rot_shape_object = create_solid_of_revolution(dots, iterations)
+                rot_shape_object = create_solid_of_revolution(dots, iterations, weld=True)
                 main_object = rot_shape_object
             except Exception as e:
                 print(f"Ошибка при построении фигуры вращения: {e}")
@@ -394,15 +472,25 @@ def app():
 
         # Кнопки файловых операций
         if button(screen, font, file_buttons[0], "Загрузить OBJ") and button_clicked:
-            filename = input_boxes["filename"] + '.obj'
+            filename = input_boxes["filename"]
+            if not os.path.splitext(filename)[1]:
+                filename += '.obj'
             file_path = os.path.join(models_dir, filename)
-            try:
-                main_object = load_obj(file_path)
-                print(f"Файл {filename} загружен.")
-            except:
-                print(f"Не удалось загрузить файл {filename}")
+            # .obj и бинарные MESH_EXT читаются в фоновом процессе (load_mesh различает их сам);
+            # в цикле UI остается только сборка объекта из готовых массивов
+            if load_future is None:
+                loading_filename = filename
+                if load_executor is None:
+                    # spawn, а не fork: поток рендера уже запущен, и форк мог бы унаследовать
+                    # захваченные им блокировки
+                    load_executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+                load_future = load_executor.submit(load_mesh, file_path, True)
             button_clicked = False
 
+        if load_future is not None:
+            loading_text = small_font.render(f"Загрузка {loading_filename}...", True, (0, 0, 0))
+            screen.blit(loading_text, (180, window_info.height - 142))
+
         if button(screen, font, file_buttons[1], "Сохранить OBJ") and button_clicked:
             filename = f"saved_model_{datetime.now().strftime('%H_%M_%S')}.obj"
             file_path = os.path.join(models_dir, filename)
@@ -416,6 +504,9 @@ def app():
         pygame.display.flip()
         clock.tick(60)
 
+    if load_executor is not None:
+        load_executor.shutdown(wait=False, cancel_futures=True)
+    render_thread.stop()
     pygame.quit()
 
 